@@ -1,3 +1,3 @@
-from .bivariate import bivariate_numeric_categorical_analysis
-from .univariate import univariate_numeric_analysis, univariate_categorical_analysis, univariate_timeseries_analysis
+from .bivariate import bivariate_numeric_categorical_analysis, bivariate_numeric_numeric_analysis, bivariate_categorical_categorical_analysis, mutual_information_screening
+from .univariate import univariate_numeric_analysis, univariate_categorical_analysis, univariate_timeseries_analysis, batch_univariate_timeseries_analysis, incremental_univariate_timeseries_analysis
 from .core import explore_data
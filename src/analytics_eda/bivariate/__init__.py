@@ -1 +1,4 @@
 from .bivariate_numeric_categorical import bivariate_numeric_categorical_analysis
+from .bivariate_numeric_numeric import bivariate_numeric_numeric_analysis, numeric_correlation_matrices, CoMomentAccumulator
+from .bivariate_categorical_categorical import bivariate_categorical_categorical_analysis, categorical_association_matrices
+from .mutual_information import mutual_information_screening
@@ -0,0 +1,4 @@
+from .bivariate_categorical_categorical_analysis import bivariate_categorical_categorical_analysis
+from .categorical_association_matrices import categorical_association_matrices
+from .categorical_association import categorical_association, mutual_information
+from .contingency_table import contingency_table
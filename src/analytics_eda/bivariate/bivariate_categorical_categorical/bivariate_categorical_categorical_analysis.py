@@ -0,0 +1,170 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+import logging
+import uuid
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import seaborn as sns
+from pandas.api.types import is_object_dtype
+
+from ...core import write_json_report
+from ...core.categorical.validate_categorical_named_series import is_string_like_dtype
+from .categorical_association_matrices import categorical_association_matrices
+
+logger = logging.getLogger(__name__)
+
+def bivariate_categorical_categorical_analysis(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    report_root: str = 'reports/eda/bivariate/categorical_categorical',
+    report_log_id = str(uuid.uuid4()),
+    alpha: float = 0.05,
+    top_pairs: int = 20,
+    n_jobs: int = 1,
+    sparse_threshold: int = 1_000_000
+) -> Path:
+    """
+    Association analysis across all pairs of categorical columns.
+
+    For every pair: chi-square test of independence, Cramér's V and Theil's U in
+    both directions, computed from bincount contingency tables over factorized codes
+    (see `categorical_association_matrices`). Also reports the strongest pairs by
+    Cramér's V and saves Cramér's V and Theil's U heatmaps.
+
+    Args:
+        df (pd.DataFrame): The dataset.
+        columns (list[str] | None): Categorical columns to analyze. All 'category',
+            'object' and string columns if None.
+        report_root (str): Root directory for saving reports.
+        report_log_id (str): report log id.
+        alpha (float): Significance level for the chi-square tests.
+        top_pairs (int): Number of strongest pairs reported.
+        n_jobs (int): Worker processes for the pairs (1 runs in-process, -1 uses all CPUs).
+        sparse_threshold (int): Largest contingency table (cells) built densely;
+            larger tables only count observed combinations.
+
+    Returns:
+        Path: File path to the saved JSON report as written by `write_json_report`.
+
+    Report structure:
+        - metadata # Report metadata
+        - eda report with cardinalities, per-pair results, strongest pairs and
+          Cramér's V / Theil's U matrices and heatmaps.
+
+    Raises:
+        KeyError: If a requested column is missing.
+        TypeError: If a requested column is not categorical.
+        ValueError: If fewer than two columns are analyzed.
+    """
+    if columns is None:
+        columns = [col for col in df.columns if _is_categorical(df[col])]
+    for col in columns:
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found.")
+        if not _is_categorical(df[col]):
+            raise TypeError(f"Column '{col}' must be categorical or object.")
+    if len(columns) < 2:
+        raise ValueError("At least two categorical columns are required.")
+
+    logger.info(
+        "Starting bivariate_categorical_categorical_analysis",
+        extra={
+            'report_root': report_root,
+            'report_log_id': report_log_id
+        }
+    )
+
+    report_dir = Path(report_root)
+    report_dir.mkdir(parents=True, exist_ok=True)
+
+    associations = categorical_association_matrices(df, columns, n_jobs=n_jobs, sparse_threshold=sparse_threshold)
+
+    pairs = associations['pairs']
+    for pair in pairs:
+        pair['reject'] = bool(pair['p_value'] < alpha) if pair['p_value'] is not None else None
+
+    strength = np.array([
+        pair['cramers_v'] if pair['cramers_v'] is not None else -1.0 for pair in pairs
+    ])
+    strongest = [pairs[k] for k in np.argsort(-strength, kind='stable')[:top_pairs] if strength[k] >= 0]
+
+    eda_report = {
+        'cardinality': associations['cardinality'],
+        'pairs': pairs,
+        'strongest_pairs': strongest,
+        'cramers_v': associations['cramers_v'].to_dict(),
+        'theils_u': associations['theils_u'].to_dict(),
+        'visualizations': {
+            'cramers_v_heatmap': str(_plot_heatmap(associations['cramers_v'], "Cramér's V", report_dir / "cramers_v_heatmap.png")),
+            'theils_u_heatmap': str(_plot_heatmap(associations['theils_u'], "Theil's U (row given column)", report_dir / "theils_u_heatmap.png"))
+        }
+    }
+
+    full_report = {
+        'metadata': {
+            'version': '0.1.0',
+            'report_name': 'bivariate_categorical_categorical_analysis',
+            'parameters': {
+                'columns': list(columns),
+                'alpha': alpha
+            }
+        },
+        'eda': eda_report
+    }
+
+    report_path = report_dir / "categorical_categorical_bivariate_analysis_report.json"
+    write_json_report(full_report, report_path)
+
+    logger.info(
+        "Completed bivariate_categorical_categorical_analysis",
+        extra={
+            'report_log_id': report_log_id,
+            'report_path': str(report_path)
+        }
+    )
+
+    return report_path
+
+
+def _is_categorical(series: pd.Series) -> bool:
+    return (
+        isinstance(series.dtype, pd.CategoricalDtype)
+        or is_object_dtype(series)
+        or is_string_like_dtype(series.dtype)
+    )
+
+
+def _plot_heatmap(matrix: pd.DataFrame, title: str, plot_path: Path) -> Path:
+    size = min(4 + 0.3 * len(matrix), 30)
+    fig, ax = plt.subplots(figsize=(size, size * 0.8))
+    sns.heatmap(
+        matrix,
+        vmin=0,
+        vmax=1,
+        cmap='viridis',
+        annot=len(matrix) <= 15,
+        fmt='.2f',
+        square=True,
+        ax=ax
+    )
+    ax.set_title(title, fontsize=14, weight='bold')
+    plt.tight_layout()
+    try:
+        fig.savefig(plot_path)
+    finally:
+        plt.close(fig)
+    return plot_path
@@ -0,0 +1,118 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from scipy import sparse
+from scipy.stats import chi2
+
+
+def categorical_association(table: np.ndarray | sparse.spmatrix) -> dict:
+    """
+    Chi-square test of independence, Cramér's V and Theil's U from a contingency table.
+
+    All measures are computed from the non-zero cells and the row and column totals
+    only, so dense and sparse tables take the same vectorized path. Empty rows and
+    columns (unobserved categories) are ignored.
+
+    Args:
+        table (np.ndarray | scipy.sparse.spmatrix): (k_a x k_b) table of counts.
+
+    Returns:
+        dict: {
+            'n_obs': int,
+            'chi2': float, 'dof': int, 'p_value': float,
+            'cramers_v': float,
+            'theils_u_a_given_b': float,  # uncertainty coefficient U(A|B)
+            'theils_u_b_given_a': float   # uncertainty coefficient U(B|A)
+        }
+        Undefined measures (e.g. a single observed category) are None.
+    """
+    if sparse.issparse(table):
+        coo = sparse.coo_matrix(table)
+        rows, cols, observed = coo.row, coo.col, coo.data.astype(float)
+        row_totals = np.asarray(table.sum(axis=1)).ravel().astype(float)
+        col_totals = np.asarray(table.sum(axis=0)).ravel().astype(float)
+    else:
+        table = np.asarray(table)
+        rows, cols = np.nonzero(table)
+        observed = table[rows, cols].astype(float)
+        row_totals = table.sum(axis=1).astype(float)
+        col_totals = table.sum(axis=0).astype(float)
+
+    keep = observed > 0
+    rows, cols, observed = rows[keep], cols[keep], observed[keep]
+    n = observed.sum()
+    r = int(np.count_nonzero(row_totals))
+    c = int(np.count_nonzero(col_totals))
+
+    result = {
+        'n_obs': int(n),
+        'chi2': None,
+        'dof': max((r - 1) * (c - 1), 0),
+        'p_value': None,
+        'cramers_v': None,
+        'theils_u_a_given_b': None,
+        'theils_u_b_given_a': None
+    }
+    if n == 0 or r < 2 or c < 2:
+        return result
+
+    # chi2 = sum (O - E)^2 / E = N * sum O^2 / (row * col) - N, over non-zero cells only
+    statistic = n * np.sum(observed ** 2 / (row_totals[rows] * col_totals[cols])) - n
+    statistic = max(float(statistic), 0.0)
+    result['chi2'] = statistic
+    result['p_value'] = float(chi2.sf(statistic, result['dof']))
+    result['cramers_v'] = float(np.sqrt(statistic / n / min(r - 1, c - 1)))
+
+    mutual_information, h_a, h_b = _mutual_information(observed, row_totals, col_totals)
+    result['theils_u_a_given_b'] = float(mutual_information / h_a) if h_a > 0 else None
+    result['theils_u_b_given_a'] = float(mutual_information / h_b) if h_b > 0 else None
+    return result
+
+
+def mutual_information(table: np.ndarray | sparse.spmatrix) -> tuple[float, float, float]:
+    """
+    Mutual information (in nats) of the two variables of a contingency table.
+
+    Args:
+        table (np.ndarray | scipy.sparse.spmatrix): (k_a x k_b) table of counts.
+
+    Returns:
+        tuple[float, float, float]: (I(A; B), H(A), H(B)), all 0.0 for an empty table.
+    """
+    if sparse.issparse(table):
+        observed = sparse.coo_matrix(table).data.astype(float)
+        row_totals = np.asarray(table.sum(axis=1)).ravel().astype(float)
+        col_totals = np.asarray(table.sum(axis=0)).ravel().astype(float)
+    else:
+        table = np.asarray(table)
+        observed = table[table > 0].astype(float)
+        row_totals = table.sum(axis=1).astype(float)
+        col_totals = table.sum(axis=0).astype(float)
+    if observed.sum() == 0:
+        return 0.0, 0.0, 0.0
+    return _mutual_information(observed, row_totals, col_totals)
+
+
+def _mutual_information(observed: np.ndarray, row_totals: np.ndarray, col_totals: np.ndarray) -> tuple[float, float, float]:
+    # Entropies from the marginal and joint distributions
+    n = observed.sum()
+    h_a = _entropy(row_totals / n)
+    h_b = _entropy(col_totals / n)
+    h_ab = _entropy(observed / n)
+    return max(h_a + h_b - h_ab, 0.0), h_a, h_b
+
+
+def _entropy(p: np.ndarray) -> float:
+    p = p[p > 0]
+    return float(-np.sum(p * np.log(p)))
@@ -0,0 +1,115 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from .contingency_table import contingency_table
+from .categorical_association import categorical_association
+
+# Codes shared with pool workers once, through the pool initializer
+_worker_codes: np.ndarray | None = None
+_worker_cardinalities: np.ndarray | None = None
+
+
+def categorical_association_matrices(
+    df: pd.DataFrame,
+    columns: list[str],
+    n_jobs: int = 1,
+    sparse_threshold: int = 1_000_000
+) -> dict:
+    """
+    Association measures for every pair of categorical columns.
+
+    Every column is factorized once into integer codes; each pair's contingency
+    table is then one `np.bincount` over combined codes (`contingency_table`, sparse
+    for large cardinality products), from which `categorical_association` derives
+    chi-square, Cramér's V and Theil's U. With `n_jobs != 1` pairs run in a process
+    pool; the code matrix is sent to each worker once, tasks are column indices.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        columns (list[str]): Categorical columns.
+        n_jobs (int): Worker processes (1 runs in-process, -1 uses all CPUs).
+        sparse_threshold (int): Largest contingency table (cells) built densely.
+
+    Returns:
+        dict: {
+            'cardinality': {column: int},
+            'pairs': list[dict],             # one `categorical_association` result per pair,
+                                             # with 'column_a' and 'column_b'
+            'cramers_v': pd.DataFrame,       # symmetric, 1 on the diagonal
+            'theils_u': pd.DataFrame,        # U(row | column), 1 on the diagonal
+            'p_value': pd.DataFrame          # chi-square p-values
+        }
+    """
+    codes = np.empty((len(df), len(columns)), dtype=np.int64)
+    cardinalities = np.empty(len(columns), dtype=np.int64)
+    for i, col in enumerate(columns):
+        col_codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+        codes[:, i] = col_codes
+        cardinalities[i] = len(uniques)
+
+    pairs = [(i, j) for i in range(len(columns)) for j in range(i + 1, len(columns))]
+
+    if n_jobs == 1 or len(pairs) <= 1:
+        _init_worker(codes, cardinalities)
+        try:
+            results = [_pair_association(i, j, sparse_threshold) for i, j in pairs]
+        finally:
+            _init_worker(None, None)
+    else:
+        max_workers = None if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(codes, cardinalities)) as executor:
+            futures = [executor.submit(_pair_association, i, j, sparse_threshold) for i, j in pairs]
+            results = [future.result() for future in futures]
+
+    p = len(columns)
+    cramers_v = np.eye(p)
+    theils_u = np.eye(p)
+    p_value = np.zeros((p, p))
+    pair_reports = []
+    for (i, j), result in zip(pairs, results):
+        cramers_v[i, j] = cramers_v[j, i] = _nan_if_none(result['cramers_v'])
+        theils_u[i, j] = _nan_if_none(result['theils_u_a_given_b'])
+        theils_u[j, i] = _nan_if_none(result['theils_u_b_given_a'])
+        p_value[i, j] = p_value[j, i] = _nan_if_none(result['p_value'])
+        pair_reports.append({'column_a': columns[i], 'column_b': columns[j], **result})
+
+    return {
+        'cardinality': dict(zip(columns, cardinalities.tolist())),
+        'pairs': pair_reports,
+        'cramers_v': pd.DataFrame(cramers_v, index=columns, columns=columns),
+        'theils_u': pd.DataFrame(theils_u, index=columns, columns=columns),
+        'p_value': pd.DataFrame(p_value, index=columns, columns=columns)
+    }
+
+
+def _init_worker(codes: np.ndarray | None, cardinalities: np.ndarray | None) -> None:
+    global _worker_codes, _worker_cardinalities
+    _worker_codes = codes
+    _worker_cardinalities = cardinalities
+
+
+def _pair_association(i: int, j: int, sparse_threshold: int) -> dict:
+    table = contingency_table(
+        _worker_codes[:, i], int(_worker_cardinalities[i]),
+        _worker_codes[:, j], int(_worker_cardinalities[j]),
+        sparse_threshold=sparse_threshold
+    )
+    return categorical_association(table)
+
+
+def _nan_if_none(value) -> float:
+    return np.nan if value is None else value
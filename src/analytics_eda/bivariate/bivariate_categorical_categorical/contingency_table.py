@@ -0,0 +1,51 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from scipy import sparse
+
+
+def contingency_table(
+    codes_a: np.ndarray,
+    k_a: int,
+    codes_b: np.ndarray,
+    k_b: int,
+    sparse_threshold: int = 1_000_000
+) -> np.ndarray | sparse.csr_matrix:
+    """
+    Contingency table of two factorized categorical columns.
+
+    Each row is mapped to the cell `code_a * k_b + code_b` and counted with one
+    `np.bincount`. When `k_a * k_b` exceeds `sparse_threshold`, only the observed
+    cells are counted (`np.unique` on the cell ids) and a sparse matrix is returned,
+    so memory follows the number of observed combinations rather than the product
+    of the cardinalities. Rows where either code is missing (-1) are dropped.
+
+    Args:
+        codes_a (np.ndarray): Codes of the first column (-1 for missing).
+        k_a (int): Number of categories of the first column.
+        codes_b (np.ndarray): Codes of the second column (-1 for missing).
+        k_b (int): Number of categories of the second column.
+        sparse_threshold (int): Largest number of cells built densely.
+
+    Returns:
+        np.ndarray | scipy.sparse.csr_matrix: (k_a x k_b) table of counts.
+    """
+    both = (codes_a >= 0) & (codes_b >= 0)
+    cells = codes_a[both].astype(np.int64) * k_b + codes_b[both]
+
+    if k_a * k_b <= sparse_threshold:
+        return np.bincount(cells, minlength=k_a * k_b).reshape(k_a, k_b)
+
+    observed, counts = np.unique(cells, return_counts=True)
+    return sparse.csr_matrix((counts, (observed // k_b, observed % k_b)), shape=(k_a, k_b))
@@ -0,0 +1,49 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from scipy.stats import chi2
+
+from .one_way_anova_from_moments import group_moments
+
+
+def bartlett_from_moments(counts, sums, sum_squares, centered: bool = False) -> tuple[float, float]:
+    """
+    Bartlett's test for equal variances from per-group sufficient statistics.
+
+    Equivalent to `scipy.stats.bartlett(*groups)` but only needs each group's
+    count, sum and sum of squares.
+
+    Args:
+        counts (array-like): Number of observations per group.
+        sums (array-like): Sum of the observations per group.
+        sum_squares (array-like): Sum of squared observations per group (or the
+            centered sum of squares if `centered` is True).
+        centered (bool): Whether `sum_squares` is already centered.
+
+    Returns:
+        tuple[float, float]: (statistic, p-value).
+    """
+    n, _, m2 = group_moments(counts, sums, sum_squares, centered)
+    k = len(n)
+    n_total = n.sum()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variances = m2 / (n - 1)
+        pooled = np.sum(m2) / (n_total - k)
+        numer = (n_total - k) * np.log(pooled) - np.sum((n - 1) * np.log(variances))
+        denom = 1 + (np.sum(1 / (n - 1)) - 1 / (n_total - k)) / (3 * (k - 1))
+        statistic = numer / denom
+
+    p_value = chi2.sf(statistic, k - 1)
+    return float(np.clip(statistic, 0.0, np.inf)), float(p_value)
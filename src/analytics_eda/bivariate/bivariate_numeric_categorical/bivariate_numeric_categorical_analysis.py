@@ -11,10 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import logging
 import uuid
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_numeric_dtype, is_object_dtype
 
@@ -24,12 +26,19 @@ from .bivariate_numeric_categorical_tests import bivariate_numeric_categorical_t
 
 logger = logging.getLogger(__name__)
 
+# Key of the segment pooling the categories beyond `max_segments`
+OTHER_SEGMENT = '__other__'
+
 def bivariate_numeric_categorical_analysis(
     df: pd.DataFrame,
     numeric_col: str,
     categorical_col: str,
     report_root: str = 'reports/eda/bivariate/numeric_categorical',
     report_log_id = str(uuid.uuid4()),
+    posthoc_significant_only: bool = False,
+    posthoc_top_k: int | None = None,
+    n_jobs: int = 1,
+    max_segments: int | None = None,
     **kwargs
 ) -> str:
     """
@@ -41,11 +50,22 @@ def bivariate_numeric_categorical_analysis(
         categorical_col (str): Column to segment by.
         report_root (str): Root directory for saving reports.
         report_log_id (str): report log id.
+        posthoc_significant_only (bool): Report only significant post-hoc pairs.
+        posthoc_top_k (int | None): Report only the top-k post-hoc pairs by effect size.
+        n_jobs (int): Number of worker processes for the per-segment analyses
+            (1 runs them in-process, -1 uses all CPUs). Each worker receives only
+            the numeric values of its segment.
+        max_segments (int | None): If set, analyze only the `max_segments` largest
+            segments and pool all remaining rows into a single '__other__' segment;
+            the pooled categories are listed under 'pooled_segments'.
         **kwargs: Additional arguments passed to univariate_numeric_analysis (e.g., alpha, iqr_multiplier).
     
     Returns:
      str: File path to the saved JSON report as written by `write_json_report`.
 
+    Raises:
+        ValueError: If a kept category is itself named '__other__'.
+
     Report structure:
         - metadata # Report metadata
         - eda report with statistical test results and per-segment univariate reports.
@@ -73,48 +93,58 @@ def bivariate_numeric_categorical_analysis(
     report_dir = Path(report_root) / f"{numeric_col}_by_{categorical_col}"
     report_dir.mkdir(parents=True, exist_ok=True)
 
-    statistical_tests = bivariate_numeric_categorical_tests(df, numeric_col, categorical_col, report_log_id=report_log_id)
+    statistical_tests = bivariate_numeric_categorical_tests(
+        df, numeric_col, categorical_col,
+        report_log_id=report_log_id,
+        posthoc_significant_only=posthoc_significant_only,
+        posthoc_top_k=posthoc_top_k
+    )
+
+    segments, pooled = _segment_series(df, numeric_col, categorical_col, max_segments)
 
     segment_reports = {}
-    for segment_value, group_df in df.groupby(categorical_col, observed=True):
-        segment_name = str(segment_value).replace(" ", "_")
-        segment_report_root = report_dir / f"{categorical_col}_{segment_name}"
-        logger.debug("Running univariate analysis for segment",
-                extra={
-                    'segment': segment_value,
-                    'numeric_col': numeric_col,
-                    'categorical_col': categorical_col,
-                    'report_log_id': report_log_id
-                })
-
-        try:
-            report = univariate_numeric_analysis(
-                group_df[numeric_col],
-                report_root=segment_report_root,
-                report_log_id=report_log_id,
-                **kwargs
-            )
-            segment_reports[segment_value] = report
-        except Exception as e:
-            # NOTE: If a segment analysis fails we still want to continue with the remaining segements.
-            logger.exception(
-                "univariate_numeric_analysis failed", 
-                extra={
-                    'segment': segment_value,
-                    'numeric_col': numeric_col,
-                    'categorical_col': categorical_col,
-                    'report_log_id': report_log_id
-                }
+    if n_jobs == 1 or len(segments) <= 1:
+        for segment_value, values in segments:
+            _log_segment(segment_value, numeric_col, categorical_col, report_log_id)
+            segment_reports[segment_value] = _segment_report(
+                values, segment_value, report_dir, numeric_col, categorical_col, report_log_id, kwargs
             )
-            segment_reports[segment_value] = {
-                'error': str(e),
-                'report_log_id': report_log_id
-            }
+    else:
+        max_workers = None if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for segment_value, values in segments:
+                _log_segment(segment_value, numeric_col, categorical_col, report_log_id)
+                futures[segment_value] = executor.submit(
+                    _segment_report,
+                    values, segment_value, report_dir, numeric_col, categorical_col, report_log_id, kwargs
+                )
+
+            for segment_value, future in futures.items():
+                try:
+                    segment_reports[segment_value] = future.result()
+                except Exception as e:
+                    # The worker itself failed (e.g. it was killed); keep the remaining segments.
+                    logger.exception(
+                        "univariate_numeric_analysis failed", 
+                        extra={
+                            'segment': segment_value,
+                            'numeric_col': numeric_col,
+                            'categorical_col': categorical_col,
+                            'report_log_id': report_log_id
+                        }
+                    )
+                    segment_reports[segment_value] = {
+                        'error': str(e),
+                        'report_log_id': report_log_id
+                    }
 
     eda_report = {
         'statistical_tests': statistical_tests,
         'segments_report': segment_reports
     }
+    if pooled:
+        eda_report['pooled_segments'] = pooled
 
     full_report = {
         'metadata': {
@@ -142,3 +172,95 @@ def bivariate_numeric_categorical_analysis(
     )
 
     return report_path
+
+
+def _segment_series(
+    df: pd.DataFrame,
+    numeric_col: str,
+    categorical_col: str,
+    max_segments: int | None
+) -> tuple[list[tuple[object, pd.Series]], list[str]]:
+    """
+    Split the numeric column by segment with one factorize and one stable sort.
+
+    Only the numeric values (with their index) of each segment are kept, so workers
+    receive a single Series each, never the DataFrame. With `max_segments`, the
+    largest segments are kept and all remaining rows are pooled under
+    `OTHER_SEGMENT`, a key no real category is expected to use; the pooled
+    categories are returned alongside (empty if nothing was pooled).
+    """
+    codes, labels = pd.factorize(df[categorical_col], sort=True, use_na_sentinel=True)
+    numeric = df[numeric_col]
+
+    keep = codes >= 0
+    order = np.flatnonzero(keep)[np.argsort(codes[keep], kind='stable')]
+    counts = np.bincount(codes[keep], minlength=len(labels))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    ordered = numeric.iloc[order]
+
+    segments = [
+        (labels[i], ordered.iloc[offsets[i]:offsets[i + 1]])
+        for i in range(len(labels))
+    ]
+
+    pooled = []
+    if max_segments is not None and len(segments) > max_segments:
+        by_size = np.argsort(-counts, kind='stable')
+        top = np.sort(by_size[:max_segments])
+        rest = np.sort(by_size[max_segments:])
+        if any(str(segments[i][0]) == OTHER_SEGMENT for i in top):
+            raise ValueError(f"Category '{OTHER_SEGMENT}' in '{categorical_col}' is reserved for pooled segments.")
+        other = pd.concat([segments[i][1] for i in rest])
+        pooled = [str(segments[i][0]) for i in rest]
+        segments = [segments[i] for i in top] + [(OTHER_SEGMENT, other)]
+
+    return segments, pooled
+
+
+def _log_segment(segment_value, numeric_col: str, categorical_col: str, report_log_id: str) -> None:
+    logger.debug("Running univariate analysis for segment",
+            extra={
+                'segment': segment_value,
+                'numeric_col': numeric_col,
+                'categorical_col': categorical_col,
+                'report_log_id': report_log_id
+            })
+
+
+def _segment_report(
+    values: pd.Series,
+    segment_value,
+    report_dir: Path,
+    numeric_col: str,
+    categorical_col: str,
+    report_log_id: str,
+    kwargs: dict
+):
+    """
+    Run `univariate_numeric_analysis` on one segment (in-process or in a worker).
+    """
+    segment_name = str(segment_value).replace(" ", "_")
+    segment_report_root = report_dir / f"{categorical_col}_{segment_name}"
+
+    try:
+        return univariate_numeric_analysis(
+            values,
+            report_root=segment_report_root,
+            report_log_id=report_log_id,
+            **kwargs
+        )
+    except Exception as e:
+        # NOTE: If a segment analysis fails we still want to continue with the remaining segements.
+        logger.exception(
+            "univariate_numeric_analysis failed", 
+            extra={
+                'segment': segment_value,
+                'numeric_col': numeric_col,
+                'categorical_col': categorical_col,
+                'report_log_id': report_log_id
+            }
+        )
+        return {
+            'error': str(e),
+            'report_log_id': report_log_id
+        }
@@ -15,11 +15,17 @@
 import logging
 import uuid
 
+import numpy as np
 import pandas as pd
-from statsmodels.stats.multicomp import pairwise_tukeyhsd
-from scipy.stats import bartlett, f_oneway, kruskal, levene
+from scipy.stats import levene
 
 from .compute_overlap_metrics import compute_overlap_metrics
+from .group_segments import GroupSegments
+from .one_way_anova_from_moments import one_way_anova_from_moments
+from .bartlett_from_moments import bartlett_from_moments
+from .kruskal_wallis_from_ranks import kruskal_wallis_from_ranks
+from .dunn_test_from_ranks import dunn_test_from_ranks
+from .tukey_hsd_from_moments import tukey_hsd_from_moments
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +34,17 @@ def bivariate_numeric_categorical_tests(
         numeric_col: str,
         categorical_col: str,
         alpha: float = 0.05,
-        report_log_id: str = str(uuid.uuid4())) -> dict:
+        report_log_id: str = str(uuid.uuid4()),
+        posthoc_significant_only: bool = False,
+        posthoc_top_k: int | None = None) -> dict:
     """
     Perform a comprehensive numeric-vs-categorical bivariate analysis.
 
+    The categorical column is factorized and the numeric column sorted by group once
+    (`GroupSegments`); every test reads contiguous per-group views of that buffer,
+    Bartlett's test and ANOVA are computed from per-group sufficient statistics only,
+    and the pooled data is ranked once for both Kruskal–Wallis and Dunn's test.
+
     Steps:
       1. Compute metadata:
          - Number of groups
@@ -47,6 +60,7 @@ def bivariate_numeric_categorical_tests(
          - Kruskal–Wallis (non-parametric)
       5. Post-hoc pairwise comparisons:
          - Tukey’s HSD (if ANOVA is significant)
+         - Dunn's test, Bonferroni-adjusted (if Kruskal–Wallis is significant)
       6. Effect size estimation:
          - Eta-squared (η²)
          - Omega-squared (ω²)
@@ -58,6 +72,11 @@ def bivariate_numeric_categorical_tests(
         categorical_col: Name of the categorical column defining groups.
         alpha: Significance level for all hypothesis tests (default: 0.05).
         report_log_id (str): report log id.
+        posthoc_significant_only: Report only significant pairs in the post-hoc tests
+            (default: False).
+        posthoc_top_k: Report only the top-k pairs by absolute mean (rank) difference
+            in the post-hoc tests (default: None, all pairs). Useful for categoricals
+            with many levels, where the number of pairs grows quadratically.
 
     Returns:
         A dict with keys:
@@ -72,8 +91,10 @@ def bivariate_numeric_categorical_tests(
           - 'bartlett': {statistic, p_value, reject} or {'error': str}
           - 'levene': {statistic, p_value, reject} or {'error': str}
           - 'anova': {statistic, p_value, reject} or {'error': str}
-          - 'tukey_hsd': {'pairs': list[dict]} or {'error': str}
+          - 'tukey_hsd': {'pairs': list[dict], 'n_pairs': int} or {'error': str}
           - 'kruskal': {statistic, p_value, reject} or {'error': str}
+          - 'dunn': {'pairs': list[dict], 'n_pairs': int} or {'error': str}
+            (`n_pairs` is the number of pairs compared, before any filtering)
           - 'effect_size': {
                 'eta_squared': float,
                 'omega_squared': float,
@@ -95,16 +116,14 @@ def bivariate_numeric_categorical_tests(
     if categorical_col not in df.columns:
         raise KeyError(f"Categorical column '{categorical_col}' not found.")
 
-    grouped = [
-        group[numeric_col].dropna().values
-        for _, group in df.groupby(categorical_col, observed=True)
-    ]
+    segments = GroupSegments.from_frame(df, numeric_col, categorical_col)
+    grouped = segments.groups()
     results = {}
 
     if len(grouped) < 2:
         return {"error": "Not enough groups to perform statistical tests."}
 
-    group_sizes = [len(g) for g in grouped]
+    group_sizes = segments.counts.tolist()
     results['meta'] = {
         'n_groups': len(grouped),
         'group_sizes': group_sizes
@@ -112,11 +131,7 @@ def bivariate_numeric_categorical_tests(
 
     # Distribution Overlap
     try:
-        grouped_dict = {
-            str(label): group[numeric_col].dropna().values
-            for label, group in df.groupby(categorical_col, observed=True)
-        }
-        results['distribution_overlap'] = compute_overlap_metrics(grouped_dict)
+        results['distribution_overlap'] = compute_overlap_metrics(dict(segments.items()))
     except Exception as e:
         logger.exception(
                 "bivariate_numeric_categorical_tests failed", 
@@ -135,7 +150,9 @@ def bivariate_numeric_categorical_tests(
 
     # Bartlett’s Test (parametric, assumes normality)
     try:
-        bart_stat, bart_p = bartlett(*grouped)
+        bart_stat, bart_p = bartlett_from_moments(
+            segments.counts, segments.sums, segments.sum_squares, centered=True
+        )
         results['bartlett'] = {
             'statistic': float(bart_stat),
             'p_value': float(bart_p),
@@ -178,7 +195,9 @@ def bivariate_numeric_categorical_tests(
 
     # ANOVA (parametric)
     try:
-        anova_stat, anova_p = f_oneway(*grouped)
+        anova_stat, anova_p = one_way_anova_from_moments(
+            segments.counts, segments.sums, segments.sum_squares, centered=True
+        )
         results['anova'] = {
             'statistic': float(anova_stat),
             'p_value': float(anova_p),
@@ -188,18 +207,17 @@ def bivariate_numeric_categorical_tests(
         # Post-hoc Tukey’s HSD (only if ANOVA significant)
         if anova_p < alpha:
             try:
-                tukey = pairwise_tukeyhsd(
-                    endog=df[numeric_col],
-                    groups=df[categorical_col],
-                    alpha=alpha
-                )
-                # Convert summary to dict or DataFrame
-                tukey_df = pd.DataFrame(
-                    tukey.summary().data[1:],
-                    columns=tukey.summary().data[0]
+                tukey = tukey_hsd_from_moments(
+                    segments.counts, segments.sums, segments.sum_squares, segments.labels,
+                    alpha=alpha,
+                    centered=True,
+                    significant_only=posthoc_significant_only,
+                    top_k=posthoc_top_k
                 )
+                n_pairs = tukey.pop('n_pairs')
                 results['tukey_hsd'] = {
-                    'pairs': tukey_df.to_dict(orient='records')
+                    'pairs': pd.DataFrame(tukey).to_dict(orient='records'),
+                    'n_pairs': n_pairs
                 }
             except Exception as e:
                 logger.exception(
@@ -229,13 +247,42 @@ def bivariate_numeric_categorical_tests(
         }
 
     # Kruskal-Wallis (non-parametric)
+    kruskal_stat = None
     try:
-        kruskal_stat, kruskal_p = kruskal(*grouped)
+        ranks, tie_sum = segments.ranks()
+        kruskal_stat, kruskal_p = kruskal_wallis_from_ranks(ranks, segments.codes, segments.n_groups, tie_sum)
         results['kruskal'] = {
             'statistic': float(kruskal_stat),
             'p_value': float(kruskal_p),
             'reject': bool(kruskal_p < alpha)
         }
+
+        # Post-hoc Dunn's test (only if Kruskal-Wallis significant), reusing the ranks
+        if kruskal_p < alpha:
+            try:
+                dunn = dunn_test_from_ranks(
+                    ranks, segments.codes, segments.labels, tie_sum, alpha,
+                    significant_only=posthoc_significant_only,
+                    top_k=posthoc_top_k
+                )
+                n_pairs = dunn.pop('n_pairs')
+                results['dunn'] = {
+                    'pairs': pd.DataFrame(dunn).to_dict(orient='records'),
+                    'n_pairs': n_pairs
+                }
+            except Exception as e:
+                logger.exception(
+                    "bivariate_numeric_categorical_tests failed", 
+                    extra={
+                        'numeric_col': numeric_col,
+                        'categorical_col': categorical_col,
+                        'report_log_id': report_log_id
+                    }
+                )
+                results['dunn'] = {
+                    'error': str(e),
+                    'report_log_id': report_log_id
+                }
     except Exception as e:
         logger.exception(
             "bivariate_numeric_categorical_tests failed", 
@@ -252,20 +299,17 @@ def bivariate_numeric_categorical_tests(
 
     # Effect Size Estimation
 
-    # Flattened series for total SS
-    all_values = df[numeric_col].dropna()
-    grand_mean = all_values.mean()
-    ss_total = ((all_values - grand_mean) ** 2).sum()
-
-    # SS_between by looping over grouped + their means
-    ss_between = sum(
-    len(g) * (g.mean() - grand_mean) ** 2
-    for g in grouped
-    )
-    ss_within = ss_total - ss_between
+    # Sums of squares from the per-group sums (no pass over groups in Python)
+    nonempty = segments.counts > 0
+    N = int(segments.counts.sum())
+    grand_mean = segments.sums.sum() / N
+    ss_between = float(np.sum(
+        segments.counts[nonempty] * (segments.means[nonempty] - grand_mean) ** 2
+    ))
+    ss_within = float(segments.sum_squares.sum())
+    ss_total = ss_between + ss_within
 
-    k = len(grouped)
-    N = len(all_values)
+    k = segments.n_groups
     ms_within = ss_within / (N - k)
 
     eta2   = ss_between / ss_total if ss_total > 0 else None
@@ -274,7 +318,7 @@ def bivariate_numeric_categorical_tests(
     (ss_total + ms_within)
     ) if ss_total + ms_within > 0 else None
 
-    eps2 = (kruskal_stat - k + 1) / (N - k) if N > k else None
+    eps2 = (kruskal_stat - k + 1) / (N - k) if N > k and kruskal_stat is not None else None
 
     results['effect_size'] = {
         'eta_squared':   eta2,
@@ -0,0 +1,117 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Iterator
+import numpy as np
+import pandas as pd
+
+from .kruskal_wallis_from_ranks import rank_with_ties
+
+
+class GroupSegments:
+    """
+    Numeric values segmented by a categorical column, built with one factorize and one sort.
+
+    The categorical column is factorized once and the numeric values are stably sorted
+    by group code into a single contiguous buffer. Each group is then a slice
+    `values[offsets[i]:offsets[i + 1]]` (a view, not a copy), and per-group sums,
+    means and sums of squares come from `np.bincount` over the codes.
+
+    Rows with a missing group label or a missing numeric value are dropped. Groups
+    follow `groupby(..., observed=True)` order: category order for a `category`
+    dtype, sorted labels otherwise.
+
+    Args:
+        values (pd.Series | np.ndarray): Numeric values.
+        groups (pd.Series | np.ndarray): Group labels, aligned with `values`.
+
+    Attributes:
+        labels (np.ndarray): Group labels, one per group.
+        values (np.ndarray): Non-missing numeric values sorted by group.
+        codes (np.ndarray): Group code of each entry of `values` (non-decreasing).
+        counts (np.ndarray): Number of values per group.
+        offsets (np.ndarray): Start of each group in `values`; length `n_groups + 1`.
+        sums (np.ndarray): Sum of values per group.
+        means (np.ndarray): Mean per group (NaN for empty groups).
+        sum_squares (np.ndarray): Within-group sum of squared deviations from the group mean.
+    """
+
+    def __init__(self, values: pd.Series | np.ndarray, groups: pd.Series | np.ndarray):
+        codes, labels = pd.factorize(groups, sort=True, use_na_sentinel=True)
+        values = np.asarray(values, dtype=float)
+        if len(values) != len(codes):
+            raise ValueError("'values' and 'groups' must have the same length.")
+
+        valid = (codes >= 0) & ~np.isnan(values)
+        codes = codes[valid]
+        values = values[valid]
+
+        order = np.argsort(codes, kind='stable')
+        self.codes = codes[order]
+        self.values = values[order]
+        self.labels = np.asarray(labels)
+
+        k = len(self.labels)
+        self.counts = np.bincount(self.codes, minlength=k)
+        self.offsets = np.concatenate(([0], np.cumsum(self.counts)))
+
+        self.sums = np.bincount(self.codes, weights=self.values, minlength=k)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.means = self.sums / self.counts
+        deviations = self.values - self.means[self.codes]
+        self.sum_squares = np.bincount(self.codes, weights=deviations * deviations, minlength=k)
+        self._ranks = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, numeric_col: str, categorical_col: str) -> "GroupSegments":
+        """
+        Segment `df[numeric_col]` by `df[categorical_col]`.
+        """
+        return cls(df[numeric_col].to_numpy(), df[categorical_col])
+
+    @property
+    def n_groups(self) -> int:
+        return len(self.labels)
+
+    def __len__(self) -> int:
+        return self.n_groups
+
+    def ranks(self) -> tuple[np.ndarray, float]:
+        """
+        Pooled ranks of `values` and their tie term (see `rank_with_ties`).
+
+        Computed on first use with a single argsort and cached, so Kruskal–Wallis
+        and Dunn's test share one ranking.
+        """
+        if self._ranks is None:
+            self._ranks = rank_with_ties(self.values)
+        return self._ranks
+
+    def group(self, i: int) -> np.ndarray:
+        """
+        Values of the i-th group (a view into `values`).
+        """
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def groups(self) -> list[np.ndarray]:
+        """
+        Values of every group, in group order.
+        """
+        return [self.group(i) for i in range(self.n_groups)]
+
+    def items(self) -> Iterator[tuple[str, np.ndarray]]:
+        """
+        Iterate over (label as str, values) pairs.
+        """
+        for i, label in enumerate(self.labels):
+            yield str(label), self.group(i)
@@ -0,0 +1,83 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from scipy.stats import chi2
+
+
+def rank_with_ties(values: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Average ranks (1-based) of `values` from a single stable argsort.
+
+    Args:
+        values (np.ndarray): 1-D array without missing values.
+
+    Returns:
+        tuple:
+            ranks (np.ndarray[float]): Rank of each value; tied values share their average rank.
+            tie_sum (float): Sum of `t**3 - t` over all runs of `t` tied values, used by
+                the tie corrections of Kruskal–Wallis and Dunn's test.
+    """
+    values = np.asarray(values)
+    n = len(values)
+    order = np.argsort(values, kind='stable')
+    sorted_values = values[order]
+
+    starts = np.flatnonzero(np.concatenate(([True], sorted_values[1:] != sorted_values[:-1])))
+    ties = np.diff(np.append(starts, n))
+
+    ranks = np.empty(n, dtype=float)
+    ranks[order] = np.repeat(starts + (ties + 1) / 2.0, ties)
+
+    ties = ties.astype(float)
+    return ranks, float(np.sum(ties ** 3 - ties))
+
+
+def kruskal_wallis_from_ranks(
+    ranks: np.ndarray,
+    codes: np.ndarray,
+    n_groups: int,
+    tie_sum: float = 0.0
+) -> tuple[float, float]:
+    """
+    Kruskal–Wallis H-test from precomputed ranks of the pooled data.
+
+    Per-group rank sums come from one `np.bincount` over the group codes, so the
+    pooled data is ranked once (see `rank_with_ties`) and the same ranks can be
+    reused by Dunn's post-hoc test. Equivalent to `scipy.stats.kruskal(*groups)`.
+
+    Args:
+        ranks (np.ndarray): Rank of each observation in the pooled data.
+        codes (np.ndarray): Group code (0 .. n_groups - 1) of each observation.
+        n_groups (int): Number of groups.
+        tie_sum (float): Sum of `t**3 - t` over runs of ties (from `rank_with_ties`).
+
+    Returns:
+        tuple[float, float]: (H statistic, p-value).
+
+    Raises:
+        ValueError: If fewer than two groups are given.
+    """
+    if n_groups < 2:
+        raise ValueError("At least two groups are required.")
+
+    n = np.bincount(codes, minlength=n_groups).astype(float)
+    rank_sums = np.bincount(codes, weights=ranks, minlength=n_groups)
+    n_total = n.sum()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        h = 12.0 / (n_total * (n_total + 1)) * np.sum(rank_sums ** 2 / n) - 3 * (n_total + 1)
+        h /= 1 - tie_sum / (n_total ** 3 - n_total)
+
+    p_value = chi2.sf(h, n_groups - 1)
+    return float(h), float(p_value)
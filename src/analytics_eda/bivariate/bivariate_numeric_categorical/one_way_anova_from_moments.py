@@ -0,0 +1,81 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from scipy.stats import f as f_dist
+
+
+def group_moments(counts, sums, sum_squares, centered: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert per-group sufficient statistics into (n, mean, centered sum of squares).
+
+    Args:
+        counts (array-like): Number of observations per group.
+        sums (array-like): Sum of the observations per group.
+        sum_squares (array-like): Sum of squared observations per group, or, if
+            `centered` is True, sum of squared deviations from the group mean.
+        centered (bool): Whether `sum_squares` is already centered.
+
+    Returns:
+        tuple: (n, mean, m2) as float arrays.
+
+    Raises:
+        ValueError: If fewer than two groups are given or the inputs differ in length.
+    """
+    n = np.asarray(counts, dtype=float)
+    sums = np.asarray(sums, dtype=float)
+    sum_squares = np.asarray(sum_squares, dtype=float)
+    if not n.shape == sums.shape == sum_squares.shape or n.ndim != 1:
+        raise ValueError("counts, sums and sum_squares must be 1-D arrays of the same length.")
+    if len(n) < 2:
+        raise ValueError("At least two groups are required.")
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sums / n
+        m2 = sum_squares if centered else sum_squares - sums * mean
+    # Rounding in the raw-moment form can leave tiny negative values.
+    return n, mean, np.maximum(m2, 0.0)
+
+
+def one_way_anova_from_moments(counts, sums, sum_squares, centered: bool = False) -> tuple[float, float]:
+    """
+    One-way ANOVA F-test from per-group sufficient statistics.
+
+    Equivalent to `scipy.stats.f_oneway(*groups)` but only needs each group's
+    count, sum and sum of squares, so it can be fed from chunked or distributed
+    accumulators without materialising the groups.
+
+    Args:
+        counts (array-like): Number of observations per group.
+        sums (array-like): Sum of the observations per group.
+        sum_squares (array-like): Sum of squared observations per group (or the
+            centered sum of squares if `centered` is True).
+        centered (bool): Whether `sum_squares` is already centered.
+
+    Returns:
+        tuple[float, float]: (F statistic, p-value).
+    """
+    n, mean, m2 = group_moments(counts, sums, sum_squares, centered)
+    k = len(n)
+    n_total = n.sum()
+    grand_mean = np.sum(n * mean) / n_total
+
+    ss_between = np.sum(n * (mean - grand_mean) ** 2)
+    ss_within = np.sum(m2)
+    df_between = k - 1
+    df_within = n_total - k
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        statistic = (ss_between / df_between) / (ss_within / df_within)
+    p_value = f_dist.sf(statistic, df_between, df_within)
+    return float(statistic), float(p_value)
@@ -0,0 +1,111 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+from scipy.stats import studentized_range
+
+from .one_way_anova_from_moments import group_moments
+
+
+def tukey_hsd_from_moments(
+    counts,
+    sums,
+    sum_squares,
+    labels,
+    alpha: float = 0.05,
+    centered: bool = False,
+    significant_only: bool = False,
+    top_k: int | None = None,
+    max_exact_pvalues: int = 256
+) -> dict[str, np.ndarray]:
+    """
+    Tukey's HSD (Tukey–Kramer for unequal group sizes) from per-group sufficient statistics.
+
+    All pairwise mean differences, standard errors, studentized-range statistics and
+    confidence intervals are computed as NumPy arrays over the upper triangle of the
+    group pairs; no per-pair Python objects or text tables are built. Matches
+    `statsmodels.stats.multicomp.pairwise_tukeyhsd`.
+
+    Studentized-range p-values are the expensive part (one numerical integration
+    each), so they are only computed for the reported pairs. When more than
+    `max_exact_pvalues` pairs are reported, p-values are interpolated (monotone,
+    in log space) from exact values on a grid of statistics.
+
+    Args:
+        counts (array-like): Number of observations per group.
+        sums (array-like): Sum of the observations per group.
+        sum_squares (array-like): Sum of squared observations per group (or the
+            centered sum of squares if `centered` is True).
+        labels (array-like): Group labels.
+        alpha (float): Family-wise significance level.
+        centered (bool): Whether `sum_squares` is already centered.
+        significant_only (bool): Report only pairs whose difference is significant.
+        top_k (int | None): Report only the `top_k` pairs with the largest absolute
+            mean difference (applied after `significant_only`).
+        max_exact_pvalues (int): Largest number of reported pairs whose p-values are
+            computed exactly.
+
+    Returns:
+        dict: Arrays with one entry per reported pair (in upper-triangle order, or by
+            decreasing absolute mean difference if `top_k` is set):
+            'group1', 'group2', 'meandiff' (mean2 - mean1), 'p-adj', 'lower', 'upper',
+            'reject'; plus 'n_pairs' (int), the total number of pairs compared.
+    """
+    n, mean, m2 = group_moments(counts, sums, sum_squares, centered)
+    labels = np.asarray(labels)
+    k = len(n)
+    df = n.sum() - k
+    ms_within = m2.sum() / df
+
+    i, j = np.triu_indices(k, 1)
+    meandiff = mean[j] - mean[i]
+    std_err = np.sqrt(ms_within / 2.0 * (1 / n[i] + 1 / n[j]))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        q = np.abs(meandiff) / std_err
+
+    q_crit = studentized_range.ppf(1 - alpha, k, df)
+    reject = q > q_crit
+
+    selected = np.arange(len(i))
+    if significant_only:
+        selected = selected[reject]
+    if top_k is not None:
+        selected = selected[np.argsort(-np.abs(meandiff[selected]), kind='stable')[:top_k]]
+
+    half_width = std_err[selected] * q_crit
+    return {
+        'group1': labels[i[selected]],
+        'group2': labels[j[selected]],
+        'meandiff': meandiff[selected],
+        'p-adj': _studentized_range_sf(q[selected], k, df, max_exact_pvalues),
+        'lower': meandiff[selected] - half_width,
+        'upper': meandiff[selected] + half_width,
+        'reject': reject[selected],
+        'n_pairs': len(i)
+    }
+
+
+def _studentized_range_sf(q: np.ndarray, k: int, df: float, max_exact: int, n_grid: int = 128) -> np.ndarray:
+    finite = np.isfinite(q)
+    p = np.where(np.isnan(q), np.nan, 0.0)
+    if not finite.any():
+        return p
+
+    if finite.sum() <= max_exact:
+        p[finite] = studentized_range.sf(q[finite], k, df)
+    else:
+        grid = np.linspace(0.0, q[finite].max(), n_grid)
+        p_grid = np.clip(studentized_range.sf(grid, k, df), 1e-300, 1.0)
+        p[finite] = np.exp(PchipInterpolator(grid, np.log(p_grid))(q[finite]))
+    return np.clip(p, 0.0, 1.0)
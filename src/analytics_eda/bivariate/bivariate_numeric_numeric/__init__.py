@@ -0,0 +1,3 @@
+from .bivariate_numeric_numeric_analysis import bivariate_numeric_numeric_analysis
+from .numeric_correlation_matrices import numeric_correlation_matrices
+from .co_moment_accumulator import CoMomentAccumulator
@@ -0,0 +1,217 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+from typing import Iterable
+import logging
+import uuid
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import seaborn as sns
+from pandas.api.types import is_numeric_dtype
+
+from ...core import write_json_report
+from .co_moment_accumulator import CoMomentAccumulator
+from .numeric_correlation_matrices import numeric_correlation_matrices, CORRELATION_METHODS
+
+logger = logging.getLogger(__name__)
+
+def bivariate_numeric_numeric_analysis(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    columns: list[str] | None = None,
+    methods: tuple[str, ...] = CORRELATION_METHODS,
+    report_root: str = 'reports/eda/bivariate/numeric_numeric',
+    report_log_id = str(uuid.uuid4()),
+    top_pairs: int = 20,
+    block_size: int = 100_000
+) -> Path:
+    """
+    Correlation analysis across all pairs of numeric columns.
+
+    Computes pairwise-complete Pearson, Spearman and Kendall correlation matrices
+    (see `numeric_correlation_matrices`), the strongest pairs per method and a
+    heatmap per method.
+
+    Data may also be an iterable of DataFrame chunks; the chunks are reduced into a
+    mergeable `CoMomentAccumulator`, so only Pearson correlations are available
+    (rank correlations need the full columns and are reported as errors).
+
+    Args:
+        data (pd.DataFrame | Iterable[pd.DataFrame]): Dataset or chunks of it.
+        columns (list[str] | None): Numeric columns to analyze. All numeric columns
+            (of the first chunk) if None.
+        methods (tuple[str, ...]): Any of 'pearson', 'spearman', 'kendall'.
+        report_root (str): Root directory for saving reports.
+        report_log_id (str): report log id.
+        top_pairs (int): Number of strongest pairs (by absolute correlation) reported per method.
+        block_size (int): Rows per matrix-product block.
+
+    Returns:
+        Path: File path to the saved JSON report as written by `write_json_report`.
+
+    Report structure:
+        - metadata # Report metadata
+        - eda report with, per method, the correlation matrix, strongest pairs and
+          heatmap path, and the pairwise-complete observation counts.
+
+    Raises:
+        KeyError: If a requested column is missing.
+        TypeError: If a requested column is not numeric.
+        ValueError: If fewer than two columns are analyzed or a method is unknown.
+    """
+    unknown = set(methods) - set(CORRELATION_METHODS)
+    if unknown:
+        raise ValueError(f"Unknown correlation methods: {sorted(unknown)}")
+
+    logger.info(
+        "Starting bivariate_numeric_numeric_analysis",
+        extra={
+            'report_root': report_root,
+            'report_log_id': report_log_id
+        }
+    )
+
+    if isinstance(data, pd.DataFrame):
+        columns = _validate_columns(data, columns)
+        matrices = numeric_correlation_matrices(data, columns, methods, block_size)
+        errors = {}
+    else:
+        accumulator = None
+        for chunk in data:
+            if accumulator is None:
+                columns = _validate_columns(chunk, columns)
+                accumulator = CoMomentAccumulator(columns, block_size=block_size)
+            accumulator.update(chunk)
+        if accumulator is None:
+            raise ValueError("No chunks were read.")
+
+        matrices = {'n_obs': accumulator.pair_counts()}
+        if 'pearson' in methods:
+            matrices['pearson'] = accumulator.correlation()
+        errors = {
+            method: {
+                'error': f"{method} correlation requires an in-memory DataFrame; not computed for chunked input.",
+                'report_log_id': report_log_id
+            }
+            for method in methods if method != 'pearson'
+        }
+
+    report_dir = Path(report_root)
+    report_dir.mkdir(parents=True, exist_ok=True)
+
+    correlations = {}
+    for method in methods:
+        if method in errors:
+            correlations[method] = errors[method]
+            continue
+
+        matrix = matrices[method]
+        correlations[method] = {
+            'matrix': matrix.to_dict(),
+            'strongest_pairs': _strongest_pairs(matrix, matrices['n_obs'], top_pairs),
+            'heatmap': str(_plot_heatmap(matrix, method, report_dir))
+        }
+
+    eda_report = {
+        'n_columns': len(columns),
+        'n_obs': matrices['n_obs'].to_dict(),
+        'correlations': correlations
+    }
+
+    full_report = {
+        'metadata': {
+            'version': '0.1.0',
+            'report_name': 'bivariate_numeric_numeric_analysis',
+            'parameters': {
+                'columns': columns,
+                'methods': list(methods)
+            }
+        },
+        'eda': eda_report
+    }
+
+    report_path = report_dir / "numeric_numeric_bivariate_analysis_report.json"
+    write_json_report(full_report, report_path)
+
+    logger.info(
+        "Completed bivariate_numeric_numeric_analysis",
+        extra={
+            'report_log_id': report_log_id,
+            'report_path': str(report_path)
+        }
+    )
+
+    return report_path
+
+
+def _validate_columns(df: pd.DataFrame, columns: list[str] | None) -> list[str]:
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame or an iterable of DataFrames.")
+    if columns is None:
+        columns = df.select_dtypes(include='number').columns.tolist()
+    for col in columns:
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found.")
+        if not is_numeric_dtype(df[col]):
+            raise TypeError(f"Column '{col}' must be numeric.")
+    if len(columns) < 2:
+        raise ValueError("At least two numeric columns are required.")
+    return list(columns)
+
+
+def _strongest_pairs(matrix: pd.DataFrame, n_obs: pd.DataFrame, top_pairs: int) -> list[dict]:
+    values = matrix.to_numpy()
+    i, j = np.triu_indices(len(matrix), 1)
+    r = values[i, j]
+    valid = ~np.isnan(r)
+    i, j, r = i[valid], j[valid], r[valid]
+    order = np.argsort(-np.abs(r), kind='stable')[:top_pairs]
+
+    columns = matrix.columns
+    counts = n_obs.to_numpy()
+    return [
+        {
+            'column1': columns[i[k]],
+            'column2': columns[j[k]],
+            'correlation': float(r[k]),
+            'n_obs': int(counts[i[k], j[k]])
+        }
+        for k in order
+    ]
+
+
+def _plot_heatmap(matrix: pd.DataFrame, method: str, report_dir: Path) -> Path:
+    size = min(4 + 0.3 * len(matrix), 30)
+    fig, ax = plt.subplots(figsize=(size, size * 0.8))
+    sns.heatmap(
+        matrix,
+        vmin=-1,
+        vmax=1,
+        center=0,
+        cmap='coolwarm',
+        annot=len(matrix) <= 15,
+        fmt='.2f',
+        square=True,
+        ax=ax
+    )
+    ax.set_title(f"{method.capitalize()} Correlation", fontsize=14, weight='bold')
+    plt.tight_layout()
+
+    plot_path = report_dir / f"{method}_correlation_heatmap.png"
+    try:
+        fig.savefig(plot_path)
+    finally:
+        plt.close(fig)
+    return plot_path
@@ -0,0 +1,142 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+
+class CoMomentAccumulator:
+    """
+    Mergeable pairwise-complete co-moments of numeric columns, for Pearson correlation
+    over chunked input.
+
+    For every column pair (i, j) it keeps, over the rows where both are present, the
+    count `n[i, j]`, the sums `sx[i, j]` (of column i) and the sums of squares and
+    cross products. Chunks are processed in row blocks of `block_size`, each block
+    contributing a handful of (p x p) matrix products (BLAS), with missing values
+    zeroed and tracked by a 0/1 mask. Values are shifted by the first block's column
+    means to limit cancellation.
+
+    Args:
+        columns (list[str] | None): Columns to accumulate. Taken from the first chunk
+            (numeric columns only) if None.
+        block_size (int): Maximum rows per matrix-product block.
+    """
+
+    def __init__(self, columns: list[str] | None = None, block_size: int = 100_000):
+        self.columns = list(columns) if columns is not None else None
+        self.block_size = int(block_size)
+        self.shift = None
+        self.n = None
+        self.sx = None
+        self.sxx = None
+        self.sxy = None
+
+    def _init(self, values: np.ndarray) -> None:
+        p = values.shape[1]
+        with np.errstate(invalid='ignore'):
+            shift = np.nanmean(values, axis=0) if len(values) else np.zeros(p)
+        self.shift = np.nan_to_num(shift)
+        self.n = np.zeros((p, p))
+        self.sx = np.zeros((p, p))
+        self.sxx = np.zeros((p, p))
+        self.sxy = np.zeros((p, p))
+
+    def update(self, chunk: pd.DataFrame) -> "CoMomentAccumulator":
+        """
+        Add a chunk of rows.
+
+        Args:
+            chunk (pd.DataFrame): Chunk containing the accumulated columns.
+
+        Returns:
+            CoMomentAccumulator: self, to allow chaining.
+
+        Raises:
+            TypeError: If `chunk` is not a DataFrame.
+            KeyError: If accumulated columns are missing from the chunk.
+        """
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Each chunk must be a pandas DataFrame.")
+        if self.columns is None:
+            self.columns = chunk.select_dtypes(include='number').columns.tolist()
+        missing = [c for c in self.columns if c not in chunk.columns]
+        if missing:
+            raise KeyError(f"Columns not found in chunk: {missing}")
+
+        values = chunk[self.columns].to_numpy(dtype=float)
+        if self.shift is None:
+            self._init(values[:self.block_size])
+
+        for start in range(0, len(values), self.block_size):
+            block = values[start:start + self.block_size] - self.shift
+            mask = ~np.isnan(block)
+            m = mask.astype(float)
+            x = np.where(mask, block, 0.0)
+
+            self.n += m.T @ m
+            # sx[i, j] = sum of column i over rows where j is also present
+            self.sx += x.T @ m
+            self.sxx += (x * x).T @ m
+            self.sxy += x.T @ x
+        return self
+
+    def merge(self, other: "CoMomentAccumulator") -> "CoMomentAccumulator":
+        """
+        Merge an accumulator built on the same columns (e.g. on another chunk or process).
+
+        Returns:
+            CoMomentAccumulator: self, to allow chaining.
+        """
+        if other.shift is None:
+            return self
+        if self.shift is None:
+            self.columns = other.columns
+            self.shift = other.shift.copy()
+            self.n, self.sx, self.sxx, self.sxy = (a.copy() for a in (other.n, other.sx, other.sxx, other.sxy))
+            return self
+        if list(self.columns) != list(other.columns):
+            raise ValueError("Cannot merge accumulators over different columns.")
+
+        # Re-express the other sums around this accumulator's shift
+        d = other.shift - self.shift
+        di = d[:, None]
+        dj = d[None, :]
+        self.n += other.n
+        self.sx += other.sx + other.n * di
+        self.sxx += other.sxx + 2 * di * other.sx + other.n * di ** 2
+        self.sxy += other.sxy + dj * other.sx + di * other.sx.T + other.n * di * dj
+        return self
+
+    def correlation(self) -> pd.DataFrame:
+        """
+        Pairwise-complete Pearson correlation matrix.
+
+        Returns:
+            pd.DataFrame: (p x p) correlations; NaN where fewer than two complete
+                pairs exist or a column is constant on the complete rows.
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = self.n * self.sxy - self.sx * self.sx.T
+            var_i = self.n * self.sxx - self.sx ** 2
+            corr = cov / np.sqrt(var_i * var_i.T)
+        corr[self.n < 2] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+        np.fill_diagonal(corr, np.where(np.diag(self.n) >= 2, 1.0, np.nan))
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def pair_counts(self) -> pd.DataFrame:
+        """
+        Number of pairwise-complete rows for every column pair.
+        """
+        return pd.DataFrame(self.n.astype(np.int64), index=self.columns, columns=self.columns)
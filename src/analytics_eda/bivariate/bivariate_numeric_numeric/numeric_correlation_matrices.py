@@ -0,0 +1,115 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+from scipy.stats import kendalltau, rankdata
+
+from .co_moment_accumulator import CoMomentAccumulator
+
+CORRELATION_METHODS = ('pearson', 'spearman', 'kendall')
+
+
+def numeric_correlation_matrices(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    methods: tuple[str, ...] = CORRELATION_METHODS,
+    block_size: int = 100_000
+) -> dict[str, pd.DataFrame]:
+    """
+    Pairwise-complete Pearson, Spearman and Kendall correlation matrices.
+
+    - Pearson: co-moments accumulated with blocked matrix products over masked
+      values (`CoMomentAccumulator`), so all pairs cost a few BLAS calls.
+    - Spearman: every column is ranked once (average ranks for ties) and the ranks go
+      through the same Pearson path. Pairs whose two columns are missing on
+      different rows are re-ranked on their pairwise-complete rows, as
+      `DataFrame.corr(method='spearman')` does.
+    - Kendall: tau-b per pair on the pairwise-complete rows with the O(n log n)
+      algorithm of `scipy.stats.kendalltau`.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        columns (list[str] | None): Numeric columns to correlate. All numeric columns if None.
+        methods (tuple[str, ...]): Any of 'pearson', 'spearman', 'kendall'.
+        block_size (int): Rows per matrix-product block.
+
+    Returns:
+        dict: One (p x p) DataFrame per requested method, plus 'n_obs' with the
+            number of pairwise-complete rows.
+
+    Raises:
+        ValueError: If a method is unknown.
+    """
+    unknown = set(methods) - set(CORRELATION_METHODS)
+    if unknown:
+        raise ValueError(f"Unknown correlation methods: {sorted(unknown)}")
+    if columns is None:
+        columns = df.select_dtypes(include='number').columns.tolist()
+
+    data = df[columns]
+    results = {}
+
+    pearson = CoMomentAccumulator(columns, block_size=block_size).update(data)
+    results['n_obs'] = pearson.pair_counts()
+    if 'pearson' in methods:
+        results['pearson'] = pearson.correlation()
+
+    if 'spearman' in methods:
+        ranks = data.rank(method='average')
+        spearman = CoMomentAccumulator(columns, block_size=block_size).update(ranks).correlation()
+        results['spearman'] = _rerank_mismatched_pairs(spearman, data.to_numpy(dtype=float))
+
+    if 'kendall' in methods:
+        results['kendall'] = _kendall_matrix(data.to_numpy(dtype=float), columns)
+
+    return results
+
+
+def _rerank_mismatched_pairs(spearman: pd.DataFrame, values: np.ndarray) -> pd.DataFrame:
+    # Ranks over each column's own rows equal the pairwise-complete ranks (up to
+    # an affine map) only when both columns are missing on the same rows
+    present = ~np.isnan(values)
+    complete = present.all(axis=0)
+    if complete.all():
+        return spearman
+
+    rho = spearman.to_numpy(copy=True)
+    p = values.shape[1]
+    for i in range(p):
+        for j in range(i + 1, p):
+            if (complete[i] and complete[j]) or np.array_equal(present[:, i], present[:, j]):
+                continue
+            both = present[:, i] & present[:, j]
+            if both.sum() < 2:
+                rho[i, j] = rho[j, i] = np.nan
+                continue
+            x, y = rankdata(values[both, i]), rankdata(values[both, j])
+            with np.errstate(invalid='ignore', divide='ignore'):
+                rho[i, j] = rho[j, i] = np.corrcoef(x, y)[0, 1]
+    return pd.DataFrame(rho, index=spearman.index, columns=spearman.columns)
+
+
+def _kendall_matrix(values: np.ndarray, columns: list[str]) -> pd.DataFrame:
+    p = len(columns)
+    present = ~np.isnan(values)
+    tau = np.eye(p)
+    for i in range(p):
+        for j in range(i + 1, p):
+            both = present[:, i] & present[:, j]
+            if both.sum() < 2:
+                tau[i, j] = tau[j, i] = np.nan
+                continue
+            tau[i, j] = tau[j, i] = kendalltau(values[both, i], values[both, j]).statistic
+    np.fill_diagonal(tau, np.where(present.sum(axis=0) >= 2, 1.0, np.nan))
+    return pd.DataFrame(tau, index=columns, columns=columns)
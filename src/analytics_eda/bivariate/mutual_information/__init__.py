@@ -0,0 +1,2 @@
+from .mutual_information_screening import mutual_information_screening
+from .discretize_column import discretize_column
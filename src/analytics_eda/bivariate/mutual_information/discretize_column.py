@@ -0,0 +1,74 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from ...core.numeric.report_binning_rules import rule_bin_count
+
+BIN_RULES = ('sturges', 'scott', 'freedman-diaconis', 'doane')
+
+def discretize_column(
+    series: pd.Series,
+    bin_rule: str = 'sturges',
+    max_bins: int = 64
+) -> tuple[np.ndarray, int]:
+    """
+    Map a column to integer codes for joint-histogram estimators.
+
+    - Categorical / object / boolean columns: their category (factorized) codes.
+    - Numeric columns with at most `max_bins` distinct values: one code per value.
+    - Other numeric columns: quantile (equal-frequency) bins; the number of bins
+      comes from `bin_rule` (the rules of `report_binning_rules`), capped at `max_bins`.
+
+    Args:
+        series (pd.Series): Column to discretize (named).
+        bin_rule (str): 'sturges', 'scott', 'freedman-diaconis' or 'doane'.
+        max_bins (int): Maximum number of numeric bins.
+
+    Returns:
+        tuple: (codes, n_codes), with code -1 for missing values.
+
+    Raises:
+        ValueError: If `bin_rule` is not supported.
+    """
+    if bin_rule not in BIN_RULES:
+        raise ValueError(f"Unsupported bin_rule '{bin_rule}'. Use one of {BIN_RULES}.")
+
+    if not is_numeric_dtype(series) or is_bool_dtype(series):
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        return codes.astype(np.int64), len(uniques)
+
+    values = series.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    clean = values[present]
+    codes = np.full(len(values), -1, dtype=np.int64)
+    if clean.size == 0:
+        return codes, 0
+
+    uniques = np.unique(clean)
+    if len(uniques) <= max_bins:
+        codes[present] = np.searchsorted(uniques, clean)
+        return codes, len(uniques)
+
+    try:
+        k = min(rule_bin_count(series, rule=bin_rule), max_bins)
+    except ValueError:
+        # The rule cannot be applied to this data, e.g. zero interquartile range
+        # for Freedman-Diaconis
+        k = max_bins
+    edges = np.unique(np.quantile(clean, np.linspace(0, 1, max(k, 1) + 1)))
+    # interior edges only: values equal to an edge go to the upper bin
+    codes[present] = np.searchsorted(edges[1:-1], clean, side='right')
+    return codes, max(len(edges) - 1, 1)
@@ -0,0 +1,201 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import logging
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from ...core import write_json_report
+from ..bivariate_categorical_categorical.contingency_table import contingency_table
+from ..bivariate_categorical_categorical.categorical_association import mutual_information
+from .discretize_column import discretize_column
+
+logger = logging.getLogger(__name__)
+
+# Codes shared with pool workers once, through the pool initializer
+_worker_codes: np.ndarray | None = None
+_worker_cardinalities: np.ndarray | None = None
+
+def mutual_information_screening(
+    df: pd.DataFrame,
+    target: str | None = None,
+    columns: list[str] | None = None,
+    report_root: str = 'reports/eda/bivariate/mutual_information',
+    report_log_id = str(uuid.uuid4()),
+    target_only: bool = False,
+    bin_rule: str = 'sturges',
+    max_bins: int = 64,
+    n_jobs: int = 1,
+    sparse_threshold: int = 1_000_000
+) -> Path:
+    """
+    Screen column pairs by mutual information to prune wide tables before running
+    the per-column analyses.
+
+    Every column is discretized once (`discretize_column`: quantile bins for
+    numerics, codes for categoricals). Each pair's joint histogram is one
+    `np.bincount` over the combined codes (`contingency_table`), from which mutual
+    information and its normalized form `I / sqrt(H(A) H(B))` are computed. Pairs
+    run in a process pool when `n_jobs != 1`.
+
+    Args:
+        df (pd.DataFrame): The dataset.
+        target (str | None): Optional target column; its pairs are also ranked separately.
+        columns (list[str] | None): Columns to screen (all columns other than `target` if None).
+        report_root (str): Root directory for saving reports.
+        report_log_id (str): report log id.
+        target_only (bool): Only score column-vs-target pairs (requires `target`).
+        bin_rule (str): Rule giving the number of numeric quantile bins.
+        max_bins (int): Maximum number of numeric bins.
+        n_jobs (int): Worker processes (1 runs in-process, -1 uses all CPUs).
+        sparse_threshold (int): Largest joint histogram (cells) built densely.
+
+    Returns:
+        Path: File path to the saved JSON report as written by `write_json_report`.
+
+    Report structure:
+        - metadata # Report metadata
+        - eda: {
+            'n_bins': {column: int},
+            'ranked_pairs': [{'column_a', 'column_b', 'mutual_information', 'normalized_mi', 'n_obs'}],
+            'normalized_mi_matrix': {column: {column: float}},
+            'target_ranking': [...]  # only if `target` is given
+          }
+
+    Raises:
+        KeyError: If a column or the target is missing.
+        ValueError: If `target_only` is set without a target or fewer than two columns are given.
+    """
+    if target is not None and target not in df.columns:
+        raise KeyError(f"Target column '{target}' not found.")
+    if target_only and target is None:
+        raise ValueError("'target_only' requires a target column.")
+    if columns is None:
+        columns = [col for col in df.columns if col != target]
+    for col in columns:
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found.")
+    columns = [col for col in columns if col != target]
+
+    all_columns = list(columns) + ([target] if target is not None else [])
+    if len(all_columns) < 2:
+        raise ValueError("At least two columns are required.")
+
+    logger.info(
+        "Starting mutual_information_screening",
+        extra={
+            'target': target,
+            'report_root': report_root,
+            'report_log_id': report_log_id
+        }
+    )
+
+    # 1. Discretize every column once
+    codes = np.empty((len(df), len(all_columns)), dtype=np.int64)
+    cardinalities = np.empty(len(all_columns), dtype=np.int64)
+    for i, col in enumerate(all_columns):
+        codes[:, i], cardinalities[i] = discretize_column(df[col], bin_rule=bin_rule, max_bins=max_bins)
+
+    # 2. Score pairs
+    p = len(all_columns)
+    if target_only:
+        pairs = [(i, p - 1) for i in range(p - 1)]
+    else:
+        pairs = [(i, j) for i in range(p) for j in range(i + 1, p)]
+
+    if n_jobs == 1 or len(pairs) <= 1:
+        _init_worker(codes, cardinalities)
+        try:
+            scores = [_pair_mutual_information(i, j, sparse_threshold) for i, j in pairs]
+        finally:
+            _init_worker(None, None)
+    else:
+        max_workers = None if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(codes, cardinalities)) as executor:
+            futures = [executor.submit(_pair_mutual_information, i, j, sparse_threshold) for i, j in pairs]
+            scores = [future.result() for future in futures]
+
+    # 3. Rank
+    normalized = np.full((p, p), np.nan)
+    np.fill_diagonal(normalized, 1.0)
+    records = []
+    for (i, j), (mi, nmi, n_obs) in zip(pairs, scores):
+        normalized[i, j] = normalized[j, i] = nmi
+        records.append({
+            'column_a': all_columns[i],
+            'column_b': all_columns[j],
+            'mutual_information': mi,
+            'normalized_mi': nmi,
+            'n_obs': n_obs
+        })
+    order = np.argsort([-r['normalized_mi'] for r in records], kind='stable')
+    ranked = [records[k] for k in order]
+
+    eda_report = {
+        'n_bins': dict(zip(all_columns, cardinalities.tolist())),
+        'ranked_pairs': ranked,
+        'normalized_mi_matrix': pd.DataFrame(normalized, index=all_columns, columns=all_columns).to_dict()
+    }
+    if target is not None:
+        eda_report['target_ranking'] = [r for r in ranked if r['column_b'] == target]
+
+    full_report = {
+        'metadata': {
+            'version': '0.1.0',
+            'report_name': 'mutual_information_screening',
+            'parameters': {
+                'target': target,
+                'columns': list(columns),
+                'bin_rule': bin_rule,
+                'max_bins': max_bins
+            }
+        },
+        'eda': eda_report
+    }
+
+    report_dir = Path(report_root)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    report_path = report_dir / "mutual_information_screening_report.json"
+    write_json_report(full_report, report_path)
+
+    logger.info(
+        "Completed mutual_information_screening",
+        extra={
+            'target': target,
+            'report_log_id': report_log_id,
+            'report_path': str(report_path)
+        }
+    )
+
+    return report_path
+
+
+def _init_worker(codes: np.ndarray | None, cardinalities: np.ndarray | None) -> None:
+    global _worker_codes, _worker_cardinalities
+    _worker_codes = codes
+    _worker_cardinalities = cardinalities
+
+
+def _pair_mutual_information(i: int, j: int, sparse_threshold: int) -> tuple[float, float, int]:
+    table = contingency_table(
+        _worker_codes[:, i], int(_worker_cardinalities[i]),
+        _worker_codes[:, j], int(_worker_cardinalities[j]),
+        sparse_threshold=sparse_threshold
+    )
+    mi, h_a, h_b = mutual_information(table)
+    nmi = mi / np.sqrt(h_a * h_b) if h_a > 0 and h_b > 0 else 0.0
+    return float(mi), float(nmi), int(table.sum())
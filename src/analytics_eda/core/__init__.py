@@ -1,6 +1,8 @@
 from .numeric import distribution_fit_assessment, assess_normality_and_transform, descriptive_statistics, numeric_distribution_analysis, numeric_distribution_visualizations, numeric_inferential_analysis, normality_assessment, numeric_outlier_analysis, validate_numeric_named_series
-from .categorical import validate_categorical_named_series, categorical_inferential_analysis, categorical_distribution_analysis
+from .categorical import validate_categorical_named_series, categorical_inferential_analysis, categorical_distribution_analysis, categorical_frequency_counts, CategoricalFrequencySketch, CategoricalAccumulator
 from .reporting import write_json_report
 from .explore_data import explore_data
 from .missing_data_analysis import missing_data_analysis
+from .missing_pattern_analysis import missing_pattern_analysis, MissingPatternAccumulator
+from .space_saving_counter import SpaceSavingCounter
 from .clean_series import clean_series
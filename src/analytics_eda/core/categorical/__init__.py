@@ -1,3 +1,6 @@
 from .validate_categorical_named_series import validate_categorical_named_series
 from .categorical_inferential_analysis import categorical_inferential_analysis
 from .categorical_distribution_analysis import categorical_distribution_analysis
+from .categorical_frequency_counts import categorical_frequency_counts
+from .categorical_frequency_sketch import CategoricalFrequencySketch
+from .categorical_accumulator import CategoricalAccumulator
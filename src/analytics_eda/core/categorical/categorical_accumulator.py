@@ -0,0 +1,121 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+from .validate_categorical_named_series import validate_categorical_named_series
+from .categorical_frequency_counts import category_code_counts
+
+
+class CategoricalAccumulator:
+    """
+    Exact, mergeable category counter fed chunk by chunk.
+
+    Each chunk is reduced to per-category counts with a single `np.bincount` over its
+    category, Arrow dictionary or factorized codes and added to a running count
+    table, so only the distinct categories are ever held in memory. Accumulators built on different
+    chunks or processes can be merged, and `frequency_counts` returns the same
+    structure as `categorical_frequency_counts` on the concatenated column.
+
+    Args:
+        name (str | None): Name of the accumulated column. Taken from the first
+            named chunk if None.
+    """
+
+    def __init__(self, name: str | None = None):
+        self.name = name
+        self.total = 0
+        self.missing = 0
+        self.missing_label = 'nan'
+        self._counts = pd.Series(dtype=np.int64)
+
+    def update(self, chunk: pd.Series) -> "CategoricalAccumulator":
+        """
+        Add a chunk of values.
+
+        Args:
+            chunk (pd.Series): Categorical chunk (dtype 'category', 'object', 'string'
+                or an Arrow string / dictionary dtype).
+
+        Returns:
+            CategoricalAccumulator: self, to allow chaining.
+        """
+        validate_categorical_named_series(chunk, require_name=False)
+        if self.name is None and chunk.name is not None:
+            self.name = chunk.name
+
+        labels, counts, missing, missing_label = category_code_counts(chunk)
+        if missing and not self.missing:
+            self.missing_label = missing_label
+
+        counts = pd.Series(counts, index=labels)
+        self._add(counts, len(chunk), missing)
+        return self
+
+    def merge(self, other: "CategoricalAccumulator") -> "CategoricalAccumulator":
+        """
+        Merge another accumulator (e.g. built on a different chunk or process).
+
+        Returns:
+            CategoricalAccumulator: self, to allow chaining.
+        """
+        if self.name is None:
+            self.name = other.name
+        if other.missing and not self.missing:
+            self.missing_label = other.missing_label
+        self._add(other._counts, other.total, other.missing)
+        return self
+
+    def _add(self, counts: pd.Series, total: int, missing: int) -> None:
+        if not counts.index.is_unique:
+            counts = counts.groupby(level=0, sort=False).sum()
+        if self._counts.empty:
+            self._counts = counts.astype(np.int64)
+        else:
+            self._counts = self._counts.add(counts, fill_value=0).astype(np.int64)
+        self.total += int(total)
+        self.missing += int(missing)
+
+    def frequency_counts(self) -> dict:
+        """
+        Return the accumulated frequencies.
+
+        Returns:
+            dict: Same structure as `categorical_frequency_counts`.
+        """
+        labels = self._counts.index.to_numpy(dtype=object)
+        counts = self._counts.to_numpy(dtype=np.int64)
+        cardinality = int(np.count_nonzero(counts))
+
+        if self.missing:
+            labels = np.append(labels, self.missing_label)
+            counts = np.append(counts, self.missing)
+
+        order = np.argsort(-counts, kind='stable')
+        labels = labels[order]
+        counts = counts[order]
+
+        lengths = pd.Index(labels).str.len().to_numpy() if len(labels) else np.array([0])
+
+        return {
+            'labels': labels,
+            'counts': counts,
+            'total': int(self.total),
+            'missing': int(self.missing),
+            'cardinality': cardinality,
+            'category_length_stats': {
+                'max_length': int(lengths.max()),
+                'min_length': int(lengths.min())
+            }
+        }
@@ -15,11 +15,14 @@
 import logging
 import uuid
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 from .validate_categorical_named_series import validate_categorical_named_series
+from .categorical_frequency_counts import categorical_frequency_counts
+from .categorical_frequency_sketch import CategoricalFrequencySketch
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +30,11 @@ def categorical_distribution_analysis(
     series: pd.Series,
     save_dir: Path,
     top_n: int = 10,
-    report_log_id = str(uuid.uuid4())
+    report_log_id = str(uuid.uuid4()),
+    table_top_k: int | None = None,
+    frequency_mode: str = 'exact',
+    sketch_capacity: int = 1000,
+    chunk_size: int = 1_000_000
 ) -> dict:
     """
     Analyze a categorical pandas Series and produce a structured report with summary
@@ -36,24 +43,42 @@ def categorical_distribution_analysis(
     Parameters
     ----------
     series : pd.Series
-        Categorical data to analyze (dtype 'category' or 'object').
+        Categorical data to analyze (dtype 'category', 'object', 'string' or an Arrow string / dictionary dtype).
     save_dir : pathlib.Path
         Directory where the top-N bar chart will be saved. Created if it does not exist.
     top_n : int, optional
         Number of highest-frequency categories to plot. If the series has fewer than
         top_n unique values, top_n is reset to max(1, unique_categories // 2). Default is 10.
     report_log_id (str): report log id.
+    table_top_k : int or None, optional
+        If set, only the `table_top_k` most frequent categories are written to the
+        frequency table and all remaining categories are summarized in a tail entry.
+        Default is None (full table).
+    frequency_mode : str, optional
+        'exact' (default) counts every category. 'bounded' feeds the series in chunks of
+        `chunk_size` into a `CategoricalFrequencySketch` with `sketch_capacity` tracked
+        categories, so memory stays fixed for ultra-high-cardinality columns. In bounded
+        mode the frequency table holds the top `table_top_k` (default `top_n`) categories
+        with upper-bound counts and a `'max_overcount'` key, cardinality is an estimate
+        and the imbalance ratio is None.
+    sketch_capacity : int, optional
+        Number of heavy-hitter categories tracked in bounded mode. Default is 1000.
+    chunk_size : int, optional
+        Number of rows hashed at a time in bounded mode. Default is 1,000,000.
 
     Returns
     -------
     dict
-        A dict with a single key `'report'`, whose value is another dict containing:
+        A dict with key `'frequencies'` holding the raw output of
+        `categorical_frequency_counts` (or the `CategoricalFrequencySketch` in bounded mode)
+        and key `'report'`, whose value is another dict containing:
 
         - **statistics** : dict  
             - **category_length_stats** : dict with  
                 - `'max_length'` (int) – length of the longest category label  
                 - `'min_length'` (int) – length of the shortest category label  
             - **cardinality** (int) – number of unique non‐null categories  
+            - **cardinality_estimated** (bool) – True in bounded mode  
             - **imbalance_ratio** (float or None) – ratio of most to least frequent category  
 
         - **frequency_report** : dict  
@@ -61,6 +86,10 @@ def categorical_distribution_analysis(
                 Mapping each category (str) to a dict with keys  
                 - `'count'` (int) – raw frequency  
                 - `'proportion'` (float) – frequency divided by total observations  
+            - **tail** : dict (only if `table_top_k` is set or in bounded mode)  
+                - `'n_categories'` (int) – categories left out of the frequency table  
+                - `'count'` (int) – their combined frequency  
+                - `'proportion'` (float) – their combined proportion  
             - **visualizations** : dict  
                 - `'top_n_plot'` (str) – filesystem path to the saved bar chart  
     """
@@ -75,38 +104,130 @@ def categorical_distribution_analysis(
         }
     )
 
+    if frequency_mode == 'exact':
+        # frequency, label length and cardinality from a single pass over the codes
+        freq = categorical_frequency_counts(series)
+    elif frequency_mode == 'bounded':
+        # fixed-memory top-k / Count-Min / distinct-count summary, fed chunk by chunk
+        freq = CategoricalFrequencySketch(capacity=sketch_capacity)
+        for start in range(0, len(series), chunk_size):
+            freq.update(series.iloc[start:start + chunk_size])
+    else:
+        raise ValueError(f"Unknown frequency_mode: {frequency_mode!r}")
+
+    report = categorical_distribution_report(freq, series.name, save_dir, top_n, table_top_k)
+
+    logger.info(
+        "Completed categorical_distribution_analysis",
+        extra={
+            'series_name': series.name,
+            'report_log_id': report_log_id
+        }
+    )
+
+    return {'report': report, 'frequencies': freq}
+
+
+def categorical_distribution_report(
+    freq: dict | CategoricalFrequencySketch,
+    series_name: str,
+    save_dir: Path,
+    top_n: int = 10,
+    table_top_k: int | None = None
+) -> dict:
+    """
+    Build the categorical distribution report and top-N bar chart from precomputed
+    frequencies.
+
+    Used by `categorical_distribution_analysis` and by analyses that count categories
+    chunk by chunk without holding the full Series.
+
+    Args:
+        freq (dict | CategoricalFrequencySketch): Output of `categorical_frequency_counts`
+            (exact) or a `CategoricalFrequencySketch` (bounded).
+        series_name (str): Name of the analyzed series (used in titles and filenames).
+        save_dir (Path): Directory where the top-N bar chart will be saved.
+        top_n (int): Number of highest-frequency categories to plot.
+        table_top_k (int | None): Number of categories written to the frequency table.
+
+    Returns:
+        dict: The `'report'` described in `categorical_distribution_analysis`.
+    """
     save_dir.mkdir(parents=True, exist_ok=True)
 
-    total = len(series)
-    # frequency and proportions
-    freq = series.value_counts(dropna=False).rename_axis(series.name)
-    props = freq / total
-    frequency = {
-        str(cat): {
-            'count': int(freq_cat),
-            'proportion': float(props_cat)
+    if not isinstance(freq, CategoricalFrequencySketch):
+        labels, counts = freq['labels'], freq['counts']
+        total = freq['total']
+        props = counts / total if total else np.zeros(len(counts))
+
+        table_size = len(labels) if table_top_k is None else min(table_top_k, len(labels))
+        frequency = {
+            cat: {
+                'count': count,
+                'proportion': prop
+            }
+            for cat, count, prop in zip(
+                labels[:table_size].tolist(),
+                counts[:table_size].tolist(),
+                props[:table_size].tolist()
+            )
         }
-        for cat, freq_cat, props_cat in zip(freq.index, freq.values, props.values)
-    }
 
-    # category length stats
-    lengths = [len(str(cat)) for cat in freq.index]
-    category_length_stats = {'max_length': max(lengths), 'min_length': min(lengths)}
+        category_length_stats = freq['category_length_stats']
 
-    # cardinality and imbalance
-    cardinality = int(series.nunique(dropna=True))
-    imbalance_ratio = float(freq.max() / freq.min()) if freq.min() > 0 else None
+        # cardinality and imbalance
+        cardinality = freq['cardinality']
+        imbalance_ratio = float(counts.max() / counts.min()) if counts.min() > 0 else None
+        unique_categories = len(labels)
 
-    # Bar plot of top N categories
-    unique_categories = len(freq)
+        tail = None
+        if table_top_k is not None:
+            tail_count = int(counts[table_size:].sum())
+            tail = {
+                'n_categories': int(len(labels) - table_size),
+                'count': tail_count,
+                'proportion': tail_count / total if total else 0.0
+            }
+    else:
+        summary = freq.summary(top_k=table_top_k if table_top_k is not None else top_n)
+        entries = summary['top_k']
+        if summary['missing']:
+            entries.append({
+                'category': 'nan',
+                'count': summary['missing'],
+                'proportion': summary['missing'] / summary['total'],
+                'max_overcount': 0
+            })
+            entries.sort(key=lambda e: e['count'], reverse=True)
+
+        frequency = {
+            e['category']: {
+                'count': e['count'],
+                'proportion': e['proportion'],
+                'max_overcount': e['max_overcount']
+            }
+            for e in entries
+        }
+        labels = np.array([e['category'] for e in entries], dtype=object)
+        counts = np.array([e['count'] for e in entries], dtype=np.int64)
+        total = summary['total']
+
+        lengths = [len(label) for label in labels] or [0]
+        category_length_stats = {'max_length': max(lengths), 'min_length': min(lengths)}
 
+        cardinality = summary['estimated_distinct']
+        imbalance_ratio = None
+        unique_categories = cardinality + (1 if summary['missing'] else 0)
+        tail = summary['tail']
+
+    # Bar plot of top N categories
     # If fewer than requested top_n, adjust top_n (e.g., reduce to 5 if <10 categories)
     if unique_categories <= top_n:
         # Set top_n to half of available categories (or at least 1)
         top_n = max(1, unique_categories // 2)
 
-    top = freq.head(top_n)
-    others_count = freq.iloc[top_n:].sum()
+    top = pd.Series(counts[:top_n], index=labels[:top_n])
+    others_count = max(int(total - counts[:top_n].sum()), 0)
     top = pd.concat([top, pd.Series({'Others': others_count})])
     top = top.sort_values(ascending=False)
 
@@ -141,15 +262,15 @@ def categorical_distribution_analysis(
         ax2.text(v + max(top.values) * 0.01, i, f"{v:,}", va="center", fontsize=10)
 
     # Set labels and title
-    ax2.set_title(f"Top {top_n} Values in {series.name.replace('_', ' ').title()} (+Others Aggregated)",
+    ax2.set_title(f"Top {top_n} Values in {series_name.replace('_', ' ').title()} (+Others Aggregated)",
                 fontsize=14, weight="bold")
     ax2.set_xlabel("Count", fontsize=12)
-    ax2.set_ylabel(series.name.replace('_', ' ').title(), fontsize=12)
+    ax2.set_ylabel(series_name.replace('_', ' ').title(), fontsize=12)
 
     plt.tight_layout()
     fig2 = ax2.get_figure()
 
-    plot_path = save_dir / f"{series.name.replace(' ', '_')}_top_{top_n}.png"
+    plot_path = save_dir / f"{series_name.replace(' ', '_')}_top_{top_n}.png"
     fig2.savefig(plot_path)
     plt.close(fig2)
 
@@ -158,6 +279,7 @@ def categorical_distribution_analysis(
         'statistics': {
             'category_length_stats': category_length_stats,
             'cardinality': int(cardinality),
+            'cardinality_estimated': isinstance(freq, CategoricalFrequencySketch),
             'imbalance_ratio': imbalance_ratio,
         },
         'frequency_report': {
@@ -168,12 +290,7 @@ def categorical_distribution_analysis(
         }
     }
 
-    logger.info(
-        "Completed categorical_distribution_analysis",
-        extra={
-            'series_name': series.name,
-            'report_log_id': report_log_id
-        }
-    )
+    if tail is not None:
+        report['frequency_report']['tail'] = tail
 
-    return {'report': report}
+    return report
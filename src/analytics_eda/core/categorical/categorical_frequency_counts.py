@@ -0,0 +1,145 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+def categorical_frequency_counts(series: pd.Series) -> dict:
+    """
+    Count category frequencies of a categorical Series in a single vectorized pass.
+
+    Works directly on category codes (`category` dtype), on Arrow dictionary indices
+    or Arrow string hashing (`ArrowDtype` / `string[pyarrow]`), or on factorized codes
+    (`object` dtype): counts come from one `np.bincount` over the codes, and
+    label-length statistics and cardinality are derived from the unique labels
+    only, never from the full column.
+
+    Args:
+        series (pd.Series): Categorical data (dtype 'category', 'object', 'string'
+            or an Arrow string / dictionary dtype).
+
+    Returns:
+        dict: {
+            'labels': np.ndarray[str],  # category labels, most frequent first
+            'counts': np.ndarray[int],  # frequency of each label
+            'total': int,               # number of observations (including missing)
+            'missing': int,             # number of missing observations
+            'cardinality': int,         # number of observed non-null categories
+            'category_length_stats': {'max_length': int, 'min_length': int}
+        }
+
+        Missing values are reported as their own label (as `value_counts(dropna=False)`
+        does) and unused categories of a `category` dtype keep a count of 0.
+    """
+    labels, counts, missing, missing_label = category_code_counts(series)
+    cardinality = int(np.count_nonzero(counts))
+
+    if missing:
+        labels = np.append(labels, missing_label)
+        counts = np.append(counts, missing)
+
+    order = np.argsort(-counts, kind='stable')
+    labels = labels[order]
+    counts = counts[order].astype(np.int64)
+
+    lengths = pd.Index(labels).str.len().to_numpy() if len(labels) else np.array([0])
+
+    return {
+        'labels': labels,
+        'counts': counts,
+        'total': int(len(series)),
+        'missing': missing,
+        'cardinality': cardinality,
+        'category_length_stats': {
+            'max_length': int(lengths.max()),
+            'min_length': int(lengths.min())
+        }
+    }
+
+
+def category_code_counts(series: pd.Series) -> tuple[np.ndarray, np.ndarray, int, str]:
+    """
+    Count each category of a Series from its codes, without sorting.
+
+    Args:
+        series (pd.Series): Categorical data (see `categorical_frequency_counts`).
+
+    Returns:
+        tuple:
+            labels (np.ndarray[str]): Category labels in code order.
+            counts (np.ndarray[int]): Frequency of each label (0 for unused categories).
+            missing (int): Number of missing observations.
+            missing_label (str): Label used for missing values.
+    """
+    if _is_arrow_backed(series):
+        return _arrow_code_counts(series.array.__arrow_array__())
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        categories = series.cat.categories
+    else:
+        codes, categories = pd.factorize(series, use_na_sentinel=True)
+
+    # Shift codes by one so the missing sentinel (-1) lands in bin 0.
+    binned = np.bincount(codes + 1, minlength=len(categories) + 1)
+    missing = int(binned[0])
+    missing_label = str(series.iloc[int(np.argmax(codes == -1))]) if missing else 'nan'
+
+    labels = pd.Index(categories).astype(str).to_numpy(dtype=object)
+    return labels, binned[1:].astype(np.int64), missing, missing_label
+
+
+def _is_arrow_backed(series: pd.Series) -> bool:
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and str(dtype.storage).startswith('pyarrow')
+
+
+def _arrow_code_counts(chunked) -> tuple[np.ndarray, np.ndarray, int, str]:
+    """
+    Count categories of an Arrow ChunkedArray without materialising Python objects
+    for every row: dictionary arrays are counted from their indices, other arrays
+    are hashed by Arrow (`pyarrow.compute.value_counts`).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Same label as the default of the non-Arrow path
+    missing_label = 'nan'
+
+    if pa.types.is_dictionary(chunked.type):
+        chunked = chunked.unify_dictionaries()
+        if chunked.num_chunks == 0:
+            return np.array([], dtype=object), np.array([], dtype=np.int64), 0, missing_label
+
+        dictionary = chunked.chunk(0).dictionary
+        k = len(dictionary)
+        binned = np.zeros(k + 1, dtype=np.int64)
+        for chunk in chunked.chunks:
+            # int64 so narrow (int8) or unsigned index types neither wrap nor reject -1
+            indices = chunk.indices.cast(pa.int64())
+            if indices.null_count:
+                indices = pc.fill_null(indices, -1)
+            binned += np.bincount(indices.to_numpy() + 1, minlength=k + 1)
+
+        labels = np.array([str(v) for v in dictionary.to_pylist()], dtype=object)
+        return labels, binned[1:], int(binned[0]), missing_label
+
+    counted = pc.value_counts(chunked)
+    values = counted.field('values')
+    counts = counted.field('counts').to_numpy().astype(np.int64)
+    valid = values.is_valid().to_numpy(zero_copy_only=False)
+
+    labels = np.array([str(v) for v in values.filter(valid).to_pylist()], dtype=object)
+    return labels, counts[valid], int(chunked.null_count), missing_label
@@ -0,0 +1,233 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+categorical_frequency_sketch.py
+
+Bounded-memory frequency summary for ultra-high-cardinality categorical data.
+
+Values are hashed once per chunk (`pd.util.hash_pandas_object`, stable across
+processes and dtypes) and fed to three mergeable structures:
+- a Space-Saving counter for the top-k categories,
+- a Count-Min sketch for point queries on any (tail) category,
+- a K-Minimum-Values sample for the number of distinct categories.
+
+Memory is fixed by `capacity`, `cms_width * cms_depth` and `distinct_sample_size`,
+independently of the number of rows or categories.
+"""
+import numpy as np
+import pandas as pd
+
+from ..space_saving_counter import SpaceSavingCounter
+
+_CMS_SALTS = np.array([
+    0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x27D4EB2F165667C5, 0x94D049BB133111EB
+], dtype=np.uint64)
+
+
+class CategoricalFrequencySketch:
+    """
+    Mergeable top-k / Count-Min / distinct-count summary of a categorical column.
+
+    Args:
+        capacity (int): Number of heavy-hitter categories tracked with their labels.
+        cms_width (int): Counters per Count-Min row (rounded up to a power of two).
+        cms_depth (int): Number of Count-Min rows (at most 8).
+        distinct_sample_size (int): Number of minimum hash values kept for the
+            distinct-count estimate.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        cms_width: int = 2 ** 16,
+        cms_depth: int = 4,
+        distinct_sample_size: int = 4096
+    ):
+        if not 1 <= cms_depth <= len(_CMS_SALTS):
+            raise ValueError(f"cms_depth must be between 1 and {len(_CMS_SALTS)}.")
+        self._cms_bits = max(1, int(np.ceil(np.log2(cms_width))))
+        self.cms_width = 2 ** self._cms_bits
+        self.cms_depth = int(cms_depth)
+        self.distinct_sample_size = int(distinct_sample_size)
+
+        self.heavy_hitters = SpaceSavingCounter(capacity)
+        self.cms = np.zeros((self.cms_depth, self.cms_width), dtype=np.int64)
+        self.total = 0
+        self.missing = 0
+        self._labels: dict[int, str] = {}
+        self._min_hashes = np.empty(0, dtype=np.uint64)
+
+    def _cms_index(self, hashes: np.ndarray) -> np.ndarray:
+        shift = np.uint64(64 - self._cms_bits)
+        salts = _CMS_SALTS[:self.cms_depth, None]
+        return (((hashes[None, :] ^ salts) * np.uint64(0xBF58476D1CE4E5B9)) >> shift).astype(np.intp)
+
+    def update(self, values: pd.Series) -> "CategoricalFrequencySketch":
+        """
+        Add a chunk of values.
+
+        Args:
+            values (pd.Series): Categorical chunk (any hashable dtype). Missing
+                values are counted separately.
+
+        Returns:
+            CategoricalFrequencySketch: self, to allow chaining.
+        """
+        values = pd.Series(values) if not isinstance(values, pd.Series) else values
+        n = len(values)
+        if not n:
+            return self
+
+        notna = values.notna().to_numpy()
+        n_missing = int(n - notna.sum())
+        if n_missing:
+            values = values[notna]
+
+        self.total += n
+        self.missing += n_missing
+        if values.empty:
+            return self
+
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        unique_hashes, first_idx, counts = np.unique(hashes, return_index=True, return_counts=True)
+
+        # Count-Min
+        for row, idx in enumerate(self._cms_index(unique_hashes)):
+            self.cms[row] += np.bincount(idx, weights=counts, minlength=self.cms_width).astype(np.int64)
+
+        # K-Minimum-Values (np.unique output is already sorted)
+        self._min_hashes = np.union1d(self._min_hashes, unique_hashes[:self.distinct_sample_size])[:self.distinct_sample_size]
+
+        # Space-Saving (keys are truncated to the capacity before leaving NumPy)
+        self.heavy_hitters.update(unique_hashes, counts)
+        self._prune_labels()
+
+        # Label newly monitored categories; they all come from this chunk.
+        unlabeled = [key for key, _, _ in self.heavy_hitters.top() if key not in self._labels]
+        if unlabeled:
+            positions = np.searchsorted(unique_hashes, np.array(unlabeled, dtype=np.uint64))
+            labels = values.iloc[first_idx[positions]].astype(str).tolist()
+            self._labels.update(zip(unlabeled, labels))
+        self._prune_labels()
+        return self
+
+    def merge(self, other: "CategoricalFrequencySketch") -> "CategoricalFrequencySketch":
+        """
+        Merge a sketch built with the same parameters (e.g. on another chunk or process).
+
+        Returns:
+            CategoricalFrequencySketch: self, to allow chaining.
+        """
+        if self.cms.shape != other.cms.shape or self.distinct_sample_size != other.distinct_sample_size:
+            raise ValueError("Cannot merge sketches built with different parameters.")
+        self.cms += other.cms
+        self.total += other.total
+        self.missing += other.missing
+        self._min_hashes = np.union1d(self._min_hashes, other._min_hashes)[:self.distinct_sample_size]
+        self.heavy_hitters.merge(other.heavy_hitters)
+        for key, label in other._labels.items():
+            self._labels.setdefault(key, label)
+        self._prune_labels()
+        return self
+
+    def _prune_labels(self) -> None:
+        if len(self._labels) > len(self.heavy_hitters):
+            self._labels = {k: v for k, v in self._labels.items() if k in self.heavy_hitters}
+
+    def estimate(self, value) -> int:
+        """
+        Upper-bound estimate of the frequency of a single category.
+        """
+        key = pd.util.hash_pandas_object(pd.Series([value]), index=False).to_numpy()
+        cms_estimate = int(self.cms[np.arange(self.cms_depth), self._cms_index(key)[:, 0]].min())
+        return min(cms_estimate, self.heavy_hitters.estimate(int(key[0])))
+
+    def estimated_distinct(self) -> int:
+        """
+        Estimate the number of distinct non-null categories (K-Minimum-Values).
+        """
+        k = len(self._min_hashes)
+        if k < self.distinct_sample_size:
+            return k
+        kth = float(self._min_hashes[-1]) / 2.0 ** 64
+        return int(round((k - 1) / kth))
+
+    def summary(self, top_k: int = 20, rare_threshold: float = 0.01) -> dict:
+        """
+        Summarize the sketch.
+
+        Args:
+            top_k (int): Number of most frequent categories to report.
+            rare_threshold (float): Proportion threshold for rare categories.
+
+        Returns:
+            dict: {
+                'total': int,
+                'missing': int,
+                'estimated_distinct': int,
+                'top_k': [{'category': str, 'count': int, 'proportion': float, 'max_overcount': int}],
+                'tail': {'n_categories': int, 'count': int, 'proportion': float},
+                'rare_categories': {
+                    'threshold': float,
+                    'tracked': list[str],
+                    'estimated_count': int,
+                    'estimated_proportion': float
+                }
+            }
+            Counts are upper bounds that exceed the true frequency by at most
+            `max_overcount`; the tail is everything outside the reported top-k.
+        """
+        total = self.total
+        top = [
+            {
+                'category': self._labels[key],
+                'count': int(count),
+                'proportion': count / total if total else 0.0,
+                'max_overcount': int(error)
+            }
+            for key, count, error in self.heavy_hitters.top(top_k)
+        ]
+
+        distinct = self.estimated_distinct()
+        top_count = min(sum(t['count'] for t in top), total - self.missing)
+        tail_count = total - self.missing - top_count
+
+        # Categories whose lower-bound frequency clears the threshold are not rare;
+        # every other category (tracked or not) is counted as rare.
+        threshold_count = rare_threshold * total
+        frequent = [
+            (key, count - error)
+            for key, count, error in self.heavy_hitters.top()
+            if count - error >= threshold_count
+        ]
+        rare_count = total - self.missing - sum(c for _, c in frequent)
+
+        return {
+            'total': int(total),
+            'missing': int(self.missing),
+            'estimated_distinct': distinct,
+            'top_k': top,
+            'tail': {
+                'n_categories': max(distinct - len(top), 0),
+                'count': int(tail_count),
+                'proportion': tail_count / total if total else 0.0
+            },
+            'rare_categories': {
+                'threshold': float(rare_threshold),
+                'tracked': [t['category'] for t in top if t['proportion'] < rare_threshold],
+                'estimated_count': max(distinct - len(frequent), 0),
+                'estimated_proportion': rare_count / total if total else 0.0
+            }
+        }
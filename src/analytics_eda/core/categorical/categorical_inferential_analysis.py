@@ -12,16 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 from scipy.stats import chisquare
 
-def categorical_inferential_analysis(freq_table: dict, total: int, alpha: float = 0.05) -> dict:
+def categorical_inferential_analysis(freq_table: dict | np.ndarray, total: int, alpha: float = 0.05) -> dict:
     """
     Perform inferential analysis on a categorical frequency distribution using
     Chi-square goodness-of-fit against a uniform distribution.
 
     Args:
-        freq_table (dict): Mapping category -> {'count': int, 'proportion': float}
-                           or mapping category -> count (int).
+        freq_table (dict | np.ndarray): Mapping category -> {'count': int, 'proportion': float},
+                           mapping category -> count (int), or an array of category counts.
         total (int): Total number of observations (including missing if applicable).
         alpha (float, optional): Significance level. Default 0.05.
 
@@ -35,9 +36,17 @@ def categorical_inferential_analysis(freq_table: dict, total: int, alpha: float
             }
         }
     """
-    k = len(freq_table)
-    expected = [total / k] * k
-    observed = [v['count'] for v in freq_table.values()]
+    if isinstance(freq_table, dict):
+        observed = np.fromiter(
+            (v['count'] if isinstance(v, dict) else v for v in freq_table.values()),
+            dtype=float,
+            count=len(freq_table)
+        )
+    else:
+        observed = np.asarray(freq_table, dtype=float)
+
+    k = len(observed)
+    expected = np.full(k, total / k)
     chi2_stat, p_val = chisquare(f_obs=observed, f_exp=expected)
 
     return {
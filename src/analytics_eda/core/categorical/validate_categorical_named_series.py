@@ -21,6 +21,9 @@ def validate_categorical_named_series(
     """
     Validate that the input is a categorical pandas Series with a non-empty name.
 
+    Accepted dtypes are 'category', 'object', 'string' (including `string[pyarrow]`)
+    and Arrow string or dictionary dtypes (`pd.ArrowDtype`).
+
     Args:
         series (pd.Series): The Series to validate.
         require_name (bool): If True, series.name must be non-empty.
@@ -29,15 +32,31 @@ def validate_categorical_named_series(
         pd.Series: The validated Series.
 
     Raises:
-        TypeError: If `series` is not a pandas Series or not categorical or object dtype.
+        TypeError: If `series` is not a pandas Series or not a categorical, object or string dtype.
         ValueError: If `require_name` is True and `series.name` is None or empty.
     """
     if not isinstance(series, pd.Series):
         raise TypeError("Input must be a pandas Series.")
 
-    if not (isinstance(series.dtype, pd.CategoricalDtype) or is_object_dtype(series)):
+    if not (isinstance(series.dtype, pd.CategoricalDtype) or is_object_dtype(series) or is_string_like_dtype(series.dtype)):
         raise TypeError(f"Series '{series.name}' must be categorical (or object) for categorical analysis.")
     
     if require_name and (series.name is None or str(series.name).strip() == ""):
         raise ValueError("Series must have a non-empty 'name' attribute.")
     return series
+
+def is_string_like_dtype(dtype) -> bool:
+    """
+    Return True for pandas 'string' dtypes and Arrow string / dictionary dtypes.
+    """
+    if isinstance(dtype, pd.StringDtype):
+        return True
+    if isinstance(dtype, pd.ArrowDtype):
+        import pyarrow as pa
+        arrow_type = dtype.pyarrow_dtype
+        return (
+            pa.types.is_string(arrow_type)
+            or pa.types.is_large_string(arrow_type)
+            or pa.types.is_dictionary(arrow_type)
+        )
+    return False
@@ -40,7 +40,7 @@ def missing_data_analysis(
             'total': int,
             'missing': int,
             'pct_missing': float,
-            'missing_count': str (file path to plot)
+            'missing_data_barplot': str (file path to plot)
         }
     """
     logger.info(
@@ -51,19 +51,52 @@ def missing_data_analysis(
         }
     )
 
-    # Build counts (and fill NaNs)
-    status = series.isna().map({False: "Present", True: "Missing"})
-    counts = (
-        status
-        .value_counts()
-        .reindex(["Present", "Missing"])
-        .fillna(0)
-        .astype(int)
+    # Summary stats
+    total   = int(len(series))
+    missing = int(series.isna().sum())
+
+    summary = missing_data_report(series.name, total, missing, report_dir)
+
+    logger.info(
+        "Completed missing_data_analysis",
+        extra={
+            'series_name': series.name,
+            'report_log_id': report_log_id
+        }
     )
+    return summary
 
-    # Summary stats
-    total       = int(counts.sum())
-    missing     = int(counts["Missing"])
+
+def missing_data_report(
+        series_name: str | None,
+        total: int,
+        missing: int,
+        report_dir: Path
+    ) -> dict:
+    """
+    Build the missing data summary and bar plot from precomputed counts.
+
+    Used by `missing_data_analysis` and by analyses that count missing values
+    chunk by chunk without holding the full Series.
+
+    Args:
+        series_name (str | None): Name of the analyzed series (used in title and filename).
+        total (int): Total number of observations.
+        missing (int): Number of missing observations.
+        report_dir (Path): Directory for saving report files.
+
+    Returns:
+        dict: {
+            'total': int,
+            'missing': int,
+            'pct_missing': float,
+            'missing_data_barplot': str (file path to plot)
+        }
+    """
+    counts = pd.Series(
+        [total - missing, missing],
+        index=["Present", "Missing"]
+    )
     pct_missing = missing / total if total else 0.0
 
     summary = {
@@ -106,7 +139,7 @@ def missing_data_analysis(
         )
 
     ax.set_title(
-        f"Missing Data for “{series.name}”: "
+        f"Missing Data for “{series_name}”: "
         f"{missing:,} of {total:,} values "
         f"({pct_missing * 100:.1f}%)",
         pad=12
@@ -119,8 +152,8 @@ def missing_data_analysis(
     plt.tight_layout()
 
     filename = (
-        f"{series.name.replace(' ', '_')}_missing_data_barplot.png"
-        if series.name else
+        f"{series_name.replace(' ', '_')}_missing_data_barplot.png"
+        if series_name else
         "series_missing_data_barplot.png"
     )
     missing_data_count_path = report_dir / filename
@@ -129,11 +162,4 @@ def missing_data_analysis(
 
     summary['missing_data_barplot'] = str(missing_data_count_path)
 
-    logger.info(
-        "Completed missing_data_analysis",
-        extra={
-            'series_name': series.name,
-            'report_log_id': report_log_id
-        }
-    )
     return summary
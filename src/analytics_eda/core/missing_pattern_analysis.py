@@ -0,0 +1,266 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import uuid
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+import matplotlib.pyplot as plt
+
+from .space_saving_counter import SpaceSavingCounter
+
+logger = logging.getLogger(__name__)
+
+
+class MissingPatternAccumulator:
+    """
+    Chunk-by-chunk accumulator of row-wise missingness patterns.
+
+    Each row's null mask is packed into bytes, which are the exact pattern key;
+    pattern frequencies are tracked with a bounded-memory `SpaceSavingCounter`. Per-column missing counts are
+    exact. Accumulators built on different chunks or processes can be merged.
+
+    Args:
+        columns (list[str] | None): Column order of the pattern mask. Taken from the
+            first chunk if None.
+        max_patterns (int): Maximum number of distinct patterns kept in memory.
+    """
+
+    def __init__(self, columns: list[str] | None = None, max_patterns: int = 1000):
+        self.columns = list(columns) if columns is not None else None
+        self.total_rows = 0
+        self.complete_rows = 0
+        self.column_missing = None if columns is None else np.zeros(len(self.columns), dtype=np.int64)
+        self.patterns = SpaceSavingCounter(max_patterns)
+
+    def update(self, chunk: pd.DataFrame) -> "MissingPatternAccumulator":
+        """
+        Add a chunk of rows.
+
+        Args:
+            chunk (pd.DataFrame): Rows to add. Must contain every tracked column.
+
+        Returns:
+            MissingPatternAccumulator: self, to allow chaining.
+        """
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Chunk must be a pandas DataFrame.")
+
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.column_missing = np.zeros(len(self.columns), dtype=np.int64)
+        else:
+            missing_cols = [c for c in self.columns if c not in chunk.columns]
+            if missing_cols:
+                raise KeyError(f"Chunk is missing columns: {missing_cols}")
+            chunk = chunk[self.columns]
+
+        if chunk.empty:
+            return self
+
+        mask = chunk.isna().to_numpy()
+        self.total_rows += mask.shape[0]
+        self.column_missing += mask.sum(axis=0)
+        self.complete_rows += int((~mask.any(axis=1)).sum())
+
+        # Each packed row viewed as one opaque (void) value, so `np.unique`
+        # groups identical patterns exactly, for any number of columns
+        packed = np.ascontiguousarray(np.packbits(mask, axis=1))
+        rows = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+        _, first_idx, counts = np.unique(rows, return_index=True, return_counts=True)
+        keys = [packed[i].tobytes() for i in first_idx]
+        self.patterns.update(keys, counts)
+        return self
+
+    def merge(self, other: "MissingPatternAccumulator") -> "MissingPatternAccumulator":
+        """
+        Merge another accumulator with the same columns into this one.
+
+        Returns:
+            MissingPatternAccumulator: self, to allow chaining.
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+            self.column_missing = np.zeros(len(self.columns), dtype=np.int64)
+        if self.columns != other.columns:
+            raise ValueError("Cannot merge accumulators built on different columns.")
+
+        self.total_rows += other.total_rows
+        self.complete_rows += other.complete_rows
+        self.column_missing += other.column_missing
+        self.patterns.merge(other.patterns)
+        return self
+
+    def decode(self, key: bytes) -> list[str]:
+        """
+        Return the names of the missing columns encoded in a pattern key.
+        """
+        bits = np.unpackbits(np.frombuffer(key, dtype=np.uint8))[:len(self.columns)]
+        return [self.columns[i] for i in np.flatnonzero(bits)]
+
+    def result(self, top_k: int = 20) -> dict:
+        """
+        Summarize the accumulated missingness patterns.
+
+        Args:
+            top_k (int): Number of most frequent patterns to report.
+
+        Returns:
+            dict: See `missing_pattern_analysis`.
+        """
+        total = self.total_rows
+        columns = self.columns or []
+        column_missing = self.column_missing if self.column_missing is not None else []
+
+        patterns = []
+        for key, count, error in self.patterns.top(top_k):
+            missing_columns = self.decode(key)
+            patterns.append({
+                'missing_columns': missing_columns,
+                'n_missing_columns': len(missing_columns),
+                'count': int(count),
+                'proportion': count / total if total else 0.0,
+                'max_overcount': int(error)
+            })
+
+        return {
+            'total_rows': int(total),
+            'n_columns': len(columns),
+            'complete_rows': int(self.complete_rows),
+            'pct_complete': self.complete_rows / total if total else 0.0,
+            'columns': {
+                col: {
+                    'missing': int(missing),
+                    'pct_missing': missing / total if total else 0.0
+                }
+                for col, missing in zip(columns, column_missing)
+            },
+            'distinct_patterns_tracked': len(self.patterns),
+            'untracked_pattern_max_count': int(self.patterns.floor),
+            'patterns': patterns
+        }
+
+
+def missing_pattern_analysis(
+        data: pd.DataFrame | Iterable[pd.DataFrame],
+        report_dir: Path | None = None,
+        max_patterns: int = 1000,
+        top_k: int = 20,
+        report_log_id = str(uuid.uuid4())
+    ) -> dict:
+    """
+    Find which combinations of columns are missing together.
+
+    Each row's null mask is packed into bytes (the exact pattern key), and pattern frequencies are
+    counted with bounded memory (Space-Saving heavy hitters), so the analysis can run
+    over tables that do not fit in memory by passing an iterable of chunks.
+
+    Args:
+        data (pd.DataFrame | Iterable[pd.DataFrame]): DataFrame or iterable of chunks
+            with identical columns.
+        report_dir (Path | None): Directory for saving the pattern plot. No plot if None.
+        max_patterns (int): Maximum number of distinct patterns kept in memory.
+        top_k (int): Number of most frequent patterns to report.
+        report_log_id (str): report log id.
+
+    Returns:
+        dict: {
+            'total_rows': int,
+            'n_columns': int,
+            'complete_rows': int,
+            'pct_complete': float,
+            'columns': {col: {'missing': int, 'pct_missing': float}},
+            'distinct_patterns_tracked': int,
+            'untracked_pattern_max_count': int,
+            'patterns': [{
+                'missing_columns': list[str],
+                'n_missing_columns': int,
+                'count': int,
+                'proportion': float,
+                'max_overcount': int
+            }, ...],
+            'missing_pattern_plot': str (file path to plot, only if report_dir is set)
+        }
+
+        Pattern counts are exact while fewer than `max_patterns` distinct patterns
+        exist; otherwise they over-count by at most `max_overcount`.
+    """
+    logger.info(
+        "Starting missing_pattern_analysis",
+        extra={
+            'report_log_id': report_log_id
+        }
+    )
+
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+
+    accumulator = MissingPatternAccumulator(max_patterns=max_patterns)
+    for chunk in chunks:
+        accumulator.update(chunk)
+
+    summary = accumulator.result(top_k)
+
+    if report_dir is not None and summary['patterns']:
+        summary['missing_pattern_plot'] = str(_plot_missing_patterns(summary, Path(report_dir)))
+
+    logger.info(
+        "Completed missing_pattern_analysis",
+        extra={
+            'report_log_id': report_log_id
+        }
+    )
+    return summary
+
+
+def _plot_missing_patterns(summary: dict, report_dir: Path) -> Path:
+    """
+    Save a pattern x column matrix of the most frequent missingness patterns.
+    """
+    report_dir.mkdir(parents=True, exist_ok=True)
+
+    patterns = summary['patterns']
+    columns = [
+        col for col in summary['columns']
+        if any(col in p['missing_columns'] for p in patterns)
+    ] or list(summary['columns'])
+
+    matrix = pd.DataFrame(
+        [[col in p['missing_columns'] for col in columns] for p in patterns],
+        columns=columns,
+        index=[f"{p['count']:,} ({p['proportion'] * 100:.1f}%)" for p in patterns]
+    ).astype(int)
+
+    fig, ax = plt.subplots(figsize=(max(8, 0.4 * len(columns)), max(4, 0.4 * len(patterns))))
+    sns.heatmap(
+        matrix,
+        cmap=["#4A5568", "#2D9CDB"],
+        cbar=False,
+        linewidths=0.5,
+        linecolor="white",
+        ax=ax
+    )
+    ax.set_title("Most Frequent Missingness Patterns (blue = missing)", pad=12)
+    ax.set_xlabel("")
+    ax.set_ylabel("Rows (share of total)", labelpad=8)
+    plt.tight_layout()
+
+    path = report_dir / "missing_pattern_matrix.png"
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+    return path
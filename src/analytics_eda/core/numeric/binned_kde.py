@@ -0,0 +1,133 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+binned_kde.py
+
+Gaussian kernel density estimation on a regular grid in O(n + g log g).
+
+The data are linearly binned onto the grid (each value splits its weight between
+the two nearest grid points) and the bin counts are convolved with the sampled
+kernel via FFT, instead of evaluating every kernel at every grid point
+(O(n * g), as `scipy.stats.gaussian_kde` does).
+
+Functions:
+- kde_bandwidth(values, method='scott', bw_adjust=1.0):
+    Kernel standard deviation from a selection rule or a fixed value.
+- binned_kde(values, grid=None, grid_size=512, bandwidth='scott', bw_adjust=1.0, cut=3.0):
+    Density of `values` on a regular grid.
+"""
+import numpy as np
+from scipy.signal import fftconvolve
+
+_BANDWIDTH_RULES = {
+    # Same factors as scipy.stats.gaussian_kde (and therefore seaborn)
+    'scott': lambda n: n ** (-1 / 5),
+    'silverman': lambda n: (n * 3 / 4) ** (-1 / 5),
+}
+
+
+def kde_bandwidth(values: np.ndarray, method: str | float = 'scott', bw_adjust: float = 1.0) -> float:
+    """
+    Select the Gaussian kernel bandwidth (standard deviation) for `values`.
+
+    Args:
+        values (np.ndarray): 1-D data without missing values.
+        method (str | float): 'scott' or 'silverman' (rule-of-thumb factor times the
+            sample standard deviation, as in `scipy.stats.gaussian_kde`), or a
+            positive number used as the bandwidth directly.
+        bw_adjust (float): Multiplier applied to the selected bandwidth.
+
+    Returns:
+        float: Kernel bandwidth.
+
+    Raises:
+        ValueError: If the method is unknown or the bandwidth is not positive
+            (e.g. fewer than two distinct values).
+    """
+    if isinstance(method, str):
+        if method not in _BANDWIDTH_RULES:
+            raise ValueError(f"Unknown bandwidth method: {method!r}. Use one of {sorted(_BANDWIDTH_RULES)} or a number.")
+        values = np.asarray(values, dtype=float)
+        n = len(values)
+        std = values.std(ddof=1) if n > 1 else 0.0
+        bandwidth = _BANDWIDTH_RULES[method](n) * std if n else 0.0
+    else:
+        bandwidth = float(method)
+
+    bandwidth *= bw_adjust
+    if not np.isfinite(bandwidth) or bandwidth <= 0:
+        raise ValueError("KDE bandwidth must be positive; the data may be constant or too small.")
+    return float(bandwidth)
+
+
+def binned_kde(
+    values: np.ndarray,
+    grid: np.ndarray | None = None,
+    grid_size: int = 512,
+    bandwidth: str | float = 'scott',
+    bw_adjust: float = 1.0,
+    cut: float = 3.0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gaussian KDE of `values` on a regular grid via linear binning and FFT convolution.
+
+    Args:
+        values (np.ndarray): 1-D data without missing values.
+        grid (np.ndarray | None): Evenly spaced evaluation points. If None, `grid_size`
+            points spanning the data extended by `cut` bandwidths on each side.
+        grid_size (int): Number of grid points when `grid` is None.
+        bandwidth (str | float): Bandwidth rule or value (see `kde_bandwidth`).
+        bw_adjust (float): Multiplier applied to the bandwidth.
+        cut (float): Extension of the default grid beyond the data, in bandwidths.
+
+    Returns:
+        tuple: (grid, density) arrays of equal length. Mass falling outside an
+            explicit grid is dropped, so the density integrates to the share of
+            the data covered by the grid. A bandwidth below the grid spacing
+            keeps the mass but not the shape of the kernel.
+    """
+    values = np.asarray(values, dtype=float)
+    bw = kde_bandwidth(values, bandwidth, bw_adjust)
+
+    if grid is None:
+        grid = np.linspace(values.min() - cut * bw, values.max() + cut * bw, grid_size)
+    grid = np.asarray(grid, dtype=float)
+    g = len(grid)
+    if g < 2:
+        raise ValueError("The grid must have at least two points.")
+    delta = (grid[-1] - grid[0]) / (g - 1)
+
+    # Linear binning: split each value between its two neighbouring grid points
+    pos = (values - grid[0]) / delta
+    inside = (pos >= 0) & (pos <= g - 1)
+    pos = pos[inside]
+    left = np.minimum(np.floor(pos).astype(np.intp), g - 2)
+    frac = pos - left
+    counts = (
+        np.bincount(left, weights=1 - frac, minlength=g)
+        + np.bincount(left + 1, weights=frac, minlength=g)
+    )
+
+    # Kernel sampled at the grid spacing, truncated at 4 bandwidths (or the grid)
+    full_half_width = int(np.ceil(4 * bw / delta))
+    half_width = min(g - 1, full_half_width)
+    offsets = np.arange(-half_width, half_width + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2) / (bw * np.sqrt(2 * np.pi))
+    if half_width == full_half_width:
+        # Make the sampled kernel carry unit mass; a bandwidth narrower than the
+        # grid spacing would otherwise lose (or gain) most of it between samples
+        kernel /= kernel.sum() * delta
+
+    density = fftconvolve(counts, kernel, mode='same') / len(values)
+    return grid, np.maximum(density, 0.0)
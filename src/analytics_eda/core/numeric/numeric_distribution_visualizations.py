@@ -22,6 +22,7 @@ import pandas as pd
 from scipy.stats import probplot
 
 from .validate_numeric_named_series import validate_numeric_named_series
+from .binned_kde import binned_kde
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,8 @@ def numeric_distribution_visualizations(
     s: pd.Series,
     report_dir: Path,
     transform: str = "raw",
-    report_log_id: str = str(uuid.uuid4())
+    report_log_id: str = str(uuid.uuid4()),
+    kde_bandwidth: str | float = 'scott'
 ) -> dict:
     """
     Display and save distribution plots for a numeric Series, annotating
@@ -50,9 +52,12 @@ def numeric_distribution_visualizations(
         transform (str): Label for the data transformation applied
                          (e.g. "raw", "box-cox", "yeo-johnson").
         report_log_id (str): report log id.
+        kde_bandwidth (str | float): Bandwidth rule ('scott', 'silverman') or value
+                         for the KDE overlay (see `kde_bandwidth`).
 
     Returns:
         dict: Mapping from plot type to saved filepath.
+              The KDE overlay uses the binned FFT estimator (`binned_kde`).
     """
     # 1. Input validation
     validate_numeric_named_series(s)
@@ -103,12 +108,22 @@ def numeric_distribution_visualizations(
     sns.histplot(
         s_clean,
         stat='density',       # show density instead of raw counts
-        kde=True,
         element='step',       # cleaner histogram edge
         fill=True,
         alpha=0.4,
         ax=ax
     )
+    if s_clean.nunique() > 1:
+        kde_grid, kde_density = binned_kde(s_clean.to_numpy(dtype=float), bandwidth=kde_bandwidth)
+        ax.plot(kde_grid, kde_density, color=ax.patches[0].get_edgecolor() if ax.patches else None, linewidth=1.5)
+    else:
+        logger.warning(
+            "numeric_distribution_visualizations: Skipped KDE overlay (constant data has no density)",
+            extra={
+                'series_name': s.name,
+                'report_log_id': report_log_id
+            }
+        )
 
     # Compute and plot mean & median
     mean_val = s_clean.mean()
@@ -138,16 +138,7 @@ def compute_bin_rule(
     clean = clean_series(series)
 
     # 2. Determine number of bins
-    if rule == 'sturges':
-        k = sturges_bins(clean)
-    elif rule == 'scott':
-        k = scott_bins(clean)
-    elif rule == 'freedman-diaconis':
-        k = freedman_diaconis_bins(clean)
-    elif rule == 'doane':
-        k = doane_bins(clean)
-    else:
-        raise ValueError(f"Unknown binning rule: {rule!r}")
+    k = rule_bin_count(clean, rule=rule)
 
     # 3. Compute edges and counts
     edges = np.histogram_bin_edges(clean, bins=k)
@@ -155,6 +146,30 @@ def compute_bin_rule(
 
     return k, edges, counts
 
+def rule_bin_count(series: pd.Series, rule: str = 'sturges') -> int:
+    """
+    Number of histogram bins for a numeric Series according to a binning rule.
+
+    Args:
+        series (pd.Series): Numeric data. NAs will be dropped.
+        rule (str): 'sturges', 'scott', 'freedman-diaconis', or 'doane'.
+
+    Returns:
+        int: Number of bins.
+
+    Raises:
+        ValueError: If the rule is unknown or cannot be applied to the data.
+    """
+    if rule == 'sturges':
+        return sturges_bins(series)
+    if rule == 'scott':
+        return scott_bins(series)
+    if rule == 'freedman-diaconis':
+        return freedman_diaconis_bins(series)
+    if rule == 'doane':
+        return doane_bins(series)
+    raise ValueError(f"Unknown binning rule: {rule!r}")
+
 def sturges_bins(series: pd.Series) -> int:
     """
     Compute number of histogram bins using Sturges' Rule.
@@ -0,0 +1,154 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+space_saving_counter.py
+
+Bounded-memory heavy-hitter counting (Space-Saving / mergeable summaries).
+
+The counter monitors at most `capacity` keys. Every monitored key carries an
+over-estimated count and an error bound such that
+
+    count - error <= true_count <= count
+
+and any key that is not monitored has a true count no larger than `floor`.
+Counters built on different chunks or processes can be merged.
+"""
+import heapq
+from typing import Hashable, Iterable, Mapping
+
+import numpy as np
+
+
+class SpaceSavingCounter:
+    """
+    Mergeable Space-Saving heavy-hitter summary.
+
+    Args:
+        capacity (int): Maximum number of keys to monitor.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+        self.capacity = int(capacity)
+        self.total = 0
+        self.floor = 0
+        self._counts: dict[Hashable, int] = {}
+        self._errors: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key) -> bool:
+        return key in self._counts
+
+    def update(self, keys: Iterable[Hashable] | Mapping[Hashable, int], counts: Iterable[int] | None = None) -> "SpaceSavingCounter":
+        """
+        Add a batch of observations.
+
+        Args:
+            keys: Keys of the batch, or a mapping key -> count.
+            counts: Weight of each key. If None, `keys` is either a mapping or every
+                key is counted once (duplicates are aggregated).
+
+        Returns:
+            SpaceSavingCounter: self, to allow chaining.
+        """
+        if isinstance(keys, Mapping):
+            counts = list(keys.values())
+            keys = list(keys.keys())
+        elif counts is None:
+            keys, counts = np.unique(np.asarray(list(keys), dtype=object), return_counts=True)
+
+        if not isinstance(keys, np.ndarray):
+            keys = list(keys)
+        counts = np.asarray(counts, dtype=np.int64)
+        if len(keys) != len(counts):
+            raise ValueError("keys and counts must have the same length.")
+        if not len(keys):
+            return self
+
+        batch_total = int(counts.sum())
+
+        # An exact batch larger than the capacity is itself truncated to a
+        # Space-Saving summary: dropped keys only raise the floor.
+        floor = 0
+        if len(counts) > self.capacity:
+            keep = np.argpartition(-counts, self.capacity - 1)[:self.capacity]
+            dropped = np.ones(len(counts), dtype=bool)
+            dropped[keep] = False
+            floor = int(counts[dropped].max())
+            keys = keys[keep] if isinstance(keys, np.ndarray) else [keys[i] for i in keep]
+            counts = counts[keep]
+
+        if isinstance(keys, np.ndarray):
+            keys = keys.tolist()
+        batch_counts = dict(zip(keys, counts.tolist()))
+        self._merge(batch_counts, dict.fromkeys(batch_counts, 0), floor, batch_total)
+        return self
+
+    def merge(self, other: "SpaceSavingCounter") -> "SpaceSavingCounter":
+        """
+        Merge another counter (e.g. built on a different chunk or process) into this one.
+
+        Returns:
+            SpaceSavingCounter: self, to allow chaining.
+        """
+        self._merge(other._counts, other._errors, other.floor, 0)
+        self.total += other.total
+        return self
+
+    def _merge(self, counts: dict, errors: dict, floor: int, added_total: int) -> None:
+        own_counts, own_errors, own_floor = self._counts, self._errors, self.floor
+
+        merged_counts = {}
+        merged_errors = {}
+        for key in own_counts.keys() | counts.keys():
+            merged_counts[key] = own_counts.get(key, own_floor) + counts.get(key, floor)
+            merged_errors[key] = own_errors.get(key, own_floor) + errors.get(key, floor)
+
+        new_floor = own_floor + floor
+        if len(merged_counts) > self.capacity:
+            kept = heapq.nlargest(self.capacity, merged_counts.items(), key=lambda kv: kv[1])
+            kept_keys = {k for k, _ in kept}
+            dropped_max = max(c for k, c in merged_counts.items() if k not in kept_keys)
+            new_floor = max(new_floor, dropped_max)
+            merged_counts = dict(kept)
+            merged_errors = {k: merged_errors[k] for k in merged_counts}
+
+        self._counts = merged_counts
+        self._errors = merged_errors
+        self.floor = new_floor
+        self.total += added_total
+
+    def estimate(self, key: Hashable) -> int:
+        """
+        Upper-bound estimate of the count of `key`.
+        """
+        return self._counts.get(key, self.floor)
+
+    def top(self, k: int | None = None) -> list[tuple[Hashable, int, int]]:
+        """
+        Return the `k` most frequent monitored keys.
+
+        Args:
+            k (int | None): Number of keys to return. All monitored keys if None.
+
+        Returns:
+            list[tuple]: (key, count, error) tuples sorted by descending count.
+        """
+        items = sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True)
+        if k is not None:
+            items = items[:k]
+        return [(key, count, self._errors[key]) for key, count in items]
@@ -0,0 +1,177 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+from typing import Iterable, Iterator
+import logging
+import uuid
+import pandas as pd
+
+from ...core import write_json_report, categorical_inferential_analysis
+from ...core.missing_data_analysis import missing_data_report
+from ...core.categorical.categorical_accumulator import CategoricalAccumulator
+from ...core.categorical.categorical_distribution_analysis import categorical_distribution_report
+
+logger = logging.getLogger(__name__)
+
+def iter_parquet_column(
+    source: str | Path,
+    column: str,
+    batch_size: int = 1_000_000
+) -> Iterator[pd.Series]:
+    """
+    Yield a column of a Parquet file or (partitioned) dataset as Arrow-backed
+    pandas Series chunks (`pd.ArrowDtype`), without object materialisation.
+
+    Args:
+        source (str | Path): Parquet file or dataset directory.
+        column (str): Column to read.
+        batch_size (int): Maximum rows per chunk.
+
+    Yields:
+        pd.Series: Chunk of `column`, named `column`.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet requires pyarrow. Install it with `pip install analytics-eda[arrow]`."
+        ) from e
+
+    dataset = ds.dataset(str(source), format="parquet")
+    for batch in dataset.to_batches(columns=[column], batch_size=batch_size):
+        # Wrap the Arrow column without copying or converting to Python objects
+        yield pd.Series(pd.arrays.ArrowExtensionArray(batch.column(0)), name=column)
+
+def streaming_univariate_categorical_analysis(
+    chunks: Iterable[pd.Series] | str | Path,
+    column: str | None = None,
+    top_n: int = 10,
+    report_root: str = 'reports/eda/univariate/categorical',
+    rare_threshold: float = 0.01,
+    alpha: float = 0.05,
+    report_log_id = str(uuid.uuid4()),
+    table_top_k: int | None = None,
+    batch_size: int = 1_000_000
+) -> Path:
+    """
+    Run the full univariate categorical analysis over a column that arrives in chunks.
+
+    Chunks are reduced one at a time into a mergeable `CategoricalAccumulator`, so
+    only the distinct categories are held in memory. The report has the same
+    structure as `univariate_categorical_analysis` on the concatenated column:
+    missing data, frequency distribution and top-N plot, rare categories and the
+    chi-square goodness-of-fit test.
+
+    Args:
+        chunks (Iterable[pd.Series] | str | Path): Iterable of categorical Series chunks,
+            or a path to a Parquet file / dataset directory (requires `column`).
+        column (str | None): Column name. Required for Parquet input; for chunk
+            iterables it overrides the chunk name.
+        top_n (int, optional): Number of leading categories in the bar plot. Defaults to 10.
+        report_root (str, optional): Directory path for saving plots and report.
+            Defaults to 'reports/eda/univariate/categorical'.
+        rare_threshold (float, optional): Proportion threshold for rare-category detection.
+            Defaults to 0.01.
+        alpha (float, optional): Significance level for inferential testing. Defaults to 0.05.
+        report_log_id (str): report log id.
+        table_top_k (int | None, optional): If set, only the most frequent `table_top_k`
+            categories are written to the frequency table. Defaults to None (full table).
+        batch_size (int, optional): Rows per chunk when reading Parquet. Defaults to 1,000,000.
+
+    Returns:
+        Path: File path to the saved JSON report as written by `write_json_report`.
+
+    Raises:
+        ValueError: If no column name can be determined or no rows were read.
+    """
+    if isinstance(chunks, (str, Path)):
+        if column is None:
+            raise ValueError("'column' is required when reading from Parquet.")
+        chunks = iter_parquet_column(chunks, column, batch_size=batch_size)
+
+    # 1. Accumulate chunks
+    accumulator = CategoricalAccumulator(name=column)
+    for chunk in chunks:
+        accumulator.update(chunk)
+
+    name = accumulator.name
+    if name is None or str(name).strip() == "":
+        raise ValueError("Chunks must have a non-empty 'name' attribute or 'column' must be given.")
+    if accumulator.total == 0:
+        raise ValueError(f"No rows were read for '{name}'.")
+
+    logger.info(
+        "Starting streaming_univariate_categorical_analysis",
+        extra={
+            'series_name': name,
+            'report_log_id': report_log_id
+        }
+    )
+
+    save_dir = Path(report_root) / name.replace(' ', '_')
+    save_dir.mkdir(parents=True, exist_ok=True)
+
+    frequencies = accumulator.frequency_counts()
+    total = frequencies['total']
+    counts = frequencies['counts']
+
+    # 2. Missing Data Analysis
+    missing_data = missing_data_report(name, total, frequencies['missing'], save_dir)
+
+    # 3. Distribution Analysis
+    distribution = categorical_distribution_report(frequencies, name, save_dir, top_n, table_top_k)
+
+    # 4. Outlier Analysis
+    rare_mask = counts / total < rare_threshold
+    outliers = {
+        'rare_categories': frequencies['labels'][rare_mask].tolist(),
+    }
+
+    # 5. Inferential Analysis
+    inferential = categorical_inferential_analysis(counts, total, alpha)
+
+    # 6. Generate report
+    eda_report = {
+        'missing_data': missing_data,
+        'distribution': distribution,
+        'outliers': outliers,
+        'inferential': inferential
+    }
+
+    full_report = {
+        'metadata': {
+            'version': '0.1.0',
+            'report_name': 'univariate_categorical_analysis',
+            'parameters': {
+                'series': name
+            }
+        },
+        'eda': eda_report
+    }
+
+    report_path = save_dir / f"{name.replace(' ', '_')}_univariate_analysis_report.json"
+    write_json_report(full_report, report_path)
+
+    logger.info(
+        "Completed streaming_univariate_categorical_analysis",
+        extra={
+            'series_name': name,
+            'report_log_id': report_log_id
+        }
+    )
+
+    return report_path
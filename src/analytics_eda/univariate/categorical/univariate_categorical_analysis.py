@@ -26,7 +26,10 @@ def univariate_categorical_analysis(
     report_root: str = 'reports/eda/univariate/categorical',
     rare_threshold: float = 0.01,
     alpha: float = 0.05,
-    report_log_id = str(uuid.uuid4())
+    report_log_id = str(uuid.uuid4()),
+    table_top_k: int | None = None,
+    frequency_mode: str = 'exact',
+    sketch_capacity: int = 1000
 ) -> Path:
     """
     Run a full univariate analysis on a named categorical pandas Series and save results.
@@ -49,6 +52,17 @@ def univariate_categorical_analysis(
             Defaults to 0.01.
         alpha (float, optional): Significance level for inferential testing. Defaults to 0.05.
         report_log_id (str): report log id.
+        table_top_k (int | None, optional): If set, only the most frequent `table_top_k`
+            categories are written to the frequency table (remaining categories are
+            summarized as a tail). Rare-category detection and the chi-square test
+            always use every category. Defaults to None (full table).
+        frequency_mode (str, optional): 'exact' (default) or 'bounded'. Bounded mode
+            keeps memory fixed for ultra-high-cardinality columns (see
+            `categorical_distribution_analysis`): rare categories are reported from the
+            tracked heavy hitters plus an estimated summary, and the chi-square test,
+            which needs every exact count, is not computed.
+        sketch_capacity (int, optional): Number of heavy-hitter categories tracked in
+            bounded mode. Defaults to 1000.
 
     Returns:
         Path: File path to the saved JSON report as written by `write_json_report`.
@@ -92,23 +106,49 @@ def univariate_categorical_analysis(
     missing_data = missing_data_analysis(series, save_dir, report_log_id=report_log_id)
 
     # 3. Distribution Analysis
-    distribution_result = categorical_distribution_analysis(series, save_dir, top_n, report_log_id=report_log_id)
-    freq_tbl = distribution_result['report']['frequency_report']['frequency_table']
-
-    # 4. Outlier Analysis
-    # Identify rare categories
-    rare_categories = [
-        cat
-        for cat, stats in freq_tbl.items()
-        if stats['proportion'] < rare_threshold
-    ]
-
-    outliers = {
-        'rare_categories': rare_categories,
-    }
+    distribution_result = categorical_distribution_analysis(
+        series,
+        save_dir,
+        top_n,
+        report_log_id=report_log_id,
+        table_top_k=table_top_k,
+        frequency_mode=frequency_mode,
+        sketch_capacity=sketch_capacity
+    )
+    frequencies = distribution_result['frequencies']
+
+    if frequency_mode == 'bounded':
+        # 4. Outlier Analysis (tracked heavy hitters + estimated rare mass)
+        rare_summary = frequencies.summary(
+            top_k=sketch_capacity,
+            rare_threshold=rare_threshold
+        )['rare_categories']
+        outliers = {
+            'rare_categories': rare_summary.pop('tracked'),
+            'rare_summary': rare_summary
+        }
+
+        # 5. Inferential Analysis
+        inferential = {
+            'goodness_of_fit': {
+                'error': "Chi-square goodness-of-fit requires exact frequencies; not computed in bounded frequency mode.",
+                'report_log_id': report_log_id
+            }
+        }
+    else:
+        counts = frequencies['counts']
+
+        # 4. Outlier Analysis
+        # Identify rare categories
+        rare_mask = counts / total < rare_threshold
+        rare_categories = frequencies['labels'][rare_mask].tolist()
+
+        outliers = {
+            'rare_categories': rare_categories,
+        }
 
-    # 5. Inferential Analysis
-    inferential = categorical_inferential_analysis(freq_tbl, total, alpha)
+        # 5. Inferential Analysis
+        inferential = categorical_inferential_analysis(counts, total, alpha)
 
     # 6. Generate report
     eda_report = {
@@ -1 +1,5 @@
 from .univariate_timeseries_analysis import univariate_timeseries_analysis
+from .batch_univariate_timeseries_analysis import batch_univariate_timeseries_analysis
+from .incremental_timeseries_analyzer import IncrementalTimeSeriesAnalyzer, incremental_univariate_timeseries_analysis
+from .prepare_time_series import prepare_time_series
+from .time_index_profiler import TimeIndexProfiler, profile_time_index
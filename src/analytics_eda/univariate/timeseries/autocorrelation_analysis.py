@@ -0,0 +1,140 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.fft import next_fast_len, rfft, irfft
+
+
+def acf_fft(values: np.ndarray, nlags: int) -> np.ndarray:
+    """
+    Sample autocorrelation function via FFT, in O(n log n).
+
+    Matches `statsmodels.tsa.stattools.acf(values, nlags, fft=True)`: the series is
+    demeaned and autocovariances are divided by n (the biased estimator).
+
+    Args:
+        values (np.ndarray): 1-D array without missing values.
+        nlags (int): Largest lag to return.
+
+    Returns:
+        np.ndarray: Autocorrelations for lags 0..nlags (NaN for a constant series).
+    """
+    x = np.asarray(values, dtype=float)
+    x = x - x.mean()
+    n = len(x)
+    # Zero-pad to avoid circular wrap-around
+    size = next_fast_len(2 * n - 1, real=True)
+    spectrum = rfft(x, n=size)
+    acov = irfft(spectrum * np.conj(spectrum), n=size)[:nlags + 1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return acov / acov[0]
+
+
+def pacf_levinson_durbin(acf: np.ndarray, nlags: int) -> np.ndarray:
+    """
+    Partial autocorrelation function from an ACF with the Levinson-Durbin recursion.
+
+    Solves the Yule-Walker equations for every order up to `nlags` in O(nlags²),
+    which matches `statsmodels.tsa.stattools.pacf(..., method='ywm')` when `acf`
+    comes from `acf_fft`.
+
+    Args:
+        acf (np.ndarray): Autocorrelations for lags 0..nlags (at least).
+        nlags (int): Largest lag to return.
+
+    Returns:
+        np.ndarray: Partial autocorrelations for lags 0..nlags.
+    """
+    pacf = np.empty(nlags + 1)
+    pacf[0] = 1.0
+    phi = np.zeros(nlags + 1)
+    error = 1.0
+    for k in range(1, nlags + 1):
+        reflection = (acf[k] - np.dot(phi[1:k], acf[k - 1:0:-1])) / error
+        previous = phi[1:k].copy()
+        phi[1:k] = previous - reflection * previous[::-1]
+        phi[k] = reflection
+        pacf[k] = reflection
+        error *= 1.0 - reflection * reflection
+    return pacf
+
+
+def autocorrelation_analysis(series: pd.Series | np.ndarray, nlags: int | None = None, alpha: float = 0.05) -> dict:
+    """
+    Compute the ACF, PACF and their confidence bands of a time series.
+
+    The ACF is computed once via FFT and the PACF is derived from it with the
+    Levinson-Durbin recursion, so no regression is fitted per lag. Bands are
+    half-widths around zero, as drawn by statsmodels' `plot_acf` / `plot_pacf`:
+    Bartlett's formula for the ACF and `z / sqrt(n)` for the PACF.
+
+    Args:
+        series (pd.Series | np.ndarray): Series without missing values, in time order.
+        nlags (int | None): Largest lag. Defaults to `min(n // 2, 40)`.
+        alpha (float): Significance level of the bands. Defaults to 0.05.
+
+    Returns:
+        dict: {
+            'n_obs': int,
+            'nlags': int,
+            'alpha': float,
+            'lags': list[int],
+            'acf': list[float],
+            'acf_band': list[float],   # half-width of the ACF band per lag (0 at lag 0)
+            'pacf': list[float],
+            'pacf_band': list[float],  # half-width of the PACF band per lag (0 at lag 0)
+        }
+
+    Raises:
+        ValueError: If the series has fewer than 2 observations.
+    """
+    values = np.asarray(series, dtype=float)
+    n = len(values)
+    if n < 2:
+        raise ValueError("Autocorrelation requires at least 2 observations.")
+    if nlags is None:
+        nlags = min(n // 2, 40)
+    nlags = int(min(max(nlags, 1), n - 1))
+
+    return autocorrelation_report(acf_fft(values, nlags), n, alpha)
+
+
+def autocorrelation_report(acf: np.ndarray, n_obs: int, alpha: float = 0.05) -> dict:
+    """
+    Build the `autocorrelation_analysis` result from an ACF already computed over
+    `n_obs` observations: derives the PACF and both confidence bands.
+    """
+    nlags = len(acf) - 1
+    pacf = pacf_levinson_durbin(acf, nlags)
+
+    z = stats.norm.ppf(1 - alpha / 2)
+    acf_var = np.full(nlags + 1, 1.0 / n_obs)
+    acf_var[0] = 0.0
+    acf_var[2:] *= 1 + 2 * np.cumsum(acf[1:-1] ** 2)
+    acf_band = z * np.sqrt(acf_var)
+
+    pacf_band = np.full(nlags + 1, z / np.sqrt(n_obs))
+    pacf_band[0] = 0.0
+
+    return {
+        'n_obs': int(n_obs),
+        'nlags': nlags,
+        'alpha': alpha,
+        'lags': list(range(nlags + 1)),
+        'acf': acf.tolist(),
+        'acf_band': acf_band.tolist(),
+        'pacf': pacf.tolist(),
+        'pacf_band': pacf_band.tolist()
+    }
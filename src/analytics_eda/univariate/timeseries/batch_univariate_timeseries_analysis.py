@@ -0,0 +1,297 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import logging
+import re
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from ...core.reporting import write_json_report
+from .visualize_time_series_structure import visualize_time_series_structure
+from .autocorrelation_analysis import autocorrelation_analysis
+from .rolling_statistics import rolling_statistics
+from .seasonal_decomposition import seasonal_decomposition
+
+logger = logging.getLogger(__name__)
+
+def batch_univariate_timeseries_analysis(df: pd.DataFrame,
+                                         series_col: str,
+                                         time_col: str,
+                                         numeric_col: str,
+                                         report_root: str = 'reports/eda/univariate/timeseries',
+                                         rolling_window: int | str = 12,
+                                         report_log_id = str(uuid.uuid4()),
+                                         n_jobs: int = 1,
+                                         plot: bool = False) -> Path:
+    """
+    Run the time-series structure analysis for every series of a long-format table.
+
+    The table (`series_col`, `time_col`, `numeric_col`) is projected onto its three
+    columns, the series IDs are factorized once and all rows are ordered by
+    (series, time) with a single sort, so each series is a contiguous, already sorted
+    slice. Each series is then analyzed with `rolling_statistics` (summarized as
+    the range and last value of each rolling statistic), `autocorrelation_analysis`
+    and `seasonal_decomposition`, optionally in a process pool, and a single
+    combined report is written for the whole batch. With `plot=True` each series also gets
+    the `visualize_time_series_structure` plots (rolling statistics, ACF/PACF, STL)
+    in its own subfolder; rendering them takes far longer than the numeric analysis,
+    so batches are numeric-only by default.
+
+    Parameters:
+    - df (pd.DataFrame): Long-format DataFrame with one row per (series, time) observation.
+    - series_col (str): Name of the series ID column.
+    - time_col (str): Name of the datetime column (must be datetime64 dtype).
+    - numeric_col (str): Name of the value column (must be numeric dtype).
+    - report_root (str): Base directory under which a subfolder for this batch
+      will be created.
+    - rolling_window (int | str): Window for rolling statistics, in rows or as a time
+      span such as '7D' (default: 12).
+    - report_log_id (str): report log id.
+    - n_jobs (int): Number of worker processes (1 runs in-process, -1 uses all CPUs).
+      Each worker receives only the values and times of its series.
+    - plot (bool): Save the structure plots of every series (default: False).
+
+    Returns:
+    - pathlib.Path: Path to the combined JSON report.
+
+    Raises:
+    - ValueError: If distinct series IDs have the same string form (e.g. 1 and '1'),
+      since the report is keyed by it.
+    """
+    logger.info(
+        "Starting batch_univariate_timeseries_analysis",
+        extra={
+            'series_col': series_col,
+            'time_col': time_col,
+            'numeric_col': numeric_col,
+            'report_log_id': report_log_id
+        }
+    )
+
+    for col in (series_col, time_col, numeric_col):
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found.")
+    if not pd.api.types.is_datetime64_any_dtype(df[time_col]):
+        raise TypeError(
+            f"Column '{time_col}' is of type {df[time_col].dtype}; "
+            "expected datetime64 dtype. "
+            "Please convert it to datetime in your cleaning pipeline before analysis."
+        )
+    if not pd.api.types.is_numeric_dtype(df[numeric_col]):
+        raise TypeError(
+            f"Column '{numeric_col}' is of type {df[numeric_col].dtype}; "
+            "expected a numeric dtype. "
+            "Please convert it to numeric in your cleaning pipeline before analysis."
+        )
+
+    report_dir = Path(report_root) / f"{series_col.replace(' ', '_')}_{time_col.replace(' ', '_')}_{numeric_col.replace(' ', '_')}"
+    report_dir.mkdir(parents=True, exist_ok=True)
+
+    series_list = _split_series(df, series_col, time_col, numeric_col)
+    series_dirs = _series_dirs([series_id for series_id, _ in series_list], report_dir, series_col) if plot else {}
+
+    series_reports = {}
+    if n_jobs == 1 or len(series_list) <= 1:
+        for series_id, series in series_list:
+            series_reports[series_id] = _series_report(
+                series, series_id, series_dirs.get(series_id), time_col, numeric_col, rolling_window, report_log_id
+            )
+    else:
+        max_workers = None if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                series_id: executor.submit(
+                    _series_report,
+                    series, series_id, series_dirs.get(series_id), time_col, numeric_col, rolling_window, report_log_id
+                )
+                for series_id, series in series_list
+            }
+
+            for series_id, future in futures.items():
+                try:
+                    series_reports[series_id] = future.result()
+                except Exception as e:
+                    # The worker itself failed (e.g. it was killed); keep the remaining series.
+                    logger.exception(
+                        "Time series analysis failed",
+                        extra={
+                            'series': series_id,
+                            'numeric_col': numeric_col,
+                            'report_log_id': report_log_id
+                        }
+                    )
+                    series_reports[series_id] = {
+                        'error': str(e),
+                        'report_log_id': report_log_id
+                    }
+
+    eda_report = {
+        'n_series': len(series_reports),
+        'series': series_reports
+    }
+
+    full_report = {
+        'metadata': {
+            'version': '0.1.0',
+            'report_name': 'batch_univariate_timeseries_analysis',
+            'parameters': {
+                'series_col': series_col,
+                'time_col': time_col,
+                'numeric_col': numeric_col,
+                'rolling_window': rolling_window,
+                'plot': plot
+            }
+        },
+        'eda': eda_report
+    }
+
+    report_path = report_dir / f"{report_dir.name}_batch_univariate_analysis_report.json"
+    write_json_report(full_report, report_path)
+
+    logger.info(
+        "Completed batch_univariate_timeseries_analysis",
+        extra={
+            'series_col': series_col,
+            'time_col': time_col,
+            'numeric_col': numeric_col,
+            'n_series': len(series_reports),
+            'report_log_id': report_log_id
+        }
+    )
+
+    return report_path
+
+
+def _split_series(df: pd.DataFrame, series_col: str, time_col: str, numeric_col: str) -> list[tuple[str, pd.Series]]:
+    """
+    Split a long-format table into time-indexed series with one factorize and one sort.
+
+    Rows with a missing series ID, time or value are dropped. Rows are ordered by
+    (series code, time) with a single stable lexsort, so every series is a
+    contiguous slice that is already in chronological order.
+    """
+    codes, labels = pd.factorize(df[series_col], sort=True, use_na_sentinel=True)
+    times = pd.DatetimeIndex(df[time_col])
+    values = df[numeric_col].to_numpy()
+
+    keep = (codes >= 0) & ~times.isna() & ~pd.isna(values)
+    rows = np.flatnonzero(keep)
+    order = rows[np.lexsort((times.asi8[rows], codes[rows]))]
+
+    codes = codes[order]
+    times = times[order]
+    values = values[order]
+    counts = np.bincount(codes, minlength=len(labels))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    # The report is keyed by the string form of the ID, which must stay unique
+    keys = pd.Series([str(label) for label in labels])
+    duplicated = keys[keys.duplicated(keep=False)]
+    if len(duplicated):
+        clashes = sorted({repr(labels[i]) for i in duplicated.index})
+        raise ValueError(f"Series IDs {', '.join(clashes)} in '{series_col}' have the same string form.")
+
+    series_list = []
+    for i, label in enumerate(keys):
+        start, end = offsets[i], offsets[i + 1]
+        if start == end:
+            continue
+        index = pd.DatetimeIndex(times[start:end], name=time_col)
+        series_list.append((label, pd.Series(values[start:end], index=index, name=numeric_col)))
+    return series_list
+
+
+def _series_dirs(series_ids: list[str], report_dir: Path, series_col: str) -> dict[str, Path]:
+    """
+    One plot directory per series directly under `report_dir`.
+
+    Path separators and other characters outside letters, digits, '-' and '_' are
+    replaced by '_', so an ID cannot point outside `report_dir`; IDs that become
+    equal after this are told apart by a numeric suffix.
+    """
+    unsafe = re.compile(r'[^\w-]+')
+    dirs, used = {}, set()
+    for series_id in series_ids:
+        name = unsafe.sub('_', f"{series_col}_{series_id}")
+        candidate, suffix = name, 1
+        while candidate in used:
+            suffix += 1
+            candidate = f"{name}_{suffix}"
+        used.add(candidate)
+        dirs[series_id] = report_dir / candidate
+    return dirs
+
+
+def _rolling_summary(rolling: pd.DataFrame) -> dict:
+    """
+    Compact numeric summary of `rolling_statistics`: min, max and last value per statistic.
+    """
+    summary = {}
+    for name, column in rolling.items():
+        values = column.dropna()
+        summary[name] = {
+            'min': float(values.min()) if len(values) else None,
+            'max': float(values.max()) if len(values) else None,
+            'last': float(values.iloc[-1]) if len(values) else None
+        }
+    return summary
+
+
+def _series_report(series: pd.Series,
+                   series_id: str,
+                   series_dir: Path | None,
+                   time_col: str,
+                   numeric_col: str,
+                   rolling_window: int | str,
+                   report_log_id: str) -> dict:
+    """
+    Analyze one series (in-process or in a worker); plots are saved to `series_dir`
+    unless it is None.
+    """
+    try:
+        rolling = rolling_statistics(series, rolling_window, min_periods=1)
+        autocorrelation = autocorrelation_analysis(series)
+        decomposition = seasonal_decomposition(series)
+        report = {
+            'n_obs': int(len(series)),
+            'start': series.index[0].isoformat(),
+            'end': series.index[-1].isoformat(),
+            'rolling': _rolling_summary(rolling),
+            'autocorrelation': autocorrelation,
+            'seasonality': decomposition[0]
+        }
+        if series_dir is not None:
+            report['visuals'] = visualize_time_series_structure(
+                series, numeric_col, time_col, series_dir, rolling_window,
+                report_log_id=report_log_id, autocorrelation=autocorrelation,
+                decomposition=decomposition, rolling=rolling
+            )
+        return report
+    except Exception as e:
+        # NOTE: If one series fails we still want to continue with the remaining series.
+        logger.exception(
+            "Time series analysis failed",
+            extra={
+                'series': series_id,
+                'numeric_col': numeric_col,
+                'report_log_id': report_log_id
+            }
+        )
+        return {
+            'error': str(e),
+            'report_log_id': report_log_id
+        }
@@ -0,0 +1,40 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+
+def block_average(series: pd.Series, max_points: int | None) -> tuple[pd.Series, int]:
+    """
+    Average consecutive blocks of equal size so that at most `max_points` values remain.
+
+    Each block is labelled with the index of its first row. The last block may be shorter.
+
+    Args:
+        series (pd.Series): Series without missing values, sorted by time.
+        max_points (int | None): Maximum number of values to keep; None keeps the series.
+
+    Returns:
+        tuple:
+            averaged (pd.Series): Block means (`series` itself if no averaging is needed).
+            block_size (int): Number of input values per block (1 if unchanged).
+    """
+    if max_points is None or len(series) <= max_points:
+        return series, 1
+
+    block_size = int(np.ceil(len(series) / max_points))
+    starts = np.arange(0, len(series), block_size)
+    sums = np.add.reduceat(series.to_numpy(dtype=float), starts)
+    sizes = np.diff(np.append(starts, len(series)))
+    return pd.Series(sums / sizes, index=series.index[starts], name=series.name), block_size
@@ -0,0 +1,100 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+
+def detect_change_points(values: np.ndarray,
+                         max_change_points: int = 10,
+                         min_segment_size: int | None = None,
+                         penalty: float | None = None) -> dict:
+    """
+    Detect shifts in the mean by binary segmentation over cumulative sums.
+
+    Each segment is scored for every split point at once from prefix sums: the
+    reduction in squared error of splitting [a, b) at k is
+    `S_l² / n_l + S_r² / n_r - S² / n`. The best split is kept if its gain exceeds
+    the penalty, and both halves are searched again, strongest gain first. One level
+    of the recursion costs O(n), so the whole scan is O(n log n) for balanced splits.
+
+    Args:
+        values (np.ndarray): Values in time order, without missing entries.
+        max_change_points (int): Maximum number of change points. Defaults to 10.
+        min_segment_size (int | None): Minimum length of a segment. Defaults to
+            `max(5, n // 100)`.
+        penalty (float | None): Minimum gain for a split. Defaults to the BIC-style
+            `2 * sigma² * log(n)`, with sigma estimated robustly from first differences.
+
+    Returns:
+        dict: {
+            'n_change_points': int,
+            'change_points': list[int],   # positions where a new segment starts
+            'segment_means': list[float],
+            'penalty': float
+        }
+    """
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    if min_segment_size is None:
+        min_segment_size = max(5, n // 100)
+    min_segment_size = max(int(min_segment_size), 1)
+
+    if penalty is None:
+        # MAD of first differences is insensitive to the mean shifts themselves
+        sigma = np.median(np.abs(np.diff(x) - np.median(np.diff(x)))) / (0.6745 * np.sqrt(2)) if n > 2 else 0.0
+        if sigma == 0 and n > 1:
+            sigma = np.std(x) or 1.0
+        penalty = 2 * sigma ** 2 * np.log(max(n, 2))
+
+    shifted = x - x.mean() if n else x
+    prefix = np.concatenate(([0.0], np.cumsum(shifted)))
+
+    def best_split(start: int, end: int):
+        length = end - start
+        if length < 2 * min_segment_size:
+            return None
+        k = np.arange(start + min_segment_size, end - min_segment_size + 1)
+        left = prefix[k] - prefix[start]
+        right = prefix[end] - prefix[k]
+        total = prefix[end] - prefix[start]
+        gain = left ** 2 / (k - start) + right ** 2 / (end - k) - total ** 2 / length
+        i = int(np.argmax(gain))
+        return float(gain[i]), int(k[i])
+
+    change_points = []
+    candidates = {}
+    split = best_split(0, n)
+    if split is not None:
+        candidates[(0, n)] = split
+    while candidates and len(change_points) < max_change_points:
+        segment = max(candidates, key=lambda seg: candidates[seg][0])
+        gain, k = candidates.pop(segment)
+        if gain <= penalty:
+            break
+        change_points.append(k)
+        for child in ((segment[0], k), (k, segment[1])):
+            split = best_split(*child)
+            if split is not None:
+                candidates[child] = split
+
+    change_points.sort()
+    bounds = [0] + change_points + [n]
+    segment_means = [
+        float(x[a:b].mean()) for a, b in zip(bounds[:-1], bounds[1:]) if b > a
+    ]
+    return {
+        'n_change_points': len(change_points),
+        'change_points': change_points,
+        'segment_means': segment_means,
+        'penalty': float(penalty)
+    }
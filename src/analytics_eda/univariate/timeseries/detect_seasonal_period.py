@@ -0,0 +1,147 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from scipy import stats
+from scipy.fft import rfft
+from scipy.signal import detrend
+
+from .autocorrelation_analysis import acf_fft
+
+SEASONAL_PERIOD_METHODS = ('periodogram', 'acf')
+
+
+def detect_seasonal_period(values: np.ndarray,
+                           method: str = 'periodogram',
+                           max_period: int | None = None,
+                           alpha: float = 0.05) -> dict:
+    """
+    Detect the dominant seasonal period of an evenly spaced series, in samples.
+
+    Works on any sampling frequency: the period is found from the data, not from
+    the index frequency.
+
+    Both methods work on the linearly detrended series, pre-whitened with its
+    lag-1 autocorrelation (`x[t] - phi * x[t - 1]`) so that smooth
+    non-seasonal dependence (random walks, AR(1) processes) does not pass for a
+    long period. A seasonal component survives the filter as a peak.
+
+    - 'periodogram': the series is transformed once with an FFT and
+      the strongest frequency whose period lies in [2, max_period] is tested with
+      Fisher's g statistic (peak power over total power). The Nyquist frequency
+      is not tested, so a period of exactly 2 is only found in odd-length series.
+    - 'acf': after the FFT autocorrelation first falls below the `z / sqrt(n)`
+      band, the highest lag of each later excursion above the band is a
+      candidate. The first candidate that the autocorrelation confirms around
+      its second and third multiples (those within `2 * max_period` lags, at
+      least one) is the period.
+
+    Args:
+        values (np.ndarray): Evenly spaced values without missing entries.
+        method (str): 'periodogram' or 'acf'. Defaults to 'periodogram'.
+        max_period (int | None): Largest period considered. Defaults to `n // 2`,
+            the longest period STL can fit with two full cycles.
+        alpha (float): Significance level of the detection. Defaults to 0.05.
+
+    Returns:
+        dict: {
+            'method': str,
+            'period': int | None,   # None when no significant period is found
+            'strength': float,      # Fisher's g (periodogram) or ACF peak (acf)
+            'p_value': float | None # Fisher's g p-value (periodogram only)
+        }
+
+    Raises:
+        ValueError: If `method` is not supported.
+    """
+    if method not in SEASONAL_PERIOD_METHODS:
+        raise ValueError(f"Unsupported method '{method}'. Use one of {SEASONAL_PERIOD_METHODS}.")
+
+    # Remove a linear trend so it does not dominate the low frequencies / lags
+    x = detrend(np.asarray(values, dtype=float)) if len(values) > 1 else np.asarray(values, dtype=float)
+    n = len(x)
+    if max_period is None:
+        max_period = n // 2
+    max_period = min(int(max_period), n // 2)
+
+    result = {'method': method, 'period': None, 'strength': None, 'p_value': None}
+    if max_period < 2:
+        return result
+
+    # AR(1) pre-whitening, so that the tests below compare against white noise
+    phi = acf_fft(x, 2)[1]
+    if not np.isfinite(phi):
+        return result
+    x = x[1:] - phi * x[:-1]
+    n = len(x)
+
+    if method == 'periodogram':
+        power = np.abs(rfft(x)) ** 2
+        # Frequencies k / n for 1 <= k < n / 2: the mean and, for even n, the
+        # real-valued Nyquist term fall outside Fisher's test
+        power = power[1:(n + 1) // 2]
+        total = power.sum()
+        if total <= 0:
+            return result
+        k = np.arange(1, len(power) + 1)
+        periods = n / k
+        admissible = (periods >= 2) & (periods <= max_period)
+        if not admissible.any():
+            return result
+        best = np.flatnonzero(admissible)[np.argmax(power[admissible])]
+
+        g = power[best] / total
+        m = len(power)
+        # First term of Fisher's exact distribution, an accurate upper bound for small p
+        p_value = float(min(1.0, m * (1 - g) ** (m - 1)))
+        result.update(strength=float(g), p_value=p_value)
+        if p_value <= alpha:
+            result['period'] = int(round(periods[best]))
+        return result
+
+    max_lag = min(2 * max_period, n - 2)
+    acf = acf_fft(x, max_lag + 2)
+    if not np.isfinite(acf[0]):
+        return result
+    band = stats.norm.ppf(1 - alpha / 2) / np.sqrt(n)
+
+    # Skip the initial decay: a seasonal peak follows a dip below the band. Lag 1
+    # is left out, since pre-whitening leaves it near or below zero.
+    below = np.flatnonzero(acf[2:max_period + 1] < band)
+    if not len(below):
+        return result
+    start = below[0] + 2
+
+    # Candidates are the highest lags of the excursions above the band, in order;
+    # taking the excursion maximum is robust to noise-induced local maxima
+    lags = np.arange(start, max_period + 1)
+    high = acf[lags] > band
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], high, [False])).astype(int)))
+    for run_start, run_end in zip(lags[0] + edges[::2], lags[0] + edges[1::2]):
+        candidate = run_start + int(np.argmax(acf[run_start:run_end]))
+
+        # Confirm the candidate at its multiples, searching a window around each
+        # one (the period may be fractional) with a band widened for the window
+        tolerance = max(1, candidate // 4)
+        window_band = stats.norm.ppf(1 - alpha / (2 * (2 * tolerance + 1))) / np.sqrt(n)
+        multiples = [k for k in (2, 3) if k * candidate + tolerance <= max_lag]
+        peaks = [k * candidate - tolerance + int(np.argmax(acf[k * candidate - tolerance:k * candidate + tolerance + 1]))
+                 for k in multiples]
+        if multiples and all(acf[peak] > window_band for peak in peaks):
+            # Refine to the period whose multiples carry the most autocorrelation
+            periods = np.arange(max(2, candidate - tolerance), candidate + tolerance + 1)
+            comb = acf[periods] + sum(acf[np.minimum(k * periods, max_lag)] for k in multiples)
+            period = int(periods[np.argmax(comb)])
+            result.update(period=period, strength=float(acf[period]))
+            break
+    return result
@@ -0,0 +1,132 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+DOWNSAMPLE_METHODS = ('minmax', 'lttb')
+
+
+def downsample_for_plot(index: pd.Index | np.ndarray,
+                        values: np.ndarray,
+                        max_points: int = 7_200,
+                        method: str = 'minmax') -> np.ndarray:
+    """
+    Select the rows of a line plot that keep it visually unchanged at a fixed width.
+
+    - 'minmax': the x range is split into `max_points // 2` equal-width buckets
+      (one per output pixel column) and the minimum and maximum of each bucket are
+      kept, so every spike stays visible. Buckets follow the x values, so irregular
+      time axes are handled.
+    - 'lttb': Largest-Triangle-Three-Buckets keeps the `max_points` rows that best
+      preserve the shape of the line.
+
+    For several columns (2-D `values`) the selections of each column are merged, so
+    all lines and bands of one plot share the same x positions.
+
+    Args:
+        index (pd.Index | np.ndarray): Sorted x values (datetime or numeric).
+        values (np.ndarray): Values, shape (n,) or (n, k). NaNs are ignored.
+        max_points (int): Target number of rows per column. Defaults to 7,200
+            (two points per pixel of a 12-inch, 300-dpi figure).
+        method (str): 'minmax' or 'lttb'. Defaults to 'minmax'.
+
+    Returns:
+        np.ndarray: Sorted row positions to plot (all rows if there are at most `max_points`).
+
+    Raises:
+        ValueError: If `method` is not supported.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported method '{method}'. Use one of {DOWNSAMPLE_METHODS}.")
+
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    n = len(values)
+    if max_points is None or n <= max_points:
+        return np.arange(n)
+
+    x = _as_float(index)
+    select = _minmax_rows if method == 'minmax' else _lttb_rows
+    keep = [select(x, values[:, j], max_points) for j in range(values.shape[1])]
+    return np.unique(np.concatenate(keep + [[0, n - 1]]))
+
+
+def _as_float(index) -> np.ndarray:
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(float)
+    values = np.asarray(index)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]').astype(np.int64).astype(float)
+    return values.astype(float)
+
+
+def _minmax_rows(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Rows of the minimum and maximum of each equal-width x bucket.
+    """
+    rows = np.flatnonzero(~np.isnan(y))
+    if len(rows) == 0:
+        return rows
+    n_buckets = max(max_points // 2, 1)
+    span = x[-1] - x[0]
+    if span > 0:
+        buckets = np.minimum(((x[rows] - x[0]) / span * n_buckets).astype(np.int64), n_buckets - 1)
+    else:
+        buckets = np.zeros(len(rows), dtype=np.int64)
+
+    # x is sorted, so buckets are contiguous runs: reduce each run in one pass
+    starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+    sizes = np.diff(np.append(starts, len(rows)))
+    ys = y[rows]
+    keep = []
+    for reduce in (np.minimum, np.maximum):
+        extreme = np.repeat(reduce.reduceat(ys, starts), sizes)
+        hits = np.flatnonzero(ys == extreme)
+        # First row of each bucket that attains its extreme
+        keep.append(rows[hits[np.searchsorted(hits, starts)]])
+    return np.union1d(*keep)
+
+
+def _lttb_rows(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection of `max_points` rows.
+    """
+    rows = np.flatnonzero(~np.isnan(y))
+    n = len(rows)
+    if n <= max_points or max_points < 3:
+        return rows
+    xs, ys = x[rows], y[rows]
+
+    # Interior rows split into max_points - 2 buckets; first and last rows always kept
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for b in range(max_points - 2):
+        start, end = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            next_start, next_end = edges[b + 1], edges[b + 2]
+            avg_x, avg_y = xs[next_start:next_end].mean(), ys[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = xs[-1], ys[-1]
+        # Twice the area of the triangle (previous point, candidate, next-bucket average)
+        area = np.abs(
+            (xs[previous] - avg_x) * (ys[start:end] - ys[previous])
+            - (xs[previous] - xs[start:end]) * (avg_y - ys[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[b + 1] = previous
+    return rows[selected]
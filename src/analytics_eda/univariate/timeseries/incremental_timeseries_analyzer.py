@@ -0,0 +1,456 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+import logging
+import pickle
+import uuid
+
+import numpy as np
+import pandas as pd
+from scipy.fft import next_fast_len, rfft, irfft
+
+from ...core.reporting import write_json_report
+from .prepare_time_series import prepare_time_series
+from .time_index_profiler import TimeIndexProfiler
+from .autocorrelation_analysis import autocorrelation_report
+from .rolling_statistics import rolling_statistics
+from .downsample_for_plot import downsample_for_plot
+from .seasonal_decomposition import seasonal_decomposition
+from .timeseries_statistical_tests import timeseries_statistical_tests
+from .visualize_time_series_structure import (
+    plot_raw_series, with_rolling_bands, plot_rolling_statistics, plot_correlogram, plot_stl_decomposition
+)
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = 'incremental_state.pkl'
+
+
+class IncrementalTimeSeriesAnalyzer:
+    """
+    Stateful time-series analysis that is updated with new rows only.
+
+    Everything the report needs is kept as a bounded summary of the history, so an
+    update costs time proportional to the new rows (plus a constant for the bounded
+    summaries), never to the full history:
+
+    - running moments and the exact peak / trough;
+    - a `TimeIndexProfiler` of the time column;
+    - ACF accumulators: lagged cross-products `Σ v_t v_{t+k}` (k <= nlags), the sum,
+      and the first and last `nlags` values, from which the ACF about the global mean
+      is exact at any time. New rows are added with one FFT over the previous tail
+      and the new rows;
+    - the tail of the series covering one rolling window, so rolling statistics are
+      computed only for new rows;
+    - level-of-detail plot buffers (min/max per bucket) of the raw series and the
+      rolling statistics;
+    - a block-averaged copy of the series holding at most `max_points` blocks (pairs of
+      blocks are merged as it grows), on which period detection, STL and the
+      statistical tests run.
+
+    Rows older than the last analyzed timestamp are dropped and counted.
+
+    Args:
+        numeric_col (str): Name of the numeric column.
+        time_col (str): Name of the datetime column.
+        report_root (str): Base directory under which a subfolder for this analysis
+            is created.
+        rolling_window (int | str): Window for rolling statistics, in rows or as a time span.
+        nlags (int): Largest ACF/PACF lag. Defaults to 40.
+        alpha (float): Significance level of bands and tests. Defaults to 0.05.
+        max_points (int): Maximum number of blocks for STL and tests. Defaults to 10,000.
+        plot_max_points (int): Maximum points per line in the plot buffers. Defaults to 7,200.
+    """
+
+    def __init__(self,
+                 numeric_col: str,
+                 time_col: str,
+                 report_root: str = 'reports/eda/univariate/timeseries',
+                 rolling_window: int | str = 12,
+                 nlags: int = 40,
+                 alpha: float = 0.05,
+                 max_points: int = 10_000,
+                 plot_max_points: int = 7_200):
+        self.numeric_col = numeric_col
+        self.time_col = time_col
+        self.report_root = str(report_root)
+        self.rolling_window = rolling_window
+        self.nlags = int(nlags)
+        self.alpha = alpha
+        self.max_points = int(max_points)
+        self.plot_max_points = int(plot_max_points)
+
+        self.n_updates = 0
+        self.n_late = 0
+        self.last_time = None
+        self.tz = None
+        self.time_profiler = TimeIndexProfiler()
+
+        # Running moments (Chan et al. merge) and extremes
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.peak = None
+        self.trough = None
+
+        # ACF accumulators over values shifted by `reference`
+        self.reference = None
+        self.total = 0.0
+        self.lagged = np.zeros(self.nlags + 1)
+        self.head = np.array([])
+        self.tail = np.array([])
+
+        self.rolling_tail = None
+        self.plot_raw = None
+        self.plot_rolling = None
+
+        # Block-averaged history
+        self.block_size = 1
+        self.block_sums = np.array([])
+        self.block_counts = np.array([], dtype=np.int64)
+        self.block_starts = np.array([], dtype=np.int64)
+
+    @property
+    def report_dir(self) -> Path:
+        return Path(self.report_root) / f"{self.time_col.replace(' ', '_')}_{self.numeric_col.replace(' ', '_')}"
+
+    @property
+    def state_path(self) -> Path:
+        return self.report_dir / STATE_FILENAME
+
+    def save(self, path: str | Path | None = None) -> Path:
+        """
+        Persist the analyzer state (defaults to `state_path`).
+        """
+        path = Path(path) if path is not None else self.state_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "IncrementalTimeSeriesAnalyzer":
+        """
+        Load a state written by `save`. Only load files this package has written.
+        """
+        with open(path, 'rb') as f:
+            analyzer = pickle.load(f)
+        if not isinstance(analyzer, cls):
+            raise TypeError(f"'{path}' does not contain an {cls.__name__} state.")
+        return analyzer
+
+    def update(self, df: pd.DataFrame) -> "IncrementalTimeSeriesAnalyzer":
+        """
+        Add new rows.
+
+        Args:
+            df (pd.DataFrame): New rows with `time_col` (datetime64) and `numeric_col` (numeric).
+
+        Returns:
+            IncrementalTimeSeriesAnalyzer: self, to allow chaining.
+
+        Raises:
+            TypeError: If the columns have the wrong dtypes.
+        """
+        if not pd.api.types.is_datetime64_any_dtype(df[self.time_col]):
+            raise TypeError(
+                f"Column '{self.time_col}' is of type {df[self.time_col].dtype}; expected datetime64 dtype."
+            )
+        if not pd.api.types.is_numeric_dtype(df[self.numeric_col]):
+            raise TypeError(
+                f"Column '{self.numeric_col}' is of type {df[self.numeric_col].dtype}; expected a numeric dtype."
+            )
+
+        self.time_profiler.update(df[self.time_col])
+        series = prepare_time_series(df, self.numeric_col, self.time_col).astype(float)
+        # Stored times are int64 nanoseconds, whatever the resolution of each batch
+        series.index = series.index.as_unit('ns')
+        if self.last_time is not None:
+            late = series.index.asi8 < self.last_time
+            self.n_late += int(late.sum())
+            series = series[~late]
+        self.n_updates += 1
+        if len(series) == 0:
+            return self
+
+        if self.tz is None:
+            self.tz = series.index.tz
+        values = series.to_numpy()
+        self._update_moments(series)
+        self._update_lagged_products(values)
+        self._update_rolling(series)
+        self._update_blocks(values, series.index.asi8)
+        self.last_time = int(series.index.asi8[-1])
+        return self
+
+    def _update_moments(self, series: pd.Series) -> None:
+        values = series.to_numpy()
+        m = len(values)
+        chunk_mean = values.mean()
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        n = self.n + m
+        delta = chunk_mean - self.mean
+        self.m2 += chunk_m2 + delta * delta * self.n * m / n
+        self.mean += delta * m / n
+        self.n = n
+
+        i_max, i_min = int(np.argmax(values)), int(np.argmin(values))
+        if self.peak is None or values[i_max] > self.peak[1]:
+            self.peak = (series.index[i_max], float(values[i_max]))
+        if self.trough is None or values[i_min] < self.trough[1]:
+            self.trough = (series.index[i_min], float(values[i_min]))
+
+    def _update_lagged_products(self, values: np.ndarray) -> None:
+        if self.reference is None:
+            self.reference = float(values.mean())
+        shifted = values - self.reference
+        # Products with at least one factor in the new rows: all products of
+        # (tail + new) minus those entirely within the tail
+        joined = np.concatenate((self.tail, shifted))
+        self.lagged += _lagged_products(joined, self.nlags) - _lagged_products(self.tail, self.nlags)
+        self.total += float(shifted.sum())
+        if len(self.head) < self.nlags:
+            self.head = np.concatenate((self.head, shifted))[:self.nlags]
+        self.tail = joined[-self.nlags:] if self.nlags else joined[:0]
+
+    def _update_rolling(self, series: pd.Series) -> None:
+        joined = series if self.rolling_tail is None else pd.concat([self.rolling_tail, series])
+        rolling = rolling_statistics(joined, self.rolling_window, min_periods=1).iloc[len(joined) - len(series):]
+        rolling = with_rolling_bands(rolling)
+
+        if isinstance(self.rolling_window, (int, np.integer)):
+            self.rolling_tail = joined.iloc[-max(int(self.rolling_window) - 1, 1):]
+        else:
+            cutoff = joined.index[-1] - pd.Timedelta(self.rolling_window)
+            self.rolling_tail = joined[joined.index > cutoff]
+
+        raw = series if self.plot_raw is None else pd.concat([self.plot_raw, series])
+        rows = downsample_for_plot(raw.index, raw.to_numpy(), self.plot_max_points)
+        self.plot_raw = raw.iloc[rows]
+
+        rolling = rolling if self.plot_rolling is None else pd.concat([self.plot_rolling, rolling])
+        rows = downsample_for_plot(rolling.index, rolling.to_numpy(), self.plot_max_points)
+        self.plot_rolling = rolling.iloc[rows]
+
+    def _update_blocks(self, values: np.ndarray, times: np.ndarray) -> None:
+        used = 0
+        if len(self.block_counts) and self.block_counts[-1] < self.block_size:
+            used = int(min(self.block_size - self.block_counts[-1], len(values)))
+            self.block_sums[-1] += values[:used].sum()
+            self.block_counts[-1] += used
+
+        rest = values[used:]
+        if len(rest):
+            starts = np.arange(0, len(rest), self.block_size)
+            self.block_sums = np.concatenate((self.block_sums, np.add.reduceat(rest, starts)))
+            self.block_counts = np.concatenate((self.block_counts, np.diff(np.append(starts, len(rest)))))
+            self.block_starts = np.concatenate((self.block_starts, times[used:][starts]))
+
+        # Merge pairs of blocks until the history fits; only the last block can be partial
+        while len(self.block_sums) > self.max_points:
+            if len(self.block_sums) % 2:
+                self.block_sums = np.append(self.block_sums, 0.0)
+                self.block_counts = np.append(self.block_counts, 0)
+                self.block_starts = np.append(self.block_starts, self.block_starts[-1])
+            self.block_sums = self.block_sums[0::2] + self.block_sums[1::2]
+            self.block_counts = self.block_counts[0::2] + self.block_counts[1::2]
+            self.block_starts = self.block_starts[0::2]
+            self.block_size *= 2
+
+    def autocorrelation(self) -> dict:
+        """
+        ACF / PACF of the full history (same result as `autocorrelation_analysis`
+        with `nlags=min(nlags, n // 2)`).
+        """
+        n = self.n
+        nlags = min(self.nlags, n // 2, n - 1)
+        mu = self.total / n
+        k = np.arange(nlags + 1)
+        tail_sums = np.concatenate(([0.0], np.cumsum(self.tail[::-1])))[k]
+        head_sums = np.concatenate(([0.0], np.cumsum(self.head)))[k]
+        # Σ (v_t - mu)(v_{t+k} - mu) over t < n - k, from the raw cross-products
+        acov = self.lagged[k] - mu * ((self.total - tail_sums) + (self.total - head_sums)) + (n - k) * mu * mu
+        with np.errstate(invalid='ignore', divide='ignore'):
+            acf = acov / acov[0]
+        return autocorrelation_report(acf, n, self.alpha)
+
+    def block_series(self) -> pd.Series:
+        """
+        Block-averaged history (at most `max_points` values).
+        """
+        index = pd.DatetimeIndex(self.block_starts, tz='UTC' if self.tz is not None else None, name=self.time_col)
+        if self.tz is not None:
+            index = index.tz_convert(self.tz)
+        return pd.Series(self.block_sums / self.block_counts, index=index, name=self.numeric_col)
+
+    def summary(self) -> dict:
+        return {
+            'n_obs': self.n,
+            'mean': float(self.mean) if self.n else None,
+            'std': float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else None,
+            'min': self.trough[1] if self.trough else None,
+            'min_time': str(self.trough[0]) if self.trough else None,
+            'max': self.peak[1] if self.peak else None,
+            'max_time': str(self.peak[0]) if self.peak else None
+        }
+
+    def write_report(self, report_log_id = str(uuid.uuid4())) -> Path:
+        """
+        Write the report and visuals for the current state.
+
+        Returns:
+            Path: Path to the JSON report.
+
+        Raises:
+            ValueError: If no rows have been analyzed yet.
+        """
+        if self.n == 0:
+            raise ValueError("No rows have been analyzed yet.")
+
+        report_dir = self.report_dir
+        report_dir.mkdir(parents=True, exist_ok=True)
+        visuals = {}
+
+        raw_path = report_dir / 'raw_line_plot.png'
+        plot_raw_series(self.plot_raw, self.numeric_col, self.peak, self.trough, raw_path)
+        visuals['raw_line_plot'] = str(raw_path)
+
+        roll_path = report_dir / 'rolling_statistics.png'
+        plot_rolling_statistics(self.plot_rolling, self.numeric_col, self.rolling_window, roll_path)
+        visuals['rolling_statistics'] = str(roll_path)
+
+        autocorrelation = None
+        if self.n >= 4:
+            autocorrelation = self.autocorrelation()
+            for name, title in (('acf', 'Autocorrelation (ACF)'), ('pacf', 'Partial Autocorrelation (PACF)')):
+                path = report_dir / f'{name}.png'
+                plot_correlogram(autocorrelation['lags'], autocorrelation[name], autocorrelation[f'{name}_band'], title, path)
+                visuals[name] = str(path)
+
+        blocks = self.block_series()
+        seasonality, result = seasonal_decomposition(blocks, max_points=None)
+        seasonality['block_size'] = self.block_size
+        if result is not None:
+            stl_path = report_dir / 'stl_decomposition.png'
+            plot_stl_decomposition(result, stl_path)
+            visuals['stl_decomposition'] = str(stl_path)
+
+        statistical_tests = timeseries_statistical_tests(
+            blocks, alpha=self.alpha, max_stationarity_points=None, report_log_id=report_log_id
+        )
+
+        eda_report = {
+            'summary': self.summary(),
+            'time_index': self.time_profiler.profile(),
+            'autocorrelation': autocorrelation,
+            'seasonality': seasonality,
+            'statistical_tests': statistical_tests,
+            'incremental': {
+                'n_updates': self.n_updates,
+                'n_late_rows_dropped': self.n_late,
+                'block_size': self.block_size,
+                'n_blocks': int(len(self.block_sums))
+            },
+            'visuals': visuals
+        }
+
+        full_report = {
+            'metadata': {
+                'version': '0.1.0',
+                'report_name': 'incremental_univariate_timeseries_analysis',
+                'parameters': {
+                    'numeric_col': self.numeric_col,
+                    'time_col': self.time_col,
+                    'rolling_window': self.rolling_window
+                }
+            },
+            'eda': eda_report
+        }
+
+        report_path = report_dir / f"{report_dir.name}_incremental_univariate_analysis_report.json"
+        write_json_report(full_report, report_path)
+        return report_path
+
+
+def incremental_univariate_timeseries_analysis(df: pd.DataFrame,
+                                               numeric_col: str,
+                                               time_col: str,
+                                               report_root: str = 'reports/eda/univariate/timeseries',
+                                               rolling_window: int | str = 12,
+                                               report_log_id = str(uuid.uuid4()),
+                                               **kwargs) -> Path:
+    """
+    Add new rows to a persisted time-series analysis and refresh its report.
+
+    The analyzer state is loaded from the report directory if it exists (otherwise
+    a new `IncrementalTimeSeriesAnalyzer` is created), updated with `df` only, saved
+    back and used to rewrite the report and visuals. Calling it with each new batch
+    (e.g. the last hour) gives the report of the full history without re-reading it.
+
+    Parameters:
+    - df (pd.DataFrame): New rows with the time and value columns.
+    - numeric_col (str): Name of the numeric column.
+    - time_col (str): Name of the datetime column.
+    - report_root (str): Base directory of the report and its state.
+    - rolling_window (int | str): Window for rolling statistics (used when the state is created).
+    - report_log_id (str): report log id.
+    - **kwargs: Further `IncrementalTimeSeriesAnalyzer` arguments for a new state.
+
+    Returns:
+    - pathlib.Path: Path to the JSON report.
+    """
+    logger.info(
+        "Starting incremental_univariate_timeseries_analysis",
+        extra={
+            'time_col': time_col,
+            'numeric_col': numeric_col,
+            'report_log_id': report_log_id
+        }
+    )
+
+    analyzer = IncrementalTimeSeriesAnalyzer(numeric_col, time_col, report_root, rolling_window, **kwargs)
+    if analyzer.state_path.exists():
+        analyzer = IncrementalTimeSeriesAnalyzer.load(analyzer.state_path)
+
+    analyzer.update(df)
+    analyzer.save()
+    report_path = analyzer.write_report(report_log_id=report_log_id)
+
+    logger.info(
+        "Completed incremental_univariate_timeseries_analysis",
+        extra={
+            'time_col': time_col,
+            'numeric_col': numeric_col,
+            'n_updates': analyzer.n_updates,
+            'report_log_id': report_log_id
+        }
+    )
+
+    return report_path
+
+
+def _lagged_products(values: np.ndarray, nlags: int) -> np.ndarray:
+    """
+    Σ_t v_t v_{t+k} for k = 0..nlags (zero where the series is too short), via FFT.
+    """
+    out = np.zeros(nlags + 1)
+    n = len(values)
+    if n == 0:
+        return out
+    size = next_fast_len(2 * n - 1, real=True)
+    spectrum = rfft(values, n=size)
+    products = irfft(spectrum * np.conj(spectrum), n=size)
+    k = min(nlags, n - 1)
+    out[:k + 1] = products[:k + 1]
+    return out
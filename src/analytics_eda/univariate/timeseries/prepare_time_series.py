@@ -0,0 +1,56 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+
+
+def prepare_time_series(df: pd.DataFrame, numeric_col: str, time_col: str) -> pd.Series:
+    """
+    Project a DataFrame onto one time-indexed numeric Series, ready for the
+    time-series stages.
+
+    Only `time_col` and `numeric_col` are read; the rest of the DataFrame is never
+    copied. Rows with a missing time or value are dropped, and the result is sorted
+    chronologically (stable) only if its index is not already monotonic.
+
+    Args:
+        df (pd.DataFrame): DataFrame with a datetime column `time_col`, or already
+            indexed by time.
+        numeric_col (str): Name of the numeric column.
+        time_col (str): Name of the datetime column (if not already the index).
+
+    Returns:
+        pd.Series: Values of `numeric_col` indexed by time (index named `time_col`).
+
+    Raises:
+        TypeError: If `time_col` is a column but not datetime64 dtype.
+    """
+    values = df[numeric_col]
+
+    if time_col in df.columns:
+        times = df[time_col]
+        if not pd.api.types.is_datetime64_any_dtype(times):
+            raise TypeError(f"'{time_col}' must be datetime64 dtype before structure analysis.")
+        index = pd.DatetimeIndex(times, name=time_col)
+    else:
+        index = df.index
+
+    keep = values.notna().to_numpy() & ~pd.isna(index)
+    if keep.all():
+        series = pd.Series(values.to_numpy(), index=index, name=numeric_col, copy=False)
+    else:
+        series = pd.Series(values.to_numpy()[keep], index=index[keep], name=numeric_col, copy=False)
+
+    if not series.index.is_monotonic_increasing:
+        series = series.sort_index(kind='stable')
+    return series
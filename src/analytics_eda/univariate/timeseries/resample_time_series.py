@@ -0,0 +1,109 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+RESAMPLE_AGGREGATES = ('mean', 'min', 'max', 'count', 'last')
+
+
+def resample_time_series(series: pd.Series,
+                         freq: str,
+                         aggregates: tuple[str, ...] = RESAMPLE_AGGREGATES) -> tuple[pd.DataFrame, int]:
+    """
+    Aggregate a time series into fixed time buckets, all aggregates in one pass.
+
+    For a fixed frequency (e.g. '1s', '5min', '1h') each timestamp is mapped to a
+    bucket by integer division of its int64 nanoseconds, with buckets aligned to
+    midnight of the first day (as `Series.resample`). Because the series is sorted,
+    buckets are contiguous runs of rows and every aggregate is one `reduceat` over the
+    same run boundaries. Anchored and calendar frequencies ('W', 'W-MON', 'ME',
+    'QS', ...) are not fixed spans and fall back to `Series.resample`, so weeks end
+    on the anchor day rather than every seven days from an arbitrary origin.
+
+    The result covers every bucket from the first to the last, so it is evenly
+    spaced: empty buckets have a count of 0 and NaN for the other aggregates.
+
+    Args:
+        series (pd.Series): Series without missing values, sorted by a DatetimeIndex.
+        freq (str): Target frequency.
+        aggregates (tuple[str, ...]): Any of 'mean', 'min', 'max', 'count', 'last'.
+
+    Returns:
+        tuple:
+            aggregated (pd.DataFrame): One column per aggregate, indexed by the start
+                of every bucket between the first and last, empty ones included.
+            n_empty (int): Number of empty buckets between the first and last bucket.
+
+    Raises:
+        ValueError: If an aggregate is not supported.
+        TypeError: If the series is not indexed by a DatetimeIndex.
+    """
+    unsupported = [a for a in aggregates if a not in RESAMPLE_AGGREGATES]
+    if unsupported:
+        raise ValueError(f"Unsupported aggregates {unsupported}. Use any of {RESAMPLE_AGGREGATES}.")
+    if not isinstance(series.index, pd.DatetimeIndex):
+        raise TypeError("Resampling requires a DatetimeIndex.")
+
+    offset = to_offset(freq)
+    if not isinstance(offset, pd.offsets.Tick) or len(series) == 0:
+        resampler = series.resample(offset)
+        aggregated = resampler.agg(list(aggregates))
+        counts = aggregated['count'] if 'count' in aggregated else resampler.count()
+        if 'count' in aggregated:
+            aggregated['count'] = aggregated['count'].astype(np.int64)
+        return aggregated, int((counts == 0).sum())
+    step = offset.nanos
+
+    # Bucket arithmetic is in nanoseconds, whatever the resolution of the index
+    index = series.index.as_unit('ns')
+    values = series.to_numpy(dtype=float)
+    origin = index[0].normalize().value
+    buckets = (index.asi8 - origin) // step
+
+    starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+    ends = np.append(starts[1:], len(values))
+    sizes = ends - starts
+
+    columns = {}
+    for aggregate in aggregates:
+        if aggregate == 'mean':
+            columns['mean'] = np.add.reduceat(values, starts) / sizes
+        elif aggregate == 'min':
+            columns['min'] = np.minimum.reduceat(values, starts)
+        elif aggregate == 'max':
+            columns['max'] = np.maximum.reduceat(values, starts)
+        elif aggregate == 'count':
+            columns['count'] = sizes
+        elif aggregate == 'last':
+            columns['last'] = values[ends - 1]
+
+    # Scatter the non-empty buckets onto the full, evenly spaced bucket range
+    bucket_ids = buckets[starts]
+    positions = bucket_ids - bucket_ids[0]
+    n_buckets = int(positions[-1]) + 1
+    full = {}
+    for name, column in columns.items():
+        if name == 'count':
+            full[name] = np.zeros(n_buckets, dtype=np.int64)
+        else:
+            full[name] = np.full(n_buckets, np.nan)
+        full[name][positions] = column
+
+    all_ids = bucket_ids[0] + np.arange(n_buckets)
+    bucket_index = pd.DatetimeIndex(origin + all_ids * step, tz='UTC' if index.tz is not None else None, name=index.name)
+    if index.tz is not None:
+        bucket_index = bucket_index.tz_convert(index.tz)
+    bucket_index = bucket_index.as_unit(series.index.unit)
+    return pd.DataFrame(full, index=bucket_index), n_buckets - len(bucket_ids)
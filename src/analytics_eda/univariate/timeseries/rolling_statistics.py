@@ -0,0 +1,159 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from bisect import bisect_left, insort
+
+import numpy as np
+import pandas as pd
+
+ROLLING_QUANTILES = {'q25': 0.25, 'median': 0.5, 'q75': 0.75}
+
+
+def rolling_statistics(series: pd.Series,
+                       window: int | str | pd.Timedelta,
+                       min_periods: int = 1,
+                       approximate: bool = False,
+                       n_samples: int = 256) -> pd.DataFrame:
+    """
+    Rolling mean, median, standard deviation and quartiles.
+
+    Window bounds are computed once, either as row counts or, for a time-based
+    window such as `'7D'`, as the half-open interval `(t - window, t]` found with one
+    `searchsorted` over the int64 time index (the same windows as `Series.rolling`).
+    Mean and standard deviation come from prefix sums over those bounds, without a
+    rolling pass. The exact median and quartiles take one `Series.rolling` quantile
+    pass each (three in total), whose skiplist costs O(log w) per row; a single
+    shared order-statistics window in Python would cost O(w) per row instead.
+
+    With `approximate=True` and windows longer than `n_samples`, the quartiles are
+    read instead from one sorted window holding only every k-th row, with k chosen
+    so a typical window keeps about `n_samples` values, updated by insertion and
+    removal as it slides. Each update then costs O(n_samples) regardless of the
+    window length; the quartiles become those of a systematic sample of each window
+    (rank error of order `1 / sqrt(n_samples)`). Mean and standard deviation stay
+    exact.
+
+    Args:
+        series (pd.Series): Series without missing values, sorted by time.
+        window (int | str | pd.Timedelta): Number of rows, or a fixed time span
+            (e.g. '7D', '1h') for a datetime-indexed series.
+        min_periods (int): Minimum observations in a window for a value; fewer give NaN.
+        approximate (bool): Use sampled approximate quantiles.
+        n_samples (int): Target number of values per window for approximate quantiles.
+
+    Returns:
+        pd.DataFrame: Columns 'mean', 'median', 'std', 'q25', 'q75', indexed like `series`.
+
+    Raises:
+        ValueError: If the window is not positive.
+        TypeError: If a time-based window is used without a DatetimeIndex.
+    """
+    values = np.asarray(series, dtype=float)
+    n = len(values)
+    starts = _window_starts(series, window)
+    ends = np.arange(1, n + 1)
+    counts = ends - starts
+
+    # Mean and sample standard deviation from prefix sums (shifted for stability)
+    shifted = values - values.mean() if n else values
+    prefix = np.concatenate(([0.0], np.cumsum(shifted)))
+    prefix_sq = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+    sums = prefix[ends] - prefix[starts]
+    sums_sq = prefix_sq[ends] - prefix_sq[starts]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sums / counts
+        var = np.maximum(sums_sq - sums * mean, 0.0) / (counts - 1)
+        var[counts < 2] = np.nan
+    mean = mean + (values.mean() if n else 0.0)
+
+    result = pd.DataFrame({'mean': mean, 'std': np.sqrt(var)}, index=series.index)
+
+    # Keep about `n_samples` systematically spaced values per window
+    step = max(1, int(np.median(counts)) // max(n_samples, 1)) if approximate and n else 1
+    if step > 1:
+        probs = np.array(list(ROLLING_QUANTILES.values()))
+        quantiles = _sorted_window_quantiles(values, starts, probs, step)
+        for j, name in enumerate(ROLLING_QUANTILES):
+            result[name] = quantiles[:, j]
+    else:
+        rolling = pd.Series(values, index=series.index).rolling(
+            window if isinstance(window, (int, np.integer)) else pd.Timedelta(window), min_periods=1
+        )
+        for name, prob in ROLLING_QUANTILES.items():
+            result[name] = rolling.quantile(prob).to_numpy()
+    result.loc[counts < max(min_periods, 1), :] = np.nan
+    return result[['mean', 'median', 'std', 'q25', 'q75']]
+
+
+def _window_starts(series: pd.Series, window: int | str | pd.Timedelta) -> np.ndarray:
+    """
+    Start row (inclusive) of the window ending at each row.
+    """
+    n = len(series)
+    if isinstance(window, (int, np.integer)):
+        if window <= 0:
+            raise ValueError("'window' must be positive.")
+        return np.maximum(np.arange(1, n + 1) - int(window), 0)
+
+    delta = pd.Timedelta(window)
+    if delta <= pd.Timedelta(0):
+        raise ValueError("'window' must be positive.")
+    if not isinstance(series.index, pd.DatetimeIndex):
+        raise TypeError("A time-based window requires a DatetimeIndex.")
+    # Nanoseconds, like `delta.value`, whatever the resolution of the index
+    times = series.index.as_unit('ns').asi8
+    return np.searchsorted(times, times - delta.value, side='right')
+
+
+def _interpolate(sorted_values, count: int, prob: float) -> float:
+    # Linear interpolation between order statistics (as Series.quantile)
+    position = prob * (count - 1)
+    lower = int(position)
+    value = sorted_values[lower]
+    fraction = position - lower
+    if fraction:
+        value += fraction * (sorted_values[lower + 1] - value)
+    return value
+
+
+def _sorted_window_quantiles(values: np.ndarray, starts: np.ndarray, probs: np.ndarray, step: int = 1) -> np.ndarray:
+    """
+    Rolling quantiles from one sorted window updated by insert / remove.
+
+    Only rows whose position is a multiple of `step` enter the window, so each
+    update moves O(w / step) values. A window holding no sampled row uses the
+    current value.
+    """
+    x = values.tolist()
+    starts = starts.tolist()
+    probs = probs.tolist()
+    out = np.empty((len(x), len(probs)))
+
+    window = []
+    first = 0
+    for i, value in enumerate(x):
+        if i % step == 0:
+            insort(window, value)
+        start = starts[i]
+        while first < start:
+            if first % step == 0:
+                del window[bisect_left(window, x[first])]
+            first += 1
+        count = len(window)
+        row = out[i]
+        if count == 0:
+            row[:] = value
+            continue
+        for j, prob in enumerate(probs):
+            row[j] = _interpolate(window, count, prob)
+    return out
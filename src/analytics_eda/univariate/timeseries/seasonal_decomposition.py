@@ -0,0 +1,110 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.seasonal import STL, DecomposeResult
+
+from .detect_seasonal_period import detect_seasonal_period
+from .block_average import block_average
+
+
+def seasonal_decomposition(series: pd.Series,
+                           period: int | None = None,
+                           resolution: str | None = None,
+                           max_points: int | None = 10_000,
+                           method: str = 'periodogram') -> tuple[dict, DecomposeResult | None]:
+    """
+    STL decomposition of a time series of any frequency, with automatic period detection.
+
+    The series is first brought to an even, bounded resolution: resampled to
+    `resolution` (bucket means, empty buckets interpolated) if given, then, if it
+    still has more than `max_points` values, averaged over consecutive blocks of
+    equal size. The seasonal period is then detected on that series with
+    `detect_seasonal_period`; if none is found, the calendar default for monthly
+    (12) or daily (7) data is used when the frequency can be inferred.
+
+    Args:
+        series (pd.Series): Series without missing values, sorted by time.
+        period (int | None): Seasonal period in samples of the aggregated series.
+            Detected if None.
+        resolution (str | None): Target time resolution (e.g. '1h') for a
+            DatetimeIndex. Defaults to None (keep the original spacing).
+        max_points (int | None): Upper bound on the number of values passed to STL.
+            Defaults to 10,000; None disables block aggregation.
+        method (str): Period detection method ('periodogram' or 'acf').
+
+    Returns:
+        tuple:
+            report (dict): {
+                'n_obs_raw': int,            # values in the input series
+                'n_obs_used': int,           # values passed to STL
+                'resolution': str | None,
+                'block_size': int,           # input values averaged per STL value
+                'period': int | None,        # in samples of the aggregated series
+                'period_source': str | None, # 'given', 'detected' or 'calendar'
+                'period_span': str | None,   # period as a time span, if the index is datetime
+                'detection': dict | None     # result of `detect_seasonal_period`
+            }
+            result (DecomposeResult | None): Fitted STL result, None if no period.
+    """
+    n_raw = len(series)
+    used = series
+    if resolution is not None and isinstance(used.index, pd.DatetimeIndex):
+        used = used.resample(resolution).mean().interpolate(limit_direction='both')
+
+    used, block_size = block_average(used, max_points)
+
+    report = {
+        'n_obs_raw': int(n_raw),
+        'n_obs_used': int(len(used)),
+        'resolution': resolution,
+        'block_size': block_size,
+        'period': None,
+        'period_source': None,
+        'period_span': None,
+        'detection': None
+    }
+
+    source = 'given' if period is not None else None
+    if period is None:
+        detection = detect_seasonal_period(used.to_numpy(dtype=float), method=method)
+        report['detection'] = detection
+        period = detection['period']
+        source = 'detected' if period is not None else None
+    if period is None and isinstance(used.index, pd.DatetimeIndex) and len(used) >= 3:
+        freq = used.index.inferred_freq
+        if freq is not None:
+            if 'ME' in str(freq):
+                period, source = 12, 'calendar'
+            elif 'D' in str(freq):
+                period, source = 7, 'calendar'
+
+    if period is None or period < 2 or len(used) < 2 * period:
+        return report, None
+
+    report['period'] = int(period)
+    report['period_source'] = source
+    if isinstance(used.index, pd.DatetimeIndex) and len(used) > 1:
+        step = pd.Timedelta(int(np.median(np.diff(used.index.as_unit('ns').asi8))))
+        report['period_span'] = str(step * int(period))
+
+    result = STL(used.to_numpy(dtype=float), period=int(period)).fit()
+    result = DecomposeResult(
+        observed=used,
+        seasonal=pd.Series(result.seasonal, index=used.index, name='season'),
+        trend=pd.Series(result.trend, index=used.index, name='trend'),
+        resid=pd.Series(result.resid, index=used.index, name='resid'),
+        weights=pd.Series(result.weights, index=used.index, name='robust_weight')
+    )
+    return report, result
@@ -0,0 +1,347 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+NS_PER_SECOND = 1_000_000_000
+# Log-spaced delta histogram: bin i covers [2^(i/4), 2^((i+1)/4)) nanoseconds
+BINS_PER_OCTAVE = 4
+N_DELTA_BINS = 64 * BINS_PER_OCTAVE
+
+
+class TimeIndexProfiler:
+    """
+    Mergeable profile of a time column, fed chunk by chunk.
+
+    Each chunk is converted once to int64 nanoseconds. Ordering is profiled on
+    the rows as given: out-of-order rows are negative deltas between consecutive
+    rows, continuing from the last row of the previous chunk. Everything else is
+    profiled on the chunk's sorted values, continuing from the largest timestamp
+    seen so far: duplicate timestamps (zero deltas), a log-spaced delta histogram,
+    running moments and the `top_k` largest gaps. Only these fixed-size summaries
+    are kept, so a column split over many files can be profiled with bounded memory.
+
+    The sorted statistics are exact when chunks do not overlap in time (a single
+    unsorted chunk, or files that each cover their own time range). Where a chunk
+    starts before the end of the previous ones, duplicates and deltas across that
+    boundary are not seen.
+
+    Args:
+        top_k (int): Number of largest gaps to keep. Defaults to 10.
+        gap_threshold (str | pd.Timedelta | None): Deltas above this are gaps. Defaults
+            to `gap_factor` times the median delta, estimated from the histogram.
+        gap_factor (float): Multiple of the median delta used when `gap_threshold`
+            is None. Defaults to 2.
+    """
+
+    def __init__(self, top_k: int = 10, gap_threshold: str | pd.Timedelta | None = None, gap_factor: float = 2.0):
+        self.top_k = int(top_k)
+        self.gap_threshold = None if gap_threshold is None else pd.Timedelta(gap_threshold).value
+        self.gap_factor = float(gap_factor)
+        self.tz = None
+
+        self.n_obs = 0
+        self.n_missing = 0
+        self.n_duplicates = 0
+        self.n_out_of_order = 0
+        self.n_gaps_exact = 0
+        self.first = None
+        self.last = None
+        self.min = None
+        self.max = None
+
+        self.histogram = np.zeros(N_DELTA_BINS, dtype=np.int64)
+        self.bin_min = np.full(N_DELTA_BINS, np.iinfo(np.int64).max)
+        self.bin_max = np.zeros(N_DELTA_BINS, dtype=np.int64)
+        self.n_positive = 0
+        self.delta_sum = 0.0
+        self.delta_sq_sum = 0.0
+        self.min_delta = None
+        self.max_delta = None
+        self.gap_deltas = np.array([], dtype=np.int64)
+        self.gap_starts = np.array([], dtype=np.int64)
+
+    def update(self, chunk: pd.Series | pd.DatetimeIndex | np.ndarray) -> "TimeIndexProfiler":
+        """
+        Add the next chunk of timestamps (in file / row order).
+
+        Args:
+            chunk (pd.Series | pd.DatetimeIndex | np.ndarray): Datetime values
+                (datetime64, tz-aware or Arrow timestamp dtypes).
+
+        Returns:
+            TimeIndexProfiler: self, to allow chaining.
+
+        Raises:
+            TypeError: If the chunk is not datetime-like.
+        """
+        times = _as_datetime_index(chunk)
+        if self.tz is None:
+            self.tz = times.tz
+
+        missing = times.isna()
+        ns = times.asi8[~missing]
+        self.n_obs += len(times)
+        self.n_missing += int(missing.sum())
+        if len(ns) == 0:
+            return self
+
+        ordered = np.sort(ns)
+        if self.first is None:
+            self.first = int(ns[0])
+            self.min = int(ordered[0])
+            raw, sorted_stream = ns, ordered
+        else:
+            self.min = min(self.min, int(ordered[0]))
+            raw = np.concatenate(([self.last], ns))
+            sorted_stream = np.concatenate(([self.max], ordered[ordered >= self.max]))
+
+        self.n_out_of_order += int(np.count_nonzero(np.diff(raw) < 0))
+        self._add_deltas(np.diff(sorted_stream), sorted_stream[:-1])
+        self.last = int(ns[-1])
+        self.max = max(self.max, int(ordered[-1])) if self.max is not None else int(ordered[-1])
+        return self
+
+    def merge(self, other: "TimeIndexProfiler") -> "TimeIndexProfiler":
+        """
+        Merge the profile of the chunks that directly follow this one (e.g. the next
+        partition, profiled in another process).
+
+        Returns:
+            TimeIndexProfiler: self, to allow chaining.
+        """
+        if self.tz is None:
+            self.tz = other.tz
+        self.n_obs += other.n_obs
+        self.n_missing += other.n_missing
+        if other.first is None:
+            return self
+        if self.first is None:
+            self.first, self.min, self.max = other.first, other.min, other.max
+        else:
+            # The deltas across the partition boundary
+            if other.first < self.last:
+                self.n_out_of_order += 1
+            if other.min >= self.max:
+                self._add_deltas(np.array([other.min - self.max]), np.array([self.max]))
+            self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        self.last = other.last
+
+        self.n_duplicates += other.n_duplicates
+        self.n_out_of_order += other.n_out_of_order
+        self.n_gaps_exact += other.n_gaps_exact
+        self.histogram += other.histogram
+        self.bin_min = np.minimum(self.bin_min, other.bin_min)
+        self.bin_max = np.maximum(self.bin_max, other.bin_max)
+        self.n_positive += other.n_positive
+        self.delta_sum += other.delta_sum
+        self.delta_sq_sum += other.delta_sq_sum
+        self.min_delta = _combine(min, self.min_delta, other.min_delta)
+        self.max_delta = _combine(max, self.max_delta, other.max_delta)
+        self._keep_largest(other.gap_deltas, other.gap_starts)
+        return self
+
+    def _add_deltas(self, deltas: np.ndarray, starts: np.ndarray) -> None:
+        # Deltas between sorted timestamps: zero for duplicates, never negative
+        self.n_duplicates += int(np.count_nonzero(deltas == 0))
+
+        positive = deltas > 0
+        deltas, starts = deltas[positive], starts[positive]
+        if len(deltas) == 0:
+            return
+        bins = np.minimum((np.log2(deltas) * BINS_PER_OCTAVE).astype(np.int64), N_DELTA_BINS - 1)
+        self.histogram += np.bincount(bins, minlength=N_DELTA_BINS)
+        np.minimum.at(self.bin_min, bins, deltas)
+        np.maximum.at(self.bin_max, bins, deltas)
+
+        seconds = deltas / NS_PER_SECOND
+        self.n_positive += len(deltas)
+        self.delta_sum += float(seconds.sum())
+        self.delta_sq_sum += float(np.dot(seconds, seconds))
+        self.min_delta = _combine(min, self.min_delta, int(deltas.min()))
+        self.max_delta = _combine(max, self.max_delta, int(deltas.max()))
+        if self.gap_threshold is not None:
+            self.n_gaps_exact += int(np.count_nonzero(deltas > self.gap_threshold))
+        self._keep_largest(deltas, starts)
+
+    def _keep_largest(self, deltas: np.ndarray, starts: np.ndarray) -> None:
+        deltas = np.concatenate((self.gap_deltas, deltas))
+        starts = np.concatenate((self.gap_starts, starts))
+        if len(deltas) > self.top_k:
+            top = np.argpartition(-deltas, self.top_k - 1)[:self.top_k] if self.top_k else []
+            deltas, starts = deltas[top], starts[top]
+        self.gap_deltas, self.gap_starts = deltas, starts
+
+    def median_delta(self) -> int | None:
+        """
+        Median positive delta in nanoseconds, estimated from the histogram. None
+        without deltas.
+
+        Exact when the median bin holds a single delta value (regular sampling);
+        otherwise the bin's geometric midpoint, clamped to the smallest and largest
+        delta seen in that bin (within 9% for 4 bins per octave).
+        """
+        if self.n_positive == 0:
+            return None
+        cumulative = np.cumsum(self.histogram)
+        i = int(np.searchsorted(cumulative, (self.n_positive + 1) / 2))
+        midpoint = 2 ** ((i + 0.5) / BINS_PER_OCTAVE)
+        return int(round(min(max(midpoint, self.bin_min[i]), self.bin_max[i])))
+
+    def profile(self) -> dict:
+        """
+        Return the accumulated profile.
+
+        Returns:
+            dict: {
+                'n_obs': int, 'n_missing': int,
+                'start': str | None, 'end': str | None, 'span_seconds': float | None,
+                'is_monotonic_increasing': bool, 'is_unique': bool,
+                'n_out_of_order': int, 'n_duplicate_timestamps': int,
+                'delta_seconds': {'min', 'median', 'mean', 'std', 'max', 'cv'},
+                'delta_histogram': {'lower_edges_seconds': list, 'counts': list},
+                'gap_threshold_seconds': float | None,
+                'n_gaps': int,              # exact with `gap_threshold`, else from the histogram
+                'largest_gaps': list[dict]  # {'start', 'end', 'duration_seconds'}, largest first
+            }
+        """
+        median = self.median_delta()
+        if self.n_positive:
+            mean = self.delta_sum / self.n_positive
+            var = max(self.delta_sq_sum / self.n_positive - mean * mean, 0.0)
+            delta = {
+                'min': self.min_delta / NS_PER_SECOND,
+                'median': median / NS_PER_SECOND,
+                'mean': mean,
+                'std': float(np.sqrt(var)),
+                'max': self.max_delta / NS_PER_SECOND,
+                'cv': float(np.sqrt(var) / mean) if mean else None
+            }
+        else:
+            delta = {key: None for key in ('min', 'median', 'mean', 'std', 'max', 'cv')}
+
+        threshold = self.gap_threshold
+        if threshold is None and median is not None:
+            threshold = self.gap_factor * median
+        if self.gap_threshold is not None:
+            n_gaps = self.n_gaps_exact
+        elif threshold is not None:
+            lower_edges = 2.0 ** (np.arange(N_DELTA_BINS) / BINS_PER_OCTAVE)
+            n_gaps = int(self.histogram[lower_edges > threshold].sum())
+        else:
+            n_gaps = 0
+
+        order = np.argsort(-self.gap_deltas, kind='stable')
+        largest = [
+            {
+                'start': str(self._timestamp(start)),
+                'end': str(self._timestamp(start + delta_ns)),
+                'duration_seconds': delta_ns / NS_PER_SECOND
+            }
+            for delta_ns, start in zip(self.gap_deltas[order].tolist(), self.gap_starts[order].tolist())
+            if threshold is not None and delta_ns > threshold
+        ]
+
+        used = np.flatnonzero(self.histogram)
+        histogram = {'lower_edges_seconds': [], 'counts': []}
+        if len(used):
+            bins = np.arange(used[0], used[-1] + 1)
+            histogram = {
+                'lower_edges_seconds': (2.0 ** (bins / BINS_PER_OCTAVE) / NS_PER_SECOND).tolist(),
+                'counts': self.histogram[bins].tolist()
+            }
+
+        return {
+            'n_obs': self.n_obs,
+            'n_missing': self.n_missing,
+            'start': None if self.min is None else str(self._timestamp(self.min)),
+            'end': None if self.max is None else str(self._timestamp(self.max)),
+            'span_seconds': None if self.min is None else (self.max - self.min) / NS_PER_SECOND,
+            'is_monotonic_increasing': self.n_out_of_order == 0,
+            'is_unique': self.n_duplicates == 0,
+            'n_out_of_order': self.n_out_of_order,
+            'n_duplicate_timestamps': self.n_duplicates,
+            'delta_seconds': delta,
+            'delta_histogram': histogram,
+            'gap_threshold_seconds': None if threshold is None else threshold / NS_PER_SECOND,
+            'n_gaps': n_gaps,
+            'largest_gaps': largest
+        }
+
+    def _timestamp(self, ns: int) -> pd.Timestamp:
+        stamp = pd.Timestamp(int(ns), unit='ns')
+        return stamp.tz_localize('UTC').tz_convert(self.tz) if self.tz is not None else stamp
+
+
+def profile_time_index(times: pd.Series | pd.DatetimeIndex | Iterable | str | Path,
+                       column: str | None = None,
+                       top_k: int = 10,
+                       gap_threshold: str | pd.Timedelta | None = None,
+                       gap_factor: float = 2.0,
+                       batch_size: int = 1_000_000) -> dict:
+    """
+    Profile a time column: duplicates, ordering, sampling deltas and gaps.
+
+    Args:
+        times (pd.Series | pd.DatetimeIndex | Iterable | str | Path): Datetime values
+            (in any order), an iterable of chunks covering consecutive time ranges
+            (each in any order), or a Parquet file / dataset directory (requires
+            `column`).
+        column (str | None): Column to read from Parquet.
+        top_k (int): Number of largest gaps reported. Defaults to 10.
+        gap_threshold (str | pd.Timedelta | None): Deltas above this are gaps. Defaults
+            to `gap_factor` times the median delta.
+        gap_factor (float): See `TimeIndexProfiler`. Defaults to 2.
+        batch_size (int): Rows per chunk when reading Parquet. Defaults to 1,000,000.
+
+    Returns:
+        dict: See `TimeIndexProfiler.profile`.
+
+    Raises:
+        ValueError: If Parquet input is given without `column`.
+    """
+    if isinstance(times, (str, Path)):
+        if column is None:
+            raise ValueError("'column' is required when reading from Parquet.")
+        from ..categorical.streaming_univariate_categorical_analysis import iter_parquet_column
+        times = iter_parquet_column(times, column, batch_size=batch_size)
+    elif isinstance(times, (pd.Series, pd.Index, np.ndarray)):
+        times = [times]
+
+    profiler = TimeIndexProfiler(top_k=top_k, gap_threshold=gap_threshold, gap_factor=gap_factor)
+    for chunk in times:
+        profiler.update(chunk)
+    return profiler.profile()
+
+
+def _as_datetime_index(chunk) -> pd.DatetimeIndex:
+    if isinstance(chunk, pd.Series) and isinstance(chunk.dtype, pd.ArrowDtype):
+        chunk = chunk.astype(f"datetime64[ns, {chunk.dtype.pyarrow_dtype.tz}]" if getattr(chunk.dtype.pyarrow_dtype, 'tz', None) else "datetime64[ns]")
+    if not pd.api.types.is_datetime64_any_dtype(chunk):
+        raise TypeError("Time values must be datetime64 dtype.")
+    times = pd.DatetimeIndex(chunk)
+    if times.unit != 'ns':
+        times = times.as_unit('ns')
+    return times
+
+
+def _combine(func, a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return func(a, b)
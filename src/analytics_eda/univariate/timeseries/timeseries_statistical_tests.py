@@ -0,0 +1,129 @@
+# Copyright 2025 ArchiStrata, LLC and Andrew Dabrowski
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import uuid
+import warnings
+
+import pandas as pd
+from statsmodels.tools.sm_exceptions import InterpolationWarning
+from statsmodels.tsa.stattools import adfuller, kpss
+
+from .mann_kendall_test import mann_kendall_test
+from .detect_change_points import detect_change_points
+from .block_average import block_average
+
+logger = logging.getLogger(__name__)
+
+def timeseries_statistical_tests(series: pd.Series,
+                                 alpha: float = 0.05,
+                                 max_change_points: int = 10,
+                                 max_stationarity_points: int | None = 10_000,
+                                 report_log_id = str(uuid.uuid4())) -> dict:
+    """
+    Stationarity, trend and change-point tests for a time series.
+
+    - Stationarity: Augmented Dickey-Fuller (null: unit root) and KPSS (null:
+      level stationarity). The series is called stationary when ADF rejects and
+      KPSS does not. Both fit lagged regressions whose size grows with the series,
+      so longer series are block-averaged to `max_stationarity_points` first.
+    - Trend: Mann-Kendall test (see `mann_kendall_test`).
+    - Change points: binary segmentation of the mean (see `detect_change_points`),
+      reported with the timestamps where each new segment starts.
+
+    Each test is run independently; a failing test is reported as
+    {'error': str, 'report_log_id': str} without stopping the others.
+
+    Args:
+        series (pd.Series): Series without missing values, sorted by time.
+        alpha (float): Significance level. Defaults to 0.05.
+        max_change_points (int): Maximum number of change points. Defaults to 10.
+        max_stationarity_points (int | None): Maximum number of values passed to ADF and
+            KPSS. Defaults to 10,000; None uses the full series.
+        report_log_id (str): report log id.
+
+    Returns:
+        dict: {
+            'stationarity': {'adf': {...}, 'kpss': {...}, 'is_stationary': bool | None,
+                             'n_obs_used': int, 'block_size': int},
+            'trend': {'mann_kendall': {...}},
+            'change_points': {...}
+        }
+    """
+    values = series.to_numpy(dtype=float)
+    reduced, block_size = block_average(series, max_stationarity_points)
+    reduced = reduced.to_numpy(dtype=float)
+
+    def run(name, func):
+        try:
+            return func()
+        except Exception as e:
+            logger.exception(
+                f"{name} failed",
+                extra={
+                    'series_name': series.name,
+                    'report_log_id': report_log_id
+                }
+            )
+            return {
+                'error': str(e),
+                'report_log_id': report_log_id
+            }
+
+    def adf():
+        stat, p, used_lag, n_obs, critical, _ = adfuller(reduced, autolag='AIC', result_object=False)
+        return {
+            'statistic': float(stat),
+            'p_value': float(p),
+            'reject': bool(p < alpha),
+            'used_lag': int(used_lag),
+            'critical_values': {k: float(v) for k, v in critical.items()}
+        }
+
+    def kpss_test():
+        with warnings.catch_warnings():
+            # p-values outside the tabulated range are clipped and flagged with a warning
+            warnings.simplefilter('ignore', InterpolationWarning)
+            stat, p, lags, critical = kpss(reduced, regression='c', nlags='auto', result_object=False)
+        return {
+            'statistic': float(stat),
+            'p_value': float(p),
+            'reject': bool(p < alpha),
+            'used_lag': int(lags),
+            'critical_values': {k: float(v) for k, v in critical.items()}
+        }
+
+    def change_points():
+        result = detect_change_points(values, max_change_points=max_change_points)
+        result['change_times'] = [str(t) for t in series.index[result['change_points']]]
+        return result
+
+    adf_result = run('adfuller', adf)
+    kpss_result = run('kpss', kpss_test)
+    is_stationary = None
+    if 'error' not in adf_result and 'error' not in kpss_result:
+        is_stationary = adf_result['reject'] and not kpss_result['reject']
+
+    return {
+        'stationarity': {
+            'adf': adf_result,
+            'kpss': kpss_result,
+            'is_stationary': is_stationary,
+            'n_obs_used': int(len(reduced)),
+            'block_size': block_size
+        },
+        'trend': {
+            'mann_kendall': run('mann_kendall_test', lambda: mann_kendall_test(values, alpha))
+        },
+        'change_points': run('detect_change_points', change_points)
+    }
@@ -19,21 +19,46 @@ import pandas as pd
 from ...core.reporting import write_json_report
 
 from .visualize_time_series_structure import visualize_time_series_structure
+from .prepare_time_series import prepare_time_series
+from .autocorrelation_analysis import autocorrelation_analysis
+from .seasonal_decomposition import seasonal_decomposition
+from .timeseries_statistical_tests import timeseries_statistical_tests
+from .time_index_profiler import profile_time_index
+from .resample_time_series import resample_time_series, RESAMPLE_AGGREGATES
 
 logger = logging.getLogger(__name__)
 
+RESAMPLE_FILLS = ('interpolate', 'ffill', 'drop')
+
 def univariate_timeseries_analysis(df: pd.DataFrame,
                                    numeric_col: str,
                                    time_col: str,
                                    report_root: str = 'reports/eda/univariate/timeseries',
-                                   rolling_window: int = 12,
-                                   report_log_id = str(uuid.uuid4())) -> Path:
+                                   rolling_window: int | str = 12,
+                                   report_log_id = str(uuid.uuid4()),
+                                   alpha: float = 0.05,
+                                   rolling_approximate: bool = False,
+                                   stl_resolution: str | None = None,
+                                   stl_max_points: int | None = 10_000,
+                                   period_method: str = 'periodogram',
+                                   plot_max_points: int | None = 7_200,
+                                   plot_method: str = 'minmax',
+                                   max_change_points: int = 10,
+                                   resample_freq: str | None = None,
+                                   resample_agg: str = 'mean',
+                                   resample_fill: str = 'interpolate') -> Path:
     """
     Run full univariate time-series analysis for a single numeric series.
 
-    Validates input types, drops missing data, sets the datetime index,
-    generates structure visualizations, and writes a JSON report with paths
-    to all generated visuals.
+    Validates input types, profiles the time column (duplicate timestamps, ordering,
+    sampling deltas and gaps), projects the time and value columns into a single
+    time-indexed series (dropping missing data and sorting only if needed),
+    optionally aggregates it to a target frequency,
+    computes the ACF/PACF with confidence bands, detects the seasonal period and
+    fits STL on a bounded resolution, runs stationarity (ADF/KPSS), Mann-Kendall
+    trend and change-point tests, generates structure visualizations
+    from that series, and writes a JSON report with the autocorrelation values and
+    paths to all generated visuals.
 
     Parameters:
     - df (pd.DataFrame): DataFrame containing the time and value columns.
@@ -41,8 +66,32 @@ def univariate_timeseries_analysis(df: pd.DataFrame,
     - time_col (str): Name of the datetime column (must be datetime64[ns] dtype).
     - report_root (str): Base directory under which a subfolder for this analysis
       will be created.
-    - rolling_window (int): Window size for rolling statistics (default: 12).
+    - rolling_window (int | str): Window for rolling statistics, in rows or as a time
+      span such as '7D' (default: 12).
     - report_log_id (str): report log id.
+    - alpha (float): Significance level of the ACF/PACF confidence bands and of the
+      statistical tests (default: 0.05).
+    - rolling_approximate (bool): Use approximate rolling quantiles for long windows
+      (default: False).
+    - stl_resolution (str | None): Time resolution (e.g. '1h') the series is resampled
+      to before period detection and STL (default: None, keep the original spacing).
+    - stl_max_points (int | None): Maximum number of values passed to STL; longer
+      series are block-averaged first (default: 10,000).
+    - period_method (str): Seasonal period detection method, 'periodogram' or 'acf'
+      (default: 'periodogram').
+    - plot_max_points (int | None): Maximum points per line in the raw and rolling plots;
+      longer series are downsampled for plotting only (default: 7,200).
+    - plot_method (str): Plot downsampling method, 'minmax' or 'lttb' (default: 'minmax').
+    - max_change_points (int): Maximum number of mean change points reported (default: 10).
+    - resample_freq (str | None): If set (e.g. '1min'), the series is aggregated to this
+      frequency before every downstream stage (default: None, raw resolution).
+    - resample_agg (str): Aggregate the downstream stages run on: 'mean', 'min', 'max',
+      'count' or 'last' (default: 'mean'). All of them are computed in one pass.
+    - resample_fill (str): How empty buckets are handled before the downstream stages,
+      which assume evenly spaced values: 'interpolate' (linear in time), 'ffill'
+      (last non-empty bucket) or 'drop' (remove them, leaving an unevenly spaced
+      series). Empty buckets of the 'count' aggregate are 0 and need no filling
+      (default: 'interpolate').
 
     Returns:
     - pathlib.Path: Path to the JSON report summarizing the analysis.
@@ -56,40 +105,96 @@ def univariate_timeseries_analysis(df: pd.DataFrame,
         }
     )
 
-    # Work on a copy to preserve original data
-    df_copy = df.copy()
-
     # 1. Validate that time_col is datetime64
-    if not pd.api.types.is_datetime64_any_dtype(df_copy[time_col]):
+    if not pd.api.types.is_datetime64_any_dtype(df[time_col]):
         raise TypeError(
-            f"Column '{time_col}' is of type {df_copy[time_col].dtype}; "
+            f"Column '{time_col}' is of type {df[time_col].dtype}; "
             "expected datetime64 dtype. "
             "Please convert it to datetime in your cleaning pipeline before analysis."
         )
 
     # 2. Validate that numeric_col is numeric
-    if not pd.api.types.is_numeric_dtype(df_copy[numeric_col]):
+    if not pd.api.types.is_numeric_dtype(df[numeric_col]):
         raise TypeError(
-            f"Column '{numeric_col}' is of type {df_copy[numeric_col].dtype}; "
+            f"Column '{numeric_col}' is of type {df[numeric_col].dtype}; "
             "expected a numeric dtype. "
             "Please convert it to numeric in your cleaning pipeline before analysis."
         )
 
-    # 3. Drop rows with missing values in essential columns
-    df_copy = df_copy.dropna(subset=[time_col, numeric_col])
-
-    # 4. Set datetime index and sort chronologically
-    df_copy = df_copy.set_index(time_col).sort_index()
+    if resample_agg not in RESAMPLE_AGGREGATES:
+        raise ValueError(f"Unsupported resample_agg '{resample_agg}'. Use one of {RESAMPLE_AGGREGATES}.")
+    if resample_fill not in RESAMPLE_FILLS:
+        raise ValueError(f"Unsupported resample_fill '{resample_fill}'. Use one of {RESAMPLE_FILLS}.")
+
+    # 3. Profile the raw time column (duplicates, ordering, deltas, gaps)
+    time_index = profile_time_index(df[time_col])
+
+    # 4. Project the two columns, drop missing rows, index by time and sort once
+    series = prepare_time_series(df, numeric_col, time_col)
+
+    # 5. Optional aggregation to a target frequency (one pass over the int64 index)
+    resampling = {
+        'freq': resample_freq,
+        'aggregate': resample_agg if resample_freq else None,
+        'n_obs_raw': int(len(series)),
+        'n_obs_aggregated': int(len(series)),
+        'n_empty_buckets': 0,
+        'fill': None
+    }
+    if resample_freq is not None:
+        aggregated, n_empty = resample_time_series(series, resample_freq)
+        series = aggregated[resample_agg].astype(float).rename(numeric_col)
+        series.index.name = time_col
+        # Empty buckets are NaN (except for counts); fill or drop them explicitly
+        if resample_fill == 'interpolate':
+            series = series.interpolate(method='time')
+        elif resample_fill == 'ffill':
+            series = series.ffill()
+        else:
+            series = series.dropna()
+        resampling.update(
+            n_obs_aggregated=int(len(series)),
+            n_empty_buckets=n_empty,
+            fill=resample_fill if n_empty else None,
+            count_per_bucket={
+                'min': int(aggregated['count'].min()),
+                'mean': float(aggregated['count'].mean()),
+                'max': int(aggregated['count'].max())
+            }
+        )
 
-    # 5. Prepare report directory
+    # 6. Prepare report directory
     report_dir = Path(report_root) / f"{time_col.replace(' ', '_')}_{numeric_col.replace(' ', '_')}"
     report_dir.mkdir(parents=True, exist_ok=True)
 
-    # 6. Visualize Time Series Structure
-    visuals = visualize_time_series_structure(df, numeric_col, time_col, report_dir, rolling_window, report_log_id=report_log_id)
+    # 7. Autocorrelation (ACF via FFT, PACF via Levinson-Durbin)
+    autocorrelation = autocorrelation_analysis(series, alpha=alpha)
+
+    # 8. Seasonality (period detected via FFT, STL on a bounded resolution)
+    decomposition = seasonal_decomposition(
+        series, resolution=stl_resolution, max_points=stl_max_points, method=period_method
+    )
+
+    # 9. Statistical tests (stationarity, trend, change points)
+    statistical_tests = timeseries_statistical_tests(
+        series, alpha=alpha, max_change_points=max_change_points, report_log_id=report_log_id
+    )
+
+    # 10. Visualize Time Series Structure
+    visuals = visualize_time_series_structure(
+        series, numeric_col, time_col, report_dir, rolling_window,
+        report_log_id=report_log_id, autocorrelation=autocorrelation,
+        rolling_approximate=rolling_approximate, decomposition=decomposition,
+        plot_max_points=plot_max_points, plot_method=plot_method
+    )
 
     # Generate report
     eda_report = {
+        'time_index': time_index,
+        'resampling': resampling,
+        'autocorrelation': autocorrelation,
+        'seasonality': decomposition[0],
+        'statistical_tests': statistical_tests,
         'visuals': visuals
     }
 
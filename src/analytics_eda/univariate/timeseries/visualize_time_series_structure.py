@@ -14,19 +14,31 @@
 from pathlib import Path
 import logging
 import uuid
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
-from statsmodels.tsa.seasonal import STL
+from statsmodels.tsa.seasonal import DecomposeResult
+
+from .prepare_time_series import prepare_time_series
+from .autocorrelation_analysis import autocorrelation_analysis
+from .rolling_statistics import rolling_statistics
+from .seasonal_decomposition import seasonal_decomposition
+from .downsample_for_plot import downsample_for_plot
 
 logger = logging.getLogger(__name__)
 
-def visualize_time_series_structure(df: pd.DataFrame,
+def visualize_time_series_structure(df: pd.DataFrame | pd.Series,
                                   numeric_col: str,
                                   time_col: str,
                                   report_dir: Path,
-                                  rolling_window: int = 12,
-                                  report_log_id = str(uuid.uuid4())) -> dict:
+                                  rolling_window: int | str = 12,
+                                  report_log_id = str(uuid.uuid4()),
+                                  autocorrelation: dict | None = None,
+                                  rolling_approximate: bool = False,
+                                  decomposition: tuple[dict, DecomposeResult | None] | None = None,
+                                  plot_max_points: int | None = 7_200,
+                                  plot_method: str = 'minmax',
+                                  rolling: pd.DataFrame | None = None) -> dict:
     """
     Visualize Time Series Structure
     ---------------------------------------
@@ -34,11 +46,24 @@ def visualize_time_series_structure(df: pd.DataFrame,
     returns a mapping of plot names to file paths.
 
     Parameters:
-    - df (pd.DataFrame): DataFrame with datetime index or a datetime column.
+    - df (pd.DataFrame | pd.Series): DataFrame with datetime index or a datetime column,
+      or a Series already prepared by `prepare_time_series` (used as is, no copy or sort).
     - numeric_col (str): Name of the numeric series column.
     - time_col (str): Name of the datetime column (if not already index).
     - report_dir (Path): Directory under which plots are saved.
-    - rolling_window (int): Window size for rolling statistics.
+    - rolling_window (int | str): Window for rolling statistics, in rows or as a
+      time span (e.g. '7D').
+    - report_log_id (str): report log id.
+    - autocorrelation (dict | None): Result of `autocorrelation_analysis` for this series.
+      The ACF/PACF plots are drawn from these arrays; computed here if None.
+    - rolling_approximate (bool): Use approximate rolling quantiles (see `rolling_statistics`).
+    - decomposition (tuple | None): Result of `seasonal_decomposition` for this series.
+      Computed here with the defaults if None.
+    - plot_max_points (int | None): Maximum points per line in the raw and rolling plots;
+      longer series are downsampled with `downsample_for_plot` (None plots every point).
+    - plot_method (str): Downsampling method, 'minmax' or 'lttb'.
+    - rolling (pd.DataFrame | None): Result of `rolling_statistics` for this series
+      with `rolling_window`. Computed here if None.
 
     Returns:
     - visuals (dict): {visual_name: file_path, ...}
@@ -55,22 +80,110 @@ def visualize_time_series_structure(df: pd.DataFrame,
     visuals = {}
     report_dir.mkdir(parents=True, exist_ok=True)
 
-    # 1. Prepare time series
-    ts = df.copy()
-    if time_col in ts.columns:
-        if not pd.api.types.is_datetime64_any_dtype(ts[time_col]):
-            raise TypeError(f"'{time_col}' must be datetime64 dtype before structure analysis.")
-        ts = ts.set_index(time_col)
-    ts = ts.sort_index()
-    series = ts[numeric_col].dropna()
+    # 1. Prepare time series (only the two needed columns, sorted at most once)
+    if isinstance(df, pd.Series):
+        series = df
+    else:
+        series = prepare_time_series(df, numeric_col, time_col)
 
-    # 2. Plot raw time series
+    # 2. Plot raw time series (peak and trough from the full data, line downsampled)
     raw_path = report_dir / 'raw_line_plot.png'
-    max_time, max_val = series.idxmax(), series.max()
-    min_time, min_val = series.idxmin(), series.min()
+    rows = downsample_for_plot(series.index, series.to_numpy(dtype=float), plot_max_points, plot_method)
+    plot_raw_series(series.iloc[rows], numeric_col,
+                    (series.idxmax(), series.max()), (series.idxmin(), series.min()), raw_path)
+    visuals['raw_line_plot'] = str(raw_path)
+
+    # 3. Plot rolling statistics
+    roll_path = report_dir / 'rolling_statistics.png'
+
+    if rolling is None:
+        rolling = rolling_statistics(series, rolling_window, min_periods=1, approximate=rolling_approximate)
+    rolling = with_rolling_bands(rolling)
+
+    # One shared set of rows keeps every line and band extreme visible
+    rows = downsample_for_plot(rolling.index, rolling.to_numpy(), plot_max_points, plot_method)
+    plot_rolling_statistics(rolling.iloc[rows], numeric_col, rolling_window, roll_path)
+    visuals['rolling_statistics'] = str(roll_path)
+
+    # 4-5. ACF / PACF (drawn from precomputed arrays)
+    if autocorrelation is None:
+        autocorrelation = autocorrelation_analysis(series)
+
+    acf_path = report_dir / 'acf.png'
+    plot_correlogram(autocorrelation['lags'], autocorrelation['acf'], autocorrelation['acf_band'],
+                      'Autocorrelation (ACF)', acf_path)
+    visuals['acf'] = str(acf_path)
+
+    pacf_path = report_dir / 'pacf.png'
+    plot_correlogram(autocorrelation['lags'], autocorrelation['pacf'], autocorrelation['pacf_band'],
+                      'Partial Autocorrelation (PACF)', pacf_path)
+    visuals['pacf'] = str(pacf_path)
+
+    # 6. STL decomposition
+    stl_path = report_dir / 'stl_decomposition.png'
+
+    # Period detected from the data (any frequency), on a bounded resolution
+    if decomposition is None:
+        decomposition = seasonal_decomposition(series)
+    _, result = decomposition
+
+    if result is not None:
+        plot_stl_decomposition(result, stl_path)
+        visuals['stl_decomposition'] = str(stl_path)
+    else:
+        logger.warning(
+            "visualize_time_series_structure: Skipped STL decomposition (no seasonal period found)",
+            extra={
+                'time_col': time_col,
+                'numeric_col': numeric_col,
+                'report_log_id': report_log_id
+            }
+        )
+
+    logger.info(
+        "Completed visualize_time_series_structure",
+        extra={
+            'time_col': time_col,
+            'numeric_col': numeric_col,
+            'report_log_id': report_log_id
+        }
+    )
+
+    return visuals
+
+
+def plot_correlogram(lags: list, values: list, band: list, title: str, path: Path) -> None:
+    """
+    Draw a correlogram (stems and a shaded confidence band around zero) from arrays.
+    """
+    lags = np.asarray(lags)
+    values = np.asarray(values, dtype=float)
+    band = np.asarray(band, dtype=float)
+
+    fig, ax = plt.subplots()
+    ax.vlines(lags, 0, values, linewidth=1)
+    ax.scatter(lags, values, s=20, zorder=3)
+    ax.axhline(0, color='black', linewidth=0.8)
+    ax.fill_between(lags, -band, band, alpha=0.25, linewidth=0)
+    ax.set_title(title)
+    ax.set_xlabel('Lag')
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+
+
+def plot_raw_series(plot_series: pd.Series, numeric_col: str, peak: tuple, trough: tuple, path: Path) -> None:
+    """
+    Draw the raw line plot with peak and trough annotations.
+
+    `plot_series` may be downsampled; `peak` and `trough` are (time, value) pairs
+    computed on the full series.
+    """
+    max_time, max_val = peak
+    min_time, min_val = trough
 
     plt.figure(figsize=(12, 5))
-    plt.plot(series.index, series.values, linewidth=2, label=numeric_col)
+    plt.plot(plot_series.index, plot_series.values, linewidth=2, label=numeric_col)
     plt.scatter([max_time, min_time], [max_val, min_val],
                 color='firebrick', zorder=5)
     plt.annotate(f'Peak: {max_val:.1f}',
@@ -91,31 +204,36 @@ def visualize_time_series_structure(df: pd.DataFrame,
     plt.legend(loc='upper left')
     plt.tight_layout()
 
-    plt.savefig(raw_path, dpi=300)
+    plt.savefig(path, dpi=300)
     plt.close()
-    visuals['raw_line_plot'] = str(raw_path)
 
-    # 3. Plot rolling statistics
-    roll_path = report_dir / 'rolling_statistics.png'
 
-    rolling_mean   = series.rolling(rolling_window, min_periods=1).mean()
-    rolling_med    = series.rolling(rolling_window, min_periods=1).median()
-    rolling_std    = series.rolling(rolling_window, min_periods=1).std()
-    rolling_q25    = series.rolling(rolling_window, min_periods=1).quantile(0.25)
-    rolling_q75    = series.rolling(rolling_window, min_periods=1).quantile(0.75)
+def with_rolling_bands(rolling: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace the rolling 'std' column of `rolling_statistics` by the ±2 std bands.
+    """
+    rolling = rolling.copy()
+    rolling['upper_band'] = rolling['mean'] + 2*rolling['std']
+    rolling['lower_band'] = rolling['mean'] - 2*rolling['std']
+    return rolling.drop(columns='std')
+
 
+def plot_rolling_statistics(rolling: pd.DataFrame, numeric_col: str, rolling_window, path: Path) -> None:
+    """
+    Draw rolling mean and median with ±2 std and interquartile bands.
+
+    `rolling` has the columns of `with_rolling_bands` and may be downsampled.
+    """
     plt.figure(figsize=(12, 6))
-    plt.plot(rolling_mean,    label=f'Rolling Mean ({rolling_window})',    linewidth=2)
-    plt.plot(rolling_med,     label=f'Rolling Median ({rolling_window})',  linestyle='--')
+    plt.plot(rolling['mean'],   label=f'Rolling Mean ({rolling_window})',    linewidth=2)
+    plt.plot(rolling['median'], label=f'Rolling Median ({rolling_window})',  linestyle='--')
 
     # Std‐bands (mean ± 2σ)
-    upper_band = rolling_mean + 2*rolling_std
-    lower_band = rolling_mean - 2*rolling_std
-    plt.fill_between(series.index, lower_band, upper_band,
+    plt.fill_between(rolling.index, rolling['lower_band'], rolling['upper_band'],
                      color='grey', alpha=0.2, label='±2 Std Dev')
 
     # IQR shading
-    plt.fill_between(series.index, rolling_q25, rolling_q75,
+    plt.fill_between(rolling.index, rolling['q25'], rolling['q75'],
                      color='blue', alpha=0.1, label='25–75th Percentile')
 
     # Styling
@@ -126,68 +244,16 @@ def visualize_time_series_structure(df: pd.DataFrame,
     plt.grid(True, linestyle='--', alpha=0.3)
     plt.tight_layout()
 
-    plt.savefig(roll_path, dpi=300)
+    plt.savefig(path, dpi=300)
     plt.close()
-    visuals['rolling_statistics'] = str(roll_path)
-
-    # 4. ACF
-    acf_path = report_dir / 'acf.png'
-    fig_acf = plot_acf(series, lags=min(len(series)//2, 40))
-    fig_acf.suptitle('Autocorrelation (ACF)')
-    fig_acf.tight_layout()
-    fig_acf.savefig(acf_path, dpi=300)
-    plt.close(fig_acf)
-    visuals['acf'] = str(acf_path)
 
-    # 5. PACF
-    pacf_path = report_dir / 'pacf.png'
-    fig_pacf = plot_pacf(series, lags=min(len(series)//2, 40))
-    fig_pacf.suptitle('Partial Autocorrelation (PACF)')
-    fig_pacf.tight_layout()
-    fig_pacf.savefig(pacf_path, dpi=300)
-    plt.close(fig_pacf)
-    visuals['pacf'] = str(pacf_path)
-
-    # 6. STL decomposition
-    stl_path = report_dir / 'stl_decomposition.png'
 
-    # Infer seasonal period (e.g., 12 for monthly, 7 for daily if weekly seasonality)
-    freq = ts.index.inferred_freq
-    if freq is None:
-        freq = pd.infer_freq(ts.index)
-
-    period = None
-    if freq is not None:
-        if 'ME' in str(freq):
-            period = 12
-        elif 'D' in str(freq):
-            period = 7
-    if period:
-        stl = STL(series, period=period)
-        result = stl.fit()
-        fig = result.plot()
-        fig.suptitle('STL Decomposition')
-        fig.tight_layout()
-        fig.savefig(stl_path, dpi=300)
-        plt.close(fig)
-        visuals['stl_decomposition'] = str(stl_path)
-    else:
-        logger.warning(
-            "visualize_time_series_structure: Skipped STL decomposition (could not infer period)",
-            extra={
-                'time_col': time_col,
-                'numeric_col': numeric_col,
-                'report_log_id': report_log_id
-            }
-        )
-
-    logger.info(
-        "Completed visualize_time_series_structure",
-        extra={
-            'time_col': time_col,
-            'numeric_col': numeric_col,
-            'report_log_id': report_log_id
-        }
-    )
-
-    return visuals
+def plot_stl_decomposition(result: DecomposeResult, path: Path) -> None:
+    """
+    Draw a fitted STL decomposition.
+    """
+    fig = result.plot()
+    fig.suptitle('STL Decomposition')
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
@@ -0,0 +1,43 @@
+import json
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.bivariate.bivariate_categorical_categorical.bivariate_categorical_categorical_analysis import bivariate_categorical_categorical_analysis
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(2)
+    color = rng.choice(['red', 'green', 'blue'], size=300)
+    return pd.DataFrame({
+        'color': color,
+        'shade': pd.Series(np.where(color == 'red', 'warm', 'cool')).astype('category'),
+        'size': rng.choice(['S', 'M', 'L'], size=300),
+        'value': rng.normal(size=300)
+    })
+
+def test_report(tmp_path, caplog, df):
+    caplog.set_level(logging.INFO)
+    report_path = bivariate_categorical_categorical_analysis(df, report_root=str(tmp_path))
+    report = json.loads(report_path.read_text())
+
+    assert report['metadata']['report_name'] == 'bivariate_categorical_categorical_analysis'
+    assert report['metadata']['parameters']['columns'] == ['color', 'shade', 'size']
+    eda = report['eda']
+    assert len(eda['pairs']) == 3
+    top = eda['strongest_pairs'][0]
+    assert {top['column_a'], top['column_b']} == {'color', 'shade'}
+    assert top['reject'] is True
+    assert eda['theils_u']['color']['shade'] == pytest.approx(1.0)
+    assert (tmp_path / "cramers_v_heatmap.png").exists()
+
+    assert any("Completed bivariate_categorical_categorical_analysis" in r.message for r in caplog.records)
+
+def test_validation(tmp_path, df):
+    with pytest.raises(KeyError):
+        bivariate_categorical_categorical_analysis(df, columns=['color', 'missing'], report_root=str(tmp_path))
+    with pytest.raises(TypeError):
+        bivariate_categorical_categorical_analysis(df, columns=['color', 'value'], report_root=str(tmp_path))
+    with pytest.raises(ValueError):
+        bivariate_categorical_categorical_analysis(df, columns=['color'], report_root=str(tmp_path))
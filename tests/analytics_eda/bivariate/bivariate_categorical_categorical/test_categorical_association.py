@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.stats import chi2_contingency
+from scipy.stats.contingency import association
+
+from analytics_eda.bivariate.bivariate_categorical_categorical.categorical_association import categorical_association
+
+@pytest.fixture
+def table():
+    return np.array([[30, 5, 0], [10, 40, 5], [0, 5, 25], [0, 0, 0]])
+
+def test_matches_scipy(table):
+    result = categorical_association(table)
+    observed = table[:3]
+    expected = chi2_contingency(observed, correction=False)
+
+    assert result['n_obs'] == table.sum()
+    assert result['chi2'] == pytest.approx(expected.statistic)
+    assert result['dof'] == expected.dof
+    assert result['p_value'] == pytest.approx(expected.pvalue)
+    assert result['cramers_v'] == pytest.approx(association(observed, method='cramer'))
+
+def test_theils_u(table):
+    result = categorical_association(table)
+    p = table / table.sum()
+    pa, pb = p.sum(axis=1), p.sum(axis=0)
+    h = lambda q: -np.sum(q[q > 0] * np.log(q[q > 0]))
+    mi = h(pa) + h(pb) - h(p.ravel())
+    assert result['theils_u_a_given_b'] == pytest.approx(mi / h(pa))
+    assert result['theils_u_b_given_a'] == pytest.approx(mi / h(pb))
+
+def test_sparse_equals_dense(table):
+    assert categorical_association(sparse.csr_matrix(table)) == categorical_association(table)
+
+def test_degenerate_table():
+    result = categorical_association(np.array([[5, 3]]))
+    assert result['chi2'] is None
+    assert result['cramers_v'] is None
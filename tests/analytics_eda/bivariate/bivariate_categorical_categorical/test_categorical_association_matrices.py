@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.bivariate.bivariate_categorical_categorical.categorical_association_matrices import categorical_association_matrices
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(1)
+    a = rng.choice(list('xyz'), size=400)
+    return pd.DataFrame({
+        'a': a,
+        'b': np.where(rng.random(400) < 0.8, a, 'w'),   # strongly tied to a
+        'c': rng.choice(list('pq'), size=400),           # independent
+        'd': pd.Categorical(rng.choice(list('mn'), size=400))
+    })
+
+def test_matrices(df):
+    result = categorical_association_matrices(df, ['a', 'b', 'c', 'd'])
+    assert result['cardinality'] == {'a': 3, 'b': 4, 'c': 2, 'd': 2}
+    assert len(result['pairs']) == 6
+    assert result['cramers_v'].loc['a', 'b'] > 0.8
+    assert result['cramers_v'].loc['a', 'c'] < 0.2
+    assert result['cramers_v'].loc['b', 'a'] == result['cramers_v'].loc['a', 'b']
+    assert result['theils_u'].loc['a', 'a'] == 1.0
+
+def test_process_pool_and_sparse_match_sequential(df):
+    sequential = categorical_association_matrices(df, ['a', 'b', 'c', 'd'])
+    parallel = categorical_association_matrices(df, ['a', 'b', 'c', 'd'], n_jobs=2, sparse_threshold=0)
+    pd.testing.assert_frame_equal(parallel['cramers_v'], sequential['cramers_v'])
+    pd.testing.assert_frame_equal(parallel['theils_u'], sequential['theils_u'])
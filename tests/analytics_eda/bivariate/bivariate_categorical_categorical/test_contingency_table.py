@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from analytics_eda.bivariate.bivariate_categorical_categorical.contingency_table import contingency_table
+
+def test_dense_matches_crosstab():
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, 4, 500), rng.integers(0, 6, 500)
+    table = contingency_table(a, 4, b, 6)
+    np.testing.assert_array_equal(table, pd.crosstab(a, b).to_numpy())
+
+def test_missing_codes_dropped_and_sparse_path():
+    a = np.array([0, 1, -1, 1, 2])
+    b = np.array([1, 0, 0, -1, 1])
+    dense = contingency_table(a, 3, b, 2)
+    assert dense.sum() == 3
+
+    table = contingency_table(a, 3, b, 2, sparse_threshold=0)
+    assert sparse.issparse(table)
+    np.testing.assert_array_equal(table.toarray(), dense)
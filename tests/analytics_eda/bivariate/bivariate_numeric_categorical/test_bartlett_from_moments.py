@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from scipy.stats import bartlett
+
+from analytics_eda.bivariate.bivariate_numeric_categorical.bartlett_from_moments import bartlett_from_moments
+
+@pytest.fixture
+def groups():
+    rng = np.random.default_rng(4)
+    return [rng.normal(10, scale, size) for scale, size in [(1, 40), (2, 60), (1.2, 25), (0.8, 90)]]
+
+def test_matches_scipy(groups):
+    counts = [len(g) for g in groups]
+    sums = [g.sum() for g in groups]
+    sum_squares = [(g ** 2).sum() for g in groups]
+
+    statistic, p_value = bartlett_from_moments(counts, sums, sum_squares)
+    expected = bartlett(*groups)
+    assert statistic == pytest.approx(expected.statistic, rel=1e-8)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-6)
+
+def test_centered_matches_scipy(groups):
+    counts = [len(g) for g in groups]
+    sums = [g.sum() for g in groups]
+    m2 = [((g - g.mean()) ** 2).sum() for g in groups]
+
+    statistic, p_value = bartlett_from_moments(counts, sums, m2, centered=True)
+    expected = bartlett(*groups)
+    assert statistic == pytest.approx(expected.statistic, rel=1e-10)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-8)
+
+def test_requires_two_groups():
+    with pytest.raises(ValueError):
+        bartlett_from_moments([5], [10.0], [30.0])
@@ -1,6 +1,8 @@
 import pytest
 import pandas as pd
 import json
+from pathlib import Path
+import numpy as np
 
 from analytics_eda.bivariate.bivariate_numeric_categorical.bivariate_numeric_categorical_analysis import bivariate_numeric_categorical_analysis
 
@@ -104,3 +106,52 @@ def test_integration_creates_report(tmp_path, caplog, sample_df):
     assert complete_log.categorical_col == 'category'
     assert complete_log.report_path == str(report_path)
     assert hasattr(complete_log, 'report_log_id')
+
+@pytest.fixture
+def segmented_df():
+    rng = np.random.default_rng(2)
+    sizes = {'A': 40, 'B': 30, 'C': 20, 'D': 10}
+    return pd.DataFrame({
+        'category': np.repeat(list(sizes), list(sizes.values())),
+        'value': rng.normal(size=sum(sizes.values()))
+    })
+
+def test_parallel_segments_match_sequential(tmp_path, segmented_df):
+    sequential = bivariate_numeric_categorical_analysis(segmented_df, 'value', 'category', report_root=str(tmp_path / "seq"), bootstrap_samples=50)
+    parallel = bivariate_numeric_categorical_analysis(segmented_df, 'value', 'category', report_root=str(tmp_path / "par"), n_jobs=2, bootstrap_samples=50)
+
+    seq_segments = json.loads(sequential.read_text())['eda']['segments_report']
+    par_segments = json.loads(parallel.read_text())['eda']['segments_report']
+    assert list(par_segments) == list(seq_segments) == ['A', 'B', 'C', 'D']
+    assert all('error' not in report for report in par_segments.values())
+
+def test_max_segments_pools_other(tmp_path, segmented_df):
+    report_path = bivariate_numeric_categorical_analysis(segmented_df, 'value', 'category', report_root=str(tmp_path), max_segments=2, bootstrap_samples=50)
+    eda = json.loads(report_path.read_text())['eda']
+    segments = eda['segments_report']
+    assert list(segments) == ['A', 'B', '__other__']
+    assert eda['pooled_segments'] == ['C', 'D']
+
+    other_report = json.loads(Path(segments['__other__']).read_text())
+    assert other_report['eda']['missing_data']['total'] == 30
+
+def test_real_other_category_is_not_overwritten(tmp_path, segmented_df):
+    segmented_df['category'] = segmented_df['category'].replace({'A': 'other'})
+    report_path = bivariate_numeric_categorical_analysis(segmented_df, 'value', 'category', report_root=str(tmp_path), max_segments=2, bootstrap_samples=50)
+    eda = json.loads(report_path.read_text())['eda']
+    assert set(eda['segments_report']) == {'other', 'B', '__other__'}
+
+def test_segment_errors_are_captured(tmp_path, sample_df, monkeypatch):
+    import sys
+    module = sys.modules[bivariate_numeric_categorical_analysis.__module__]
+
+    def failing(values, **kwargs):
+        if values.iloc[0] == 3.0:
+            raise ValueError("segment failed")
+        return "ok"
+
+    monkeypatch.setattr(module, "univariate_numeric_analysis", failing)
+    report_path = bivariate_numeric_categorical_analysis(sample_df, 'value', 'category', report_root=str(tmp_path))
+    segments = json.loads(report_path.read_text())['eda']['segments_report']
+    assert segments['A'] == "ok"
+    assert segments['B']['error'] == "segment failed"
@@ -107,3 +107,47 @@ def test_three_groups_structure(df_three):
 
     # Metadata group count
     assert result['meta']['n_groups'] == 3
+
+def test_missing_values_and_effect_sizes_match_groupwise():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        'group': np.repeat(['A', 'B', 'C'], 40),
+        'value': np.concatenate([rng.normal(0, 1, 40), rng.normal(1, 1, 40), rng.normal(2, 1, 40)])
+    })
+    df.loc[[3, 50, 90], 'value'] = np.nan
+    result = bivariate_numeric_categorical_tests(df, 'value', 'group')
+
+    clean = df.dropna()
+    grand_mean = clean['value'].mean()
+    ss_total = ((clean['value'] - grand_mean) ** 2).sum()
+    ss_between = sum(len(g) * (g.mean() - grand_mean) ** 2 for _, g in clean.groupby('group')['value'])
+
+    assert result['meta']['group_sizes'] == [39, 39, 39]
+    assert result['effect_size']['eta_squared'] == pytest.approx(ss_between / ss_total)
+    assert 'error' not in result['tukey_hsd']
+
+def test_dunn_posthoc_when_kruskal_significant(df_separated):
+    result = bivariate_numeric_categorical_tests(df_separated, 'value', 'group')
+    pairs = result['dunn']['pairs']
+    assert len(pairs) == 1
+    assert pairs[0]['group1'] == 'A' and pairs[0]['group2'] == 'B'
+    assert pairs[0]['mean_rank_diff'] == pytest.approx(3.0)
+
+def test_no_dunn_when_kruskal_not_significant(df_identical):
+    result = bivariate_numeric_categorical_tests(df_identical, 'value', 'group')
+    assert 'dunn' not in result
+
+def test_posthoc_top_k_limits_pairs():
+    rng = np.random.default_rng(9)
+    labels = [f"g{i:02d}" for i in range(12)]
+    df = pd.DataFrame({
+        'group': np.repeat(labels, 20),
+        'value': rng.normal(np.repeat(np.arange(12), 20), 1.0)
+    })
+    result = bivariate_numeric_categorical_tests(df, 'value', 'group', posthoc_top_k=5, posthoc_significant_only=True)
+
+    assert result['tukey_hsd']['n_pairs'] == 66
+    assert len(result['tukey_hsd']['pairs']) == 5
+    assert all(p['reject'] for p in result['tukey_hsd']['pairs'])
+    assert result['dunn']['n_pairs'] == 66
+    assert len(result['dunn']['pairs']) == 5
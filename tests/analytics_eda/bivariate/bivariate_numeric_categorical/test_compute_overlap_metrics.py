@@ -1,3 +1,4 @@
+import pytest
 import numpy as np
 from analytics_eda.bivariate.bivariate_numeric_categorical.compute_overlap_metrics import compute_overlap_metrics
 
@@ -43,3 +44,43 @@ def test_single_group_returns_empty():
     data = {'A': np.array([1, 2, 3], dtype=float)}
     result = compute_overlap_metrics(data)
     assert result == {}
+
+def test_matches_exact_kde_integration():
+    """Metrics match integration of exact KDEs over their full support up to binning error."""
+    from scipy.stats import gaussian_kde
+    rng = np.random.default_rng(0)
+    data = {label: rng.normal(loc, 1, 200) for label, loc in zip('ABCD', (0, 0.5, 1, 3))}
+    result = compute_overlap_metrics(data, grid_size=400)
+
+    grid = np.linspace(-10, 13, 20_001)
+    pa, pc = gaussian_kde(data['A'])(grid), gaussian_kde(data['C'])(grid)
+    assert result['A vs C']['overlap_coeff'] == pytest.approx(np.trapezoid(np.minimum(pa, pc), grid), rel=1e-3)
+    assert result['A vs C']['bhattacharyya_dist'] == pytest.approx(-np.log(np.trapezoid(np.sqrt(pa * pc), grid)), rel=1e-2)
+    assert len(result) == 6
+
+def test_narrow_groups_with_far_third_group():
+    """A distant wide group must not break the metrics of narrow groups."""
+    rng = np.random.default_rng(3)
+    data = {
+        'A': rng.normal(0, 0.01, 500),
+        'B': rng.normal(0.5, 0.01, 500),
+        'C': rng.normal(1000, 1, 500)
+    }
+    result = compute_overlap_metrics(data)
+
+    for metrics in result.values():
+        assert 0.0 <= metrics['overlap_coeff'] <= 1e-6
+        assert metrics['bhattacharyya_dist'] > 10
+
+def test_narrow_overlapping_groups_are_resolved():
+    rng = np.random.default_rng(3)
+    data = {'A': rng.normal(0, 0.01, 500), 'B': rng.normal(0.01, 0.01, 500), 'C': rng.normal(5, 1, 500)}
+    result = compute_overlap_metrics(data)
+    # N(0, 0.01) vs N(0.01, 0.01): true overlap 2 * Phi(-0.5) ≈ 0.62
+    assert result['A vs B']['overlap_coeff'] == pytest.approx(0.62, abs=0.08)
+
+def test_large_groups_are_subsampled():
+    rng = np.random.default_rng(1)
+    data = {'A': rng.normal(0, 1, 50_000), 'B': rng.normal(0, 1, 50_000)}
+    result = compute_overlap_metrics(data, max_kde_samples=2_000)
+    assert result['A vs B']['overlap_coeff'] > 0.9
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+from scipy.stats import norm, rankdata
+
+from analytics_eda.bivariate.bivariate_numeric_categorical.kruskal_wallis_from_ranks import rank_with_ties
+from analytics_eda.bivariate.bivariate_numeric_categorical.dunn_test_from_ranks import dunn_test_from_ranks
+
+def test_matches_direct_computation():
+    rng = np.random.default_rng(6)
+    groups = [np.round(rng.normal(loc, 1, 40), 1) for loc in (0, 0.2, 2)]
+    values = np.concatenate(groups)
+    codes = np.repeat(np.arange(3), 40)
+    labels = np.array(['a', 'b', 'c'], dtype=object)
+
+    ranks, tie_sum = rank_with_ties(values)
+    result = dunn_test_from_ranks(ranks, codes, labels, tie_sum)
+
+    assert result['group1'].tolist() == ['a', 'a', 'b']
+    assert result['group2'].tolist() == ['b', 'c', 'c']
+
+    # a vs c computed directly
+    r = rankdata(values)
+    n_total = len(values)
+    variance = n_total * (n_total + 1) / 12 - tie_sum / (12 * (n_total - 1))
+    z = (r[codes == 2].mean() - r[codes == 0].mean()) / np.sqrt(variance * (1 / 40 + 1 / 40))
+    assert result['z'][1] == pytest.approx(z)
+    assert result['p-adj'][1] == pytest.approx(min(2 * norm.sf(abs(z)) * 3, 1.0))
+    assert result['reject'].tolist() == [False, True, True]
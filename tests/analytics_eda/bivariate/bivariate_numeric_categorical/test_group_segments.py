@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.bivariate.bivariate_numeric_categorical.group_segments import GroupSegments
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(1)
+    n = 1000
+    data = pd.DataFrame({
+        'group': rng.choice(['b', 'a', 'c'], size=n),
+        'value': rng.normal(size=n)
+    })
+    data.loc[::17, 'value'] = np.nan
+    data.loc[::23, 'group'] = None
+    return data
+
+def test_matches_groupby(df):
+    segments = GroupSegments.from_frame(df, 'value', 'group')
+    expected = df.dropna().groupby('group', observed=True)['value']
+
+    assert segments.labels.tolist() == ['a', 'b', 'c']
+    assert segments.counts.tolist() == expected.size().tolist()
+    np.testing.assert_allclose(segments.sums, expected.sum().to_numpy())
+    np.testing.assert_allclose(segments.means, expected.mean().to_numpy())
+    np.testing.assert_allclose(segments.sum_squares, (expected.var(ddof=0) * expected.size()).to_numpy())
+
+    for label, values in segments.items():
+        np.testing.assert_array_equal(values, df.loc[df['group'] == label, 'value'].dropna().to_numpy())
+
+def test_groups_are_views_into_one_buffer(df):
+    segments = GroupSegments.from_frame(df, 'value', 'group')
+    assert segments.offsets[0] == 0
+    assert segments.offsets[-1] == len(segments.values)
+    assert all(np.shares_memory(g, segments.values) for g in segments.groups() if len(g))
+    assert np.all(np.diff(segments.codes) >= 0)
+
+def test_category_order_and_observed_only():
+    groups = pd.Series(pd.Categorical(['y', 'x', 'y'], categories=['y', 'x', 'unused']))
+    segments = GroupSegments(np.array([1.0, 2.0, 3.0]), groups)
+
+    assert segments.labels.tolist() == ['y', 'x']
+    assert segments.group(0).tolist() == [1.0, 3.0]
+    assert len(segments) == 2
+
+def test_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        GroupSegments(np.array([1.0, 2.0]), pd.Series(['a']))
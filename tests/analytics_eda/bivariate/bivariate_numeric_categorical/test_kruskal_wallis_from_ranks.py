@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from scipy.stats import kruskal, rankdata
+
+from analytics_eda.bivariate.bivariate_numeric_categorical.kruskal_wallis_from_ranks import rank_with_ties, kruskal_wallis_from_ranks
+
+@pytest.fixture
+def tied_groups():
+    rng = np.random.default_rng(5)
+    # Rounded values produce many ties
+    return [np.round(rng.normal(loc, 1, size), 1) for loc, size in [(0, 30), (0.3, 45), (1, 25)]]
+
+def test_rank_with_ties_matches_scipy(tied_groups):
+    values = np.concatenate(tied_groups)
+    ranks, tie_sum = rank_with_ties(values)
+
+    np.testing.assert_allclose(ranks, rankdata(values))
+    _, t = np.unique(values, return_counts=True)
+    assert tie_sum == pytest.approx(np.sum(t.astype(float) ** 3 - t))
+
+def test_matches_scipy_kruskal(tied_groups):
+    values = np.concatenate(tied_groups)
+    codes = np.repeat(np.arange(3), [len(g) for g in tied_groups])
+    ranks, tie_sum = rank_with_ties(values)
+
+    statistic, p_value = kruskal_wallis_from_ranks(ranks, codes, 3, tie_sum)
+    expected = kruskal(*tied_groups)
+    assert statistic == pytest.approx(expected.statistic, rel=1e-10)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-8)
+
+def test_codes_need_not_be_sorted(tied_groups):
+    values = np.concatenate(tied_groups)
+    codes = np.repeat(np.arange(3), [len(g) for g in tied_groups])
+    perm = np.random.default_rng(0).permutation(len(values))
+    ranks, tie_sum = rank_with_ties(values[perm])
+
+    statistic, _ = kruskal_wallis_from_ranks(ranks, codes[perm], 3, tie_sum)
+    assert statistic == pytest.approx(kruskal(*tied_groups).statistic, rel=1e-10)
+
+def test_requires_two_groups():
+    with pytest.raises(ValueError):
+        kruskal_wallis_from_ranks(np.array([1.0, 2.0]), np.array([0, 0]), 1)
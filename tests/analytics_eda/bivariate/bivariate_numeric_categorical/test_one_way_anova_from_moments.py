@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from scipy.stats import f_oneway
+
+from analytics_eda.bivariate.bivariate_numeric_categorical.one_way_anova_from_moments import one_way_anova_from_moments, group_moments
+
+@pytest.fixture
+def groups():
+    rng = np.random.default_rng(3)
+    return [rng.normal(loc, scale, size) for loc, scale, size in [(0, 1, 50), (0.5, 2, 80), (1, 1.5, 30)]]
+
+def test_matches_scipy_raw_moments(groups):
+    counts = [len(g) for g in groups]
+    sums = [g.sum() for g in groups]
+    sum_squares = [(g ** 2).sum() for g in groups]
+
+    statistic, p_value = one_way_anova_from_moments(counts, sums, sum_squares)
+    expected = f_oneway(*groups)
+    assert statistic == pytest.approx(expected.statistic, rel=1e-10)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-8)
+
+def test_matches_scipy_centered_moments(groups):
+    counts = [len(g) for g in groups]
+    sums = [g.sum() for g in groups]
+    m2 = [((g - g.mean()) ** 2).sum() for g in groups]
+
+    statistic, p_value = one_way_anova_from_moments(counts, sums, m2, centered=True)
+    expected = f_oneway(*groups)
+    assert statistic == pytest.approx(expected.statistic, rel=1e-10)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-8)
+
+def test_chunked_accumulation(groups):
+    # Moments of each group accumulated from two chunks
+    counts, sums, sum_squares = np.zeros(3), np.zeros(3), np.zeros(3)
+    for chunk in (slice(0, 20), slice(20, None)):
+        for i, g in enumerate(groups):
+            counts[i] += len(g[chunk])
+            sums[i] += g[chunk].sum()
+            sum_squares[i] += (g[chunk] ** 2).sum()
+
+    statistic, _ = one_way_anova_from_moments(counts, sums, sum_squares)
+    assert statistic == pytest.approx(f_oneway(*groups).statistic, rel=1e-10)
+
+def test_group_moments_validation():
+    with pytest.raises(ValueError):
+        group_moments([1], [1.0], [1.0])
+    with pytest.raises(ValueError):
+        group_moments([1, 2], [1.0], [1.0, 2.0])
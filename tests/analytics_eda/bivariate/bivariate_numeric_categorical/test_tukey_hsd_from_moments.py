@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from statsmodels.stats.multicomp import pairwise_tukeyhsd
+
+from analytics_eda.bivariate.bivariate_numeric_categorical.tukey_hsd_from_moments import tukey_hsd_from_moments
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(8)
+    codes = np.repeat(np.arange(6), [30, 45, 20, 60, 35, 50])
+    values = rng.normal(codes * 0.3, 1.0)
+    labels = np.array(list('abcdef'), dtype=object)
+    moments = (np.bincount(codes), np.bincount(codes, values), np.bincount(codes, values ** 2))
+    return values, codes, labels, moments
+
+def test_matches_statsmodels(data):
+    values, codes, labels, moments = data
+    result = tukey_hsd_from_moments(*moments, labels)
+    expected = pairwise_tukeyhsd(values, labels[codes])
+
+    assert result['n_pairs'] == 15
+    assert result['group1'].tolist() == expected.groupsunique[np.triu_indices(6, 1)[0]].tolist()
+    np.testing.assert_allclose(result['meandiff'], expected.meandiffs)
+    np.testing.assert_allclose(result['p-adj'], expected.pvalues, atol=1e-8)
+    np.testing.assert_allclose(result['lower'], expected.confint[:, 0])
+    np.testing.assert_allclose(result['upper'], expected.confint[:, 1])
+    np.testing.assert_array_equal(result['reject'], expected.reject)
+
+def test_interpolated_pvalues_close_to_exact(data):
+    _, _, labels, moments = data
+    exact = tukey_hsd_from_moments(*moments, labels)
+    interpolated = tukey_hsd_from_moments(*moments, labels, max_exact_pvalues=0)
+    np.testing.assert_allclose(interpolated['p-adj'], exact['p-adj'], atol=1e-4)
+
+def test_significant_only_and_top_k(data):
+    _, _, labels, moments = data
+    full = tukey_hsd_from_moments(*moments, labels)
+
+    significant = tukey_hsd_from_moments(*moments, labels, significant_only=True)
+    assert significant['reject'].all()
+    assert len(significant['meandiff']) == full['reject'].sum()
+
+    top = tukey_hsd_from_moments(*moments, labels, top_k=3)
+    assert len(top['meandiff']) == 3
+    np.testing.assert_allclose(np.abs(top['meandiff']), np.sort(np.abs(full['meandiff']))[::-1][:3])
+    assert top['n_pairs'] == 15
@@ -0,0 +1,51 @@
+import json
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.bivariate.bivariate_numeric_numeric.bivariate_numeric_numeric_analysis import bivariate_numeric_numeric_analysis
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(2)
+    data = pd.DataFrame(rng.normal(size=(200, 4)), columns=['w', 'x', 'y', 'z'])
+    data['y'] = 2 * data['x'] + rng.normal(scale=0.1, size=200)
+    data['group'] = 'g'
+    return data
+
+def test_report_structure(tmp_path, caplog, df):
+    caplog.set_level(logging.INFO)
+    report_path = bivariate_numeric_numeric_analysis(df, report_root=str(tmp_path))
+
+    report = json.loads(report_path.read_text())
+    assert report['metadata']['report_name'] == 'bivariate_numeric_numeric_analysis'
+    eda = report['eda']
+    assert eda['n_columns'] == 4
+    for method in ('pearson', 'spearman', 'kendall'):
+        strongest = eda['correlations'][method]['strongest_pairs'][0]
+        assert {strongest['column1'], strongest['column2']} == {'x', 'y'}
+        assert strongest['n_obs'] == 200
+        assert (tmp_path / f"{method}_correlation_heatmap.png").exists()
+    assert eda['correlations']['pearson']['matrix']['x']['x'] == 1.0
+
+    assert any("Starting bivariate_numeric_numeric_analysis" in r.message for r in caplog.records)
+    assert any("Completed bivariate_numeric_numeric_analysis" in r.message for r in caplog.records)
+
+def test_chunked_input_pearson_only(tmp_path, df):
+    chunks = (df.iloc[i:i + 50] for i in range(0, len(df), 50))
+    report_path = bivariate_numeric_numeric_analysis(chunks, report_root=str(tmp_path))
+    eda = json.loads(report_path.read_text())['eda']
+
+    expected = df[['w', 'x', 'y', 'z']].corr()
+    assert eda['correlations']['pearson']['matrix']['x']['y'] == pytest.approx(expected.loc['x', 'y'])
+    assert 'error' in eda['correlations']['spearman']
+    assert 'error' in eda['correlations']['kendall']
+
+def test_validation(tmp_path, df):
+    with pytest.raises(KeyError):
+        bivariate_numeric_numeric_analysis(df, columns=['x', 'missing'], report_root=str(tmp_path))
+    with pytest.raises(TypeError):
+        bivariate_numeric_numeric_analysis(df, columns=['x', 'group'], report_root=str(tmp_path))
+    with pytest.raises(ValueError):
+        bivariate_numeric_numeric_analysis(df, columns=['x'], report_root=str(tmp_path))
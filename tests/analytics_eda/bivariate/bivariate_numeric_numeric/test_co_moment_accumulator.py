@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.bivariate.bivariate_numeric_numeric.co_moment_accumulator import CoMomentAccumulator
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.normal(1_000, 1, size=(600, 4)), columns=list('abcd'))
+    data['b'] += 0.5 * data['a']
+    return data.mask(rng.random(data.shape) < 0.1)
+
+def test_matches_pandas_pairwise_complete(df):
+    acc = CoMomentAccumulator(block_size=128).update(df)
+    np.testing.assert_allclose(acc.correlation().to_numpy(), df.corr().to_numpy(), atol=1e-12)
+
+    present = df.notna().astype(int)
+    assert (acc.pair_counts() == present.T @ present).all().all()
+
+def test_merge_matches_single_pass(df):
+    left = CoMomentAccumulator().update(df.iloc[:200])
+    right = CoMomentAccumulator().update(df.iloc[200:400]).update(df.iloc[400:])
+    merged = left.merge(right)
+    np.testing.assert_allclose(merged.correlation().to_numpy(), df.corr().to_numpy(), atol=1e-12)
+
+def test_merge_into_empty(df):
+    merged = CoMomentAccumulator().merge(CoMomentAccumulator().update(df))
+    np.testing.assert_allclose(merged.correlation().to_numpy(), df.corr().to_numpy(), atol=1e-12)
+
+def test_update_validation(df):
+    with pytest.raises(TypeError):
+        CoMomentAccumulator().update(df.to_numpy())
+    with pytest.raises(KeyError):
+        CoMomentAccumulator(columns=['a', 'z']).update(df)
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.bivariate.bivariate_numeric_numeric.numeric_correlation_matrices import numeric_correlation_matrices
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame(rng.normal(size=(300, 5)), columns=list('abcde'))
+    data['b'] = data['a'] ** 3 + rng.normal(scale=0.1, size=300)
+    data['c'] = np.round(data['c'], 1)  # ties
+    data['label'] = 'x'
+    return data
+
+@pytest.mark.parametrize("method", ['pearson', 'spearman', 'kendall'])
+def test_matches_pandas(df, method):
+    result = numeric_correlation_matrices(df)
+    expected = df.select_dtypes('number').corr(method)
+    np.testing.assert_allclose(result[method].to_numpy(), expected.to_numpy(), atol=1e-12)
+    assert result['n_obs'].iloc[0, 1] == 300
+
+def test_kendall_pairwise_complete(df):
+    data = df[['a', 'b']].copy()
+    data.loc[::7, 'a'] = np.nan
+    result = numeric_correlation_matrices(data, methods=('kendall',))
+    assert result['kendall'].loc['a', 'b'] == pytest.approx(data.corr('kendall').loc['a', 'b'])
+    assert result['n_obs'].loc['a', 'b'] == data.dropna().shape[0]
+
+def test_spearman_with_missing_matches_pandas(df):
+    data = df[list('abcde')].copy()
+    data.loc[::7, 'a'] = np.nan
+    data.loc[::5, 'b'] = np.nan
+    data.loc[::7, 'd'] = np.nan  # same rows as 'a'
+    result = numeric_correlation_matrices(data, methods=('spearman',))
+    np.testing.assert_allclose(result['spearman'].to_numpy(), data.corr('spearman').to_numpy(), atol=1e-12)
+
+def test_unknown_method(df):
+    with pytest.raises(ValueError):
+        numeric_correlation_matrices(df, methods=('distance',))
@@ -0,0 +1,35 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from analytics_eda.bivariate.mutual_information.discretize_column import discretize_column
+from analytics_eda.core.numeric.report_binning_rules import sturges_bins
+
+def test_continuous_quantile_bins():
+    rng = np.random.default_rng(0)
+    series = pd.Series(rng.exponential(size=1000), name='x')
+    series[::50] = np.nan
+    codes, n_bins = discretize_column(series)
+
+    assert n_bins == sturges_bins(series)
+    assert (codes[series.isna().to_numpy()] == -1).all()
+    counts = np.bincount(codes[codes >= 0], minlength=n_bins)
+    # equal-frequency bins
+    assert counts.max() - counts.min() <= 2
+
+def test_bins_capped():
+    series = pd.Series(np.random.default_rng(1).normal(size=10_000), name='x')
+    _, n_bins = discretize_column(series, bin_rule='freedman-diaconis', max_bins=16)
+    assert n_bins == 16
+
+def test_low_cardinality_numeric_and_categorical():
+    codes, n = discretize_column(pd.Series([3, 1, 3, 2], name='k'))
+    assert n == 3 and codes.tolist() == [2, 0, 2, 1]
+
+    codes, n = discretize_column(pd.Series(['b', None, 'a', 'b'], dtype='category', name='c'))
+    assert n == 2 and codes[1] == -1 and codes[0] == codes[3]
+
+def test_unknown_bin_rule_raises():
+    series = pd.Series(np.random.default_rng(2).normal(size=500), name='x')
+    with pytest.raises(ValueError, match="bin_rule"):
+        discretize_column(series, bin_rule='typo')
@@ -0,0 +1,51 @@
+import json
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.bivariate.mutual_information.mutual_information_screening import mutual_information_screening
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(3)
+    n = 2000
+    x = rng.normal(size=n)
+    return pd.DataFrame({
+        'x': x,
+        'x_squared': x ** 2 + rng.normal(scale=0.05, size=n),   # non-linear dependence
+        'noise': rng.normal(size=n),
+        'segment': np.where(x > 0, 'pos', 'neg'),
+        'target': (x > 0.5).astype(int)
+    })
+
+def test_ranked_report(tmp_path, caplog, df):
+    caplog.set_level(logging.INFO)
+    report_path = mutual_information_screening(df, target='target', report_root=str(tmp_path))
+    report = json.loads(report_path.read_text())
+
+    assert report['metadata']['report_name'] == 'mutual_information_screening'
+    eda = report['eda']
+    assert len(eda['ranked_pairs']) == 10
+    scores = [r['normalized_mi'] for r in eda['ranked_pairs']]
+    assert scores == sorted(scores, reverse=True)
+
+    ranking = [r['column_a'] for r in eda['target_ranking']]
+    assert ranking[-1] == 'noise'
+    assert ranking[0] in ('x', 'segment')
+    assert eda['normalized_mi_matrix']['x']['x_squared'] > eda['normalized_mi_matrix']['x']['noise']
+
+    assert any("Completed mutual_information_screening" in r.message for r in caplog.records)
+
+def test_target_only_parallel_matches_sequential(tmp_path, df):
+    sequential = json.loads(mutual_information_screening(df, target='target', target_only=True, report_root=str(tmp_path / "a")).read_text())
+    parallel = json.loads(mutual_information_screening(df, target='target', target_only=True, n_jobs=2, report_root=str(tmp_path / "b")).read_text())
+
+    assert len(sequential['eda']['ranked_pairs']) == 4
+    assert parallel['eda']['ranked_pairs'] == sequential['eda']['ranked_pairs']
+
+def test_validation(tmp_path, df):
+    with pytest.raises(KeyError):
+        mutual_information_screening(df, target='missing', report_root=str(tmp_path))
+    with pytest.raises(ValueError):
+        mutual_information_screening(df, target_only=True, report_root=str(tmp_path))
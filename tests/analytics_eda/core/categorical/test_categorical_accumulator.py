@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from analytics_eda.core.categorical.categorical_accumulator import CategoricalAccumulator
+from analytics_eda.core.categorical.categorical_frequency_counts import categorical_frequency_counts
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    values = rng.choice(['alpha', 'beta', 'gamma', 'delta', None], size=1_000, p=[0.4, 0.3, 0.15, 0.1, 0.05])
+    return pd.Series(values, dtype=object, name='greek')
+
+def as_dict(freq):
+    return dict(zip(freq['labels'], freq['counts']))
+
+def test_chunks_match_single_pass(series):
+    acc = CategoricalAccumulator()
+    for start in range(0, len(series), 128):
+        acc.update(series.iloc[start:start + 128])
+    result = acc.frequency_counts()
+    expected = categorical_frequency_counts(series)
+
+    assert acc.name == 'greek'
+    assert as_dict(result) == as_dict(expected)
+    for key in ('total', 'missing', 'cardinality', 'category_length_stats'):
+        assert result[key] == expected[key]
+    assert list(result['counts']) == sorted(result['counts'], reverse=True)
+
+def test_merge_across_accumulators(series):
+    left = CategoricalAccumulator().update(series.iloc[:400])
+    right = CategoricalAccumulator().update(series.iloc[400:].astype('category'))
+    merged = left.merge(right).frequency_counts()
+
+    assert as_dict(merged) == as_dict(categorical_frequency_counts(series))
+    assert merged['total'] == len(series)
+
+def test_rejects_non_categorical_chunks():
+    with pytest.raises(TypeError):
+        CategoricalAccumulator().update(pd.Series([1, 2, 3], name='nums'))
@@ -62,3 +62,35 @@ def test_requires_categorical_or_object_dtype(tmp_path):
     s = pd.Series([1,2,3], name='nums')
     with pytest.raises(TypeError):
         categorical_distribution_analysis(s, tmp_path)
+
+def test_table_top_k_adds_tail_summary(tmp_path):
+    series = pd.Series(['a'] * 5 + ['b'] * 3 + ['c'] * 2 + ['d'], dtype=object, name='letters')
+    result = categorical_distribution_analysis(series, tmp_path, table_top_k=2)
+
+    freq_report = result['report']['frequency_report']
+    assert list(freq_report['frequency_table']) == ['a', 'b']
+    assert freq_report['tail'] == {'n_categories': 2, 'count': 3, 'proportion': pytest.approx(3 / 11)}
+
+    # Statistics still reflect every category
+    assert result['report']['statistics']['cardinality'] == 4
+    assert result['frequencies']['counts'].tolist() == [5, 3, 2, 1]
+
+def test_bounded_frequency_mode(tmp_path):
+    values = ['a'] * 50 + ['b'] * 30 + [f"id{i}" for i in range(200)] + [None] * 5
+    series = pd.Series(values, dtype=object, name='ids')
+    result = categorical_distribution_analysis(series, tmp_path, frequency_mode='bounded', table_top_k=3, sketch_capacity=20, chunk_size=64)
+
+    report = result['report']
+    table = report['frequency_report']['frequency_table']
+    assert list(table)[:2] == ['a', 'b']
+    assert table['a']['count'] >= 50
+    assert table['nan']['count'] == 5
+    assert report['statistics']['cardinality_estimated'] is True
+    assert report['statistics']['cardinality'] == 202
+    assert report['frequency_report']['tail']['n_categories'] == 199
+    assert Path(report['frequency_report']['visualizations']['top_n_plot']).exists()
+
+def test_unknown_frequency_mode(tmp_path):
+    series = pd.Series(['a', 'b'], dtype='category', name='s')
+    with pytest.raises(ValueError):
+        categorical_distribution_analysis(series, tmp_path, frequency_mode='approximate')
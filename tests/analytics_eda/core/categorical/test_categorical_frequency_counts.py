@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from analytics_eda.core.categorical.categorical_frequency_counts import categorical_frequency_counts
+
+def test_category_dtype_counts():
+    series = pd.Series(['b', 'a', 'b', 'c', 'b', 'a'], dtype='category', name='letters')
+    result = categorical_frequency_counts(series)
+
+    assert result['labels'].tolist() == ['b', 'a', 'c']
+    assert result['counts'].tolist() == [3, 2, 1]
+    assert result['total'] == 6
+    assert result['missing'] == 0
+    assert result['cardinality'] == 3
+    assert result['category_length_stats'] == {'max_length': 1, 'min_length': 1}
+
+def test_object_dtype_matches_value_counts():
+    rng = np.random.default_rng(0)
+    series = pd.Series(rng.choice(['red', 'green', 'blue', 'violet'], size=500), dtype=object, name='color')
+    result = categorical_frequency_counts(series)
+
+    expected = series.value_counts(dropna=False)
+    assert dict(zip(result['labels'], result['counts'])) == {str(k): int(v) for k, v in expected.items()}
+    assert result['category_length_stats'] == {'max_length': 6, 'min_length': 3}
+
+def test_missing_values_counted_as_label():
+    series = pd.Series(['x', np.nan, 'x', 'yy', np.nan, np.nan], dtype='category', name='s')
+    result = categorical_frequency_counts(series)
+
+    assert result['labels'].tolist() == ['nan', 'x', 'yy']
+    assert result['counts'].tolist() == [3, 2, 1]
+    assert result['missing'] == 3
+    assert result['cardinality'] == 2
+    assert result['category_length_stats'] == {'max_length': 3, 'min_length': 1}
+
+def test_unused_categories_keep_zero_count():
+    series = pd.Series(pd.Categorical(['a', 'a'], categories=['a', 'b']), name='s')
+    result = categorical_frequency_counts(series)
+
+    assert result['labels'].tolist() == ['a', 'b']
+    assert result['counts'].tolist() == [2, 0]
+    assert result['cardinality'] == 1
+
+def test_arrow_string_dtype_matches_object():
+    pytest.importorskip("pyarrow")
+    values = ['b', 'a', np.nan, 'b', 'c', 'b', np.nan]
+    arrow = categorical_frequency_counts(pd.Series(values, dtype='string[pyarrow]', name='s'))
+    obj = categorical_frequency_counts(pd.Series(values, dtype=object, name='s'))
+
+    assert arrow['counts'].tolist() == [3, 2, 1, 1]
+    assert dict(zip(arrow['labels'], arrow['counts'])) == {'b': 3, 'a': 1, 'c': 1, 'nan': 2}
+    assert dict(zip(arrow['labels'], arrow['counts'])) == dict(zip(obj['labels'], obj['counts']))
+    assert arrow['missing'] == obj['missing'] == 2
+    assert arrow['cardinality'] == obj['cardinality'] == 3
+
+def test_arrow_dictionary_chunks_counted_from_indices():
+    pa = pytest.importorskip("pyarrow")
+    chunked = pa.chunked_array([
+        pa.array(['x', 'y', None, 'x']).dictionary_encode(),
+        pa.array(['z', 'y', 'y']).dictionary_encode()
+    ])
+    series = pd.Series(pd.arrays.ArrowExtensionArray(chunked), name='d')
+    result = categorical_frequency_counts(series)
+
+    assert result['labels'].tolist() == ['y', 'x', 'z', 'nan']
+    assert result['counts'].tolist() == [3, 2, 1, 1]
+    assert result['total'] == 7
+    assert result['missing'] == 1
+    assert result['cardinality'] == 3
+
+@pytest.mark.parametrize("index_type", ["int8", "uint8"])
+def test_arrow_dictionary_narrow_index_types(index_type):
+    pa = pytest.importorskip("pyarrow")
+    labels = [f"c{i}" for i in range(200 if index_type == "uint8" else 128)]
+    indices = pa.array(list(range(len(labels))) + [len(labels) - 1, None], type=getattr(pa, index_type)())
+    array = pa.DictionaryArray.from_arrays(indices, pa.array(labels))
+    series = pd.Series(pd.arrays.ArrowExtensionArray(pa.chunked_array([array])), name='d')
+    result = categorical_frequency_counts(series)
+
+    counts = dict(zip(result['labels'], result['counts']))
+    assert counts[labels[-1]] == 2
+    assert counts['c0'] == 1
+    assert counts['nan'] == 1
+    assert result['cardinality'] == len(labels)
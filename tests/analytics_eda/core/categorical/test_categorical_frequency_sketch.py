@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from analytics_eda.core.categorical.categorical_frequency_sketch import CategoricalFrequencySketch
+
+@pytest.fixture
+def heavy_tail_series():
+    rng = np.random.default_rng(0)
+    heavy = np.repeat(['A', 'B', 'C'], [5_000, 3_000, 1_000])
+    tail = rng.integers(0, 20_000, size=20_000).astype(str)
+    values = np.concatenate([heavy, tail]).astype(object)
+    rng.shuffle(values)
+    return pd.Series(values, name='url')
+
+def feed(sketch, series, chunk_size=5_000):
+    for start in range(0, len(series), chunk_size):
+        sketch.update(series.iloc[start:start + chunk_size])
+    return sketch
+
+def test_exact_for_low_cardinality():
+    series = pd.Series(['x', 'y', 'x', None, 'z', 'x'], name='s')
+    summary = CategoricalFrequencySketch(capacity=10).update(series).summary(top_k=2)
+
+    assert summary['total'] == 6
+    assert summary['missing'] == 1
+    assert summary['estimated_distinct'] == 3
+    assert summary['top_k'][0] == {'category': 'x', 'count': 3, 'proportion': 0.5, 'max_overcount': 0}
+    assert summary['tail'] == {'n_categories': 1, 'count': 1, 'proportion': pytest.approx(1 / 6)}
+
+def test_heavy_hitters_and_bounded_memory(heavy_tail_series):
+    sketch = feed(CategoricalFrequencySketch(capacity=100, cms_width=1024, distinct_sample_size=512), heavy_tail_series)
+    summary = sketch.summary(top_k=3, rare_threshold=0.01)
+
+    assert [t['category'] for t in summary['top_k']] == ['A', 'B', 'C']
+    for t in summary['top_k']:
+        true = int((heavy_tail_series == t['category']).sum())
+        assert t['count'] - t['max_overcount'] <= true <= t['count']
+
+    assert len(sketch.heavy_hitters) <= 100
+    assert sketch.cms.shape == (4, 1024)
+
+    true_distinct = heavy_tail_series.nunique()
+    assert abs(summary['estimated_distinct'] - true_distinct) / true_distinct < 0.15
+
+    rare = summary['rare_categories']
+    assert rare['estimated_proportion'] == pytest.approx(20_000 / len(heavy_tail_series), rel=0.01)
+
+def test_point_estimate_is_upper_bound(heavy_tail_series):
+    sketch = feed(CategoricalFrequencySketch(capacity=50), heavy_tail_series)
+    for value in ['A', '123', '19999', 'never-seen']:
+        assert sketch.estimate(value) >= int((heavy_tail_series == value).sum())
+    assert sketch.estimate('A') == 5_000
+
+def test_merge_matches_single_pass(heavy_tail_series):
+    half = len(heavy_tail_series) // 2
+    left = feed(CategoricalFrequencySketch(), heavy_tail_series.iloc[:half])
+    right = feed(CategoricalFrequencySketch(), heavy_tail_series.iloc[half:])
+    merged = left.merge(right)
+    single = feed(CategoricalFrequencySketch(), heavy_tail_series)
+
+    assert np.array_equal(merged.cms, single.cms)
+    assert merged.estimated_distinct() == single.estimated_distinct()
+    assert merged.summary(top_k=3)['top_k'] == single.summary(top_k=3)['top_k']
+
+def test_merge_rejects_different_parameters():
+    with pytest.raises(ValueError):
+        CategoricalFrequencySketch(cms_width=64).merge(CategoricalFrequencySketch(cms_width=128))
+
+def test_invalid_depth():
+    with pytest.raises(ValueError):
+        CategoricalFrequencySketch(cms_depth=9)
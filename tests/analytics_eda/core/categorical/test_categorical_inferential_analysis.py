@@ -1,3 +1,4 @@
+import numpy as np
 from analytics_eda.core.categorical.categorical_inferential_analysis import categorical_inferential_analysis
 
 def make_freq_table(freq_counts):
@@ -49,3 +50,11 @@ def test_custom_alpha_threshold():
     gof = result['goodness_of_fit']
 
     assert gof['alpha'] == alpha
+
+def test_accepts_count_array():
+    counts = {'A': 70, 'B': 10, 'C': 10, 'D': 10}
+    freq_table, total = make_freq_table(counts)
+    from_table = categorical_inferential_analysis(freq_table, total)
+    from_array = categorical_inferential_analysis(np.array(list(counts.values())), total)
+
+    assert from_array == from_table
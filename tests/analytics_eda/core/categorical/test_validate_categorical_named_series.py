@@ -36,3 +36,11 @@ def test_raises_value_error_for_blank_name():
     s = pd.Series(["x", "y", "z"], dtype="object", name=" ")
     with pytest.raises(ValueError, match="must have a non-empty 'name'"):
         validate_categorical_named_series(s)
+
+def test_valid_arrow_string_and_dictionary_series():
+    pa = pytest.importorskip("pyarrow")
+    s = pd.Series(["a", "b"], dtype="string[pyarrow]", name="arrow_col")
+    assert validate_categorical_named_series(s).equals(s)
+
+    d = pd.Series(pd.arrays.ArrowExtensionArray(pa.array(["a", "b", "a"]).dictionary_encode()), name="dict_col")
+    assert validate_categorical_named_series(d).equals(d)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from scipy.stats import gaussian_kde
+
+from analytics_eda.core.numeric.binned_kde import binned_kde, kde_bandwidth
+
+@pytest.fixture
+def sample():
+    return np.random.default_rng(0).gamma(2.0, size=5000)
+
+def test_matches_exact_gaussian_kde(sample):
+    grid, density = binned_kde(sample)
+    exact = gaussian_kde(sample)(grid)
+
+    assert len(grid) == 512
+    assert np.max(np.abs(density - exact)) < 1e-3 * exact.max()
+    assert np.trapezoid(density, grid) == pytest.approx(1.0, abs=1e-3)
+
+def test_silverman_matches_scipy(sample):
+    grid, density = binned_kde(sample, bandwidth='silverman')
+    exact = gaussian_kde(sample, bw_method='silverman')(grid)
+    assert np.max(np.abs(density - exact)) < 1e-3 * exact.max()
+
+def test_explicit_grid_drops_outside_mass():
+    values = np.array([-10.0, 0.0, 0.5, 1.0, 10.0])
+    grid, density = binned_kde(values, grid=np.linspace(-1, 2, 301), bandwidth=0.2)
+    assert grid[0] == -1 and len(density) == 301
+    assert np.trapezoid(density, grid) == pytest.approx(0.6, abs=0.01)
+
+def test_narrow_sample_on_wide_grid_keeps_unit_mass():
+    values = np.random.default_rng(2).normal(0, 0.01, 500)
+    grid, density = binned_kde(values, grid=np.linspace(-1000, 1000, 512))
+    assert np.trapezoid(density, grid) == pytest.approx(1.0, abs=1e-6)
+
+def test_bandwidth_rules():
+    values = np.arange(100, dtype=float)
+    assert kde_bandwidth(values) == pytest.approx(100 ** (-1 / 5) * values.std(ddof=1))
+    assert kde_bandwidth(values, 'scott', bw_adjust=2) == pytest.approx(2 * kde_bandwidth(values))
+    assert kde_bandwidth(values, 0.5) == 0.5
+
+def test_invalid_bandwidth():
+    with pytest.raises(ValueError):
+        kde_bandwidth(np.ones(10))
+    with pytest.raises(ValueError):
+        kde_bandwidth(np.arange(10.0), 'unknown')
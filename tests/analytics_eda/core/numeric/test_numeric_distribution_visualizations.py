@@ -51,3 +51,12 @@ def test_distribution_visualizations_empty_series(tmp_path):
     
     # Assert
     assert viz_paths == {}
+
+def test_constant_series_skips_kde_overlay(tmp_path, caplog):
+    constant = pd.Series([3.0] * 20, name="constant")
+
+    with caplog.at_level("WARNING"):
+        viz_paths = numeric_distribution_visualizations(constant, tmp_path)
+
+    assert Path(viz_paths["hist_kde"]).exists()
+    assert "Skipped KDE overlay" in caplog.text
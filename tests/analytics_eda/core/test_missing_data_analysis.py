@@ -61,4 +61,17 @@ def test_missing_data_analysis_two_third_missing(tmp_path):
     plot_path = Path(result['missing_data_barplot'])
     assert plot_path.exists(), f"Expected plot at {plot_path}"
     assert plot_path.suffix == '.png'
-    assert plot_path.stat().st_size > 0  # non-empty file
\ No newline at end of file
+    assert plot_path.stat().st_size > 0  # non-empty file
+
+
+def test_missing_data_report_from_counts(tmp_path):
+    from analytics_eda.core.missing_data_analysis import missing_data_report
+
+    result = missing_data_report('chunked series', 10, 4, tmp_path)
+
+    assert result['total'] == 10
+    assert result['missing'] == 4
+    assert result['pct_missing'] == 0.4
+    plot_path = Path(result['missing_data_barplot'])
+    assert plot_path.name == 'chunked_series_missing_data_barplot.png'
+    assert plot_path.exists()
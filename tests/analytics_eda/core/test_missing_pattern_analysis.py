@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from analytics_eda.core import missing_pattern_analysis, MissingPatternAccumulator
+
+@pytest.fixture
+def df_patterns():
+    # 4 complete rows, 3 rows missing a+b, 2 rows missing c, 1 row missing all
+    return pd.DataFrame({
+        'a': [1, 2, 3, 4, np.nan, np.nan, np.nan, 8, 9, np.nan],
+        'b': [1, 2, 3, 4, np.nan, np.nan, np.nan, 8, 9, np.nan],
+        'c': [1, 2, 3, 4, 5, 6, 7, np.nan, np.nan, np.nan],
+    })
+
+def test_pattern_counts(df_patterns, tmp_path):
+    result = missing_pattern_analysis(df_patterns, report_dir=tmp_path)
+
+    assert result['total_rows'] == 10
+    assert result['n_columns'] == 3
+    assert result['complete_rows'] == 4
+    assert result['columns']['a'] == {'missing': 4, 'pct_missing': 0.4}
+    assert result['columns']['c']['missing'] == 3
+
+    patterns = {tuple(p['missing_columns']): p['count'] for p in result['patterns']}
+    assert patterns == {(): 4, ('a', 'b'): 3, ('c',): 2, ('a', 'b', 'c'): 1}
+    assert result['patterns'][0]['missing_columns'] == []
+    assert all(p['max_overcount'] == 0 for p in result['patterns'])
+
+    plot_path = Path(result['missing_pattern_plot'])
+    assert plot_path.exists()
+    assert plot_path.suffix == '.png'
+
+def test_chunked_matches_in_memory(df_patterns):
+    full = missing_pattern_analysis(df_patterns)
+    chunked = missing_pattern_analysis([df_patterns.iloc[i:i + 4] for i in range(0, 10, 4)])
+
+    assert 'missing_pattern_plot' not in full
+    assert chunked['patterns'] == full['patterns']
+    assert chunked['columns'] == full['columns']
+
+def test_wide_table_patterns():
+    # More than 64 columns exercises the multi-word hash path
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(200, 130)), columns=[f"c{i}" for i in range(130)])
+    df.iloc[:50, [0, 129]] = np.nan
+    df.iloc[50:60, 70] = np.nan
+
+    result = missing_pattern_analysis(df, top_k=3)
+    patterns = {tuple(p['missing_columns']): p['count'] for p in result['patterns']}
+    assert patterns == {(): 140, ('c0', 'c129'): 50, ('c70',): 10}
+
+def test_wide_patterns_differing_in_one_column_stay_apart():
+    rng = np.random.default_rng(0)
+    mask = rng.random((2_000, 200)) < 0.5
+    df = pd.DataFrame(np.where(mask, np.nan, 1.0), columns=[f"c{i}" for i in range(200)])
+    result = missing_pattern_analysis(df, max_patterns=5_000, top_k=5_000)
+
+    assert len(result['patterns']) == len({row.tobytes() for row in mask})
+    assert sum(p['count'] for p in result['patterns']) == len(df)
+
+def test_accumulator_merge(df_patterns):
+    left = MissingPatternAccumulator().update(df_patterns.iloc[:5])
+    right = MissingPatternAccumulator().update(df_patterns.iloc[5:])
+    merged = left.merge(right).result()
+
+    assert merged == MissingPatternAccumulator().update(df_patterns).result()
+
+def test_accumulator_rejects_missing_columns(df_patterns):
+    acc = MissingPatternAccumulator(columns=['a', 'b', 'c', 'd'])
+    with pytest.raises(KeyError):
+        acc.update(df_patterns)
+
+def test_accumulator_requires_dataframe():
+    with pytest.raises(TypeError):
+        MissingPatternAccumulator().update([1, 2, 3])
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+
+from analytics_eda.core import SpaceSavingCounter
+
+def test_exact_when_under_capacity():
+    counter = SpaceSavingCounter(capacity=10)
+    counter.update(['a', 'b', 'a', 'c', 'a', 'b'])
+
+    assert counter.total == 6
+    assert counter.floor == 0
+    assert counter.top() == [('a', 3, 0), ('b', 2, 0), ('c', 1, 0)]
+
+def test_weighted_update_with_mapping():
+    counter = SpaceSavingCounter(capacity=10)
+    counter.update({'x': 5, 'y': 2})
+    counter.update(['x', 'z'], [1, 4])
+
+    assert counter.estimate('x') == 6
+    assert counter.estimate('z') == 4
+    assert counter.estimate('missing') == 0
+    assert counter.total == 12
+
+def test_bounded_capacity_keeps_heavy_hitters():
+    rng = np.random.default_rng(0)
+    heavy = ['h1'] * 500 + ['h2'] * 300
+    tail = [f"t{i}" for i in rng.integers(0, 5_000, size=2_000)]
+    keys = np.array(heavy + tail, dtype=object)
+    rng.shuffle(keys)
+
+    counter = SpaceSavingCounter(capacity=50)
+    for chunk in np.array_split(keys, 20):
+        counter.update(chunk)
+
+    assert len(counter) <= 50
+    assert counter.total == len(keys)
+    top = counter.top(2)
+    assert [k for k, _, _ in top] == ['h1', 'h2']
+    # Guarantees: count - error <= true <= count
+    for key, count, error in top:
+        true = int((keys == key).sum())
+        assert count - error <= true <= count
+
+def test_merge_matches_single_counter():
+    a = SpaceSavingCounter(capacity=10).update(['a'] * 5 + ['b'] * 2)
+    b = SpaceSavingCounter(capacity=10).update(['a'] * 1 + ['c'] * 3)
+    a.merge(b)
+
+    assert a.total == 11
+    assert a.top() == [('a', 6, 0), ('c', 3, 0), ('b', 2, 0)]
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        SpaceSavingCounter(capacity=0)
+
+def test_mismatched_lengths():
+    with pytest.raises(ValueError):
+        SpaceSavingCounter().update(['a', 'b'], [1])
@@ -0,0 +1,64 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.categorical.univariate_categorical_analysis import univariate_categorical_analysis
+from analytics_eda.univariate.categorical.streaming_univariate_categorical_analysis import streaming_univariate_categorical_analysis, iter_parquet_column
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(1)
+    values = rng.choice(['red', 'green', 'blue', 'teal', None], size=500, p=[0.5, 0.3, 0.15, 0.04, 0.01])
+    return pd.Series(values, dtype=object, name='color')
+
+def load_eda(path):
+    with open(path) as f:
+        return json.load(f)['eda']
+
+def test_chunked_report_matches_in_memory(series, tmp_path):
+    expected = load_eda(univariate_categorical_analysis(series, report_root=str(tmp_path / "full"), rare_threshold=0.05))
+    chunks = (series.iloc[i:i + 100] for i in range(0, len(series), 100))
+    result = load_eda(streaming_univariate_categorical_analysis(chunks, report_root=str(tmp_path / "stream"), rare_threshold=0.05))
+
+    for key in ('total', 'missing', 'pct_missing'):
+        assert result['missing_data'][key] == expected['missing_data'][key]
+    assert result['distribution']['statistics'] == expected['distribution']['statistics']
+    assert result['distribution']['frequency_report']['frequency_table'] == expected['distribution']['frequency_report']['frequency_table']
+    assert sorted(result['outliers']['rare_categories']) == sorted(expected['outliers']['rare_categories'])
+    assert result['inferential']['goodness_of_fit'] == pytest.approx(expected['inferential']['goodness_of_fit'])
+
+def test_parquet_dataset_column(series, tmp_path):
+    pytest.importorskip("pyarrow")
+    dataset_dir = tmp_path / "dataset"
+    dataset_dir.mkdir()
+    for i in range(0, len(series), 250):
+        series.iloc[i:i + 250].to_frame().to_parquet(dataset_dir / f"part-{i}.parquet")
+
+    report_path = streaming_univariate_categorical_analysis(dataset_dir, column='color', report_root=str(tmp_path / "pq"), batch_size=64)
+    result = load_eda(report_path)
+
+    assert report_path.name == "color_univariate_analysis_report.json"
+    assert result['missing_data']['total'] == len(series)
+    assert result['distribution']['statistics']['cardinality'] == series.nunique()
+
+def test_parquet_requires_column(tmp_path):
+    with pytest.raises(ValueError):
+        streaming_univariate_categorical_analysis(tmp_path / "data.parquet")
+
+def test_requires_name(tmp_path):
+    with pytest.raises(ValueError):
+        streaming_univariate_categorical_analysis([pd.Series(['a', 'b'], dtype=object)], report_root=str(tmp_path))
+
+def test_parquet_dictionary_column_matches_in_memory(tmp_path):
+    pytest.importorskip("pyarrow")
+    series = pd.Series(['a', 'b', 'a', 'c', 'a', 'b'] * 50, dtype='category', name='grade')
+    path = tmp_path / "grades.parquet"
+    series.to_frame().to_parquet(path)
+
+    chunks = list(iter_parquet_column(path, 'grade', batch_size=100))
+    assert isinstance(chunks[0].dtype, pd.ArrowDtype)
+
+    report_path = streaming_univariate_categorical_analysis(path, column='grade', report_root=str(tmp_path / "pq"), batch_size=100)
+    table = load_eda(report_path)['distribution']['frequency_report']['frequency_table']
+    assert {k: v['count'] for k, v in table.items()} == {'a': 150, 'b': 100, 'c': 50}
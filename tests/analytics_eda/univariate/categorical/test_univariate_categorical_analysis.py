@@ -127,3 +127,27 @@ def test_error_on_unnamed_series(tmp_report_root):
             series=s,
             report_root=str(tmp_report_root)
         )
+
+def test_table_top_k_keeps_rare_categories_and_test(simple_series, tmp_report_root):
+    full = load_json(univariate_categorical_analysis(simple_series, report_root=str(tmp_report_root / "full"), rare_threshold=0.2))
+    bounded = load_json(univariate_categorical_analysis(simple_series, report_root=str(tmp_report_root / "top"), rare_threshold=0.2, table_top_k=2))
+
+    assert len(bounded['eda']['distribution']['frequency_report']['frequency_table']) == 2
+    assert bounded['eda']['outliers'] == full['eda']['outliers']
+    assert bounded['eda']['inferential'] == full['eda']['inferential']
+
+def test_bounded_frequency_mode(tmp_report_root):
+    series = pd.Series(['a'] * 60 + ['b'] * 39 + ['c'], dtype=object, name='bounded_col')
+    report = load_json(univariate_categorical_analysis(
+        series,
+        report_root=str(tmp_report_root),
+        rare_threshold=0.05,
+        frequency_mode='bounded',
+        sketch_capacity=10
+    ))
+
+    eda = report['eda']
+    assert eda['outliers']['rare_categories'] == ['c']
+    assert eda['outliers']['rare_summary']['estimated_count'] == 1
+    assert 'error' in eda['inferential']['goodness_of_fit']
+    assert eda['distribution']['statistics']['cardinality'] == 3
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from statsmodels.tsa.stattools import acf, pacf
+
+from analytics_eda.univariate.timeseries.autocorrelation_analysis import autocorrelation_analysis, acf_fft, pacf_levinson_durbin
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(0)
+    noise = rng.normal(size=600)
+    # AR(2) process
+    x = np.zeros_like(noise)
+    for t in range(2, len(x)):
+        x[t] = 0.6 * x[t - 1] - 0.3 * x[t - 2] + noise[t]
+    return x
+
+def test_matches_statsmodels(values):
+    result = autocorrelation_analysis(values, nlags=30, alpha=0.05)
+    expected_acf, acf_ci = acf(values, nlags=30, fft=True, alpha=0.05, result_object=False)
+    expected_pacf, pacf_ci = pacf(values, nlags=30, method='ywm', alpha=0.05)
+
+    assert result['lags'] == list(range(31))
+    np.testing.assert_allclose(result['acf'], expected_acf, atol=1e-12)
+    np.testing.assert_allclose(result['pacf'], expected_pacf, atol=1e-10)
+    np.testing.assert_allclose(result['acf_band'], acf_ci[:, 1] - expected_acf, atol=1e-12)
+    np.testing.assert_allclose(result['pacf_band'], pacf_ci[:, 1] - expected_pacf, atol=1e-12)
+
+def test_default_lags_and_helpers(values):
+    result = autocorrelation_analysis(values[:50])
+    assert result['nlags'] == 25
+    assert result['n_obs'] == 50
+
+    r = acf_fft(values, 5)
+    assert r[0] == pytest.approx(1.0)
+    assert pacf_levinson_durbin(r, 5)[1] == pytest.approx(r[1])
+
+def test_too_short_raises():
+    with pytest.raises(ValueError):
+        autocorrelation_analysis(np.array([1.0]))
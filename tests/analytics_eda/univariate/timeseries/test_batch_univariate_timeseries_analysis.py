@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.timeseries.batch_univariate_timeseries_analysis import batch_univariate_timeseries_analysis
+
+@pytest.fixture
+def long_df():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-01", periods=24, freq="ME")
+    frames = [
+        pd.DataFrame({'sensor': sensor, 'ts': dates, 'value': rng.normal(size=24)})
+        for sensor in ('s1', 's2', 's3')
+    ]
+    # Shuffle rows so series are interleaved and out of time order
+    return pd.concat(frames).sample(frac=1, random_state=0).reset_index(drop=True)
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_writes_one_combined_report(long_df, tmp_path, n_jobs):
+    report_path = batch_univariate_timeseries_analysis(
+        long_df, 'sensor', 'ts', 'value', report_root=str(tmp_path), rolling_window=3, n_jobs=n_jobs, plot=True
+    )
+
+    assert report_path == tmp_path / "sensor_ts_value" / "sensor_ts_value_batch_univariate_analysis_report.json"
+    eda = load_report(report_path)['eda']
+    assert eda['n_series'] == 3
+    for sensor in ('s1', 's2', 's3'):
+        entry = eda['series'][sensor]
+        assert entry['n_obs'] == 24
+        assert entry['start'] == "2020-01-31T00:00:00"
+        assert set(entry['visuals']) == {'raw_line_plot', 'rolling_statistics', 'acf', 'pacf', 'stl_decomposition'}
+        assert Path(entry['visuals']['acf']).parent.name == f"sensor_{sensor}"
+
+def test_failed_series_is_recorded(long_df, tmp_path):
+    short = pd.DataFrame({'sensor': ['tiny'], 'ts': pd.to_datetime(['2020-01-01']), 'value': [1.0]})
+    df = pd.concat([long_df, short], ignore_index=True)
+
+    eda = load_report(batch_univariate_timeseries_analysis(df, 'sensor', 'ts', 'value', report_root=str(tmp_path), rolling_window=3))['eda']
+
+    assert 'error' in eda['series']['tiny']
+    assert 'seasonality' in eda['series']['s1']
+
+def test_numeric_only_by_default(long_df, tmp_path):
+    report_path = batch_univariate_timeseries_analysis(long_df, 'sensor', 'ts', 'value', report_root=str(tmp_path))
+    entry = load_report(report_path)['eda']['series']['s1']
+
+    assert 'visuals' not in entry
+    assert entry['autocorrelation']['acf'][0] == 1.0
+    assert set(entry['rolling']) == {'mean', 'median', 'std', 'q25', 'q75'}
+    s1 = long_df[long_df['sensor'] == 's1'].sort_values('ts')['value']
+    assert entry['rolling']['mean']['last'] == pytest.approx(s1.iloc[-12:].mean())
+    assert list(report_path.parent.iterdir()) == [report_path]
+
+def test_series_ids_are_sanitized_for_plot_folders(long_df, tmp_path):
+    long_df['sensor'] = long_df['sensor'].map({'s1': '../escape', 's2': 'a/b', 's3': 'a b'})
+    report_path = batch_univariate_timeseries_analysis(
+        long_df, 'sensor', 'ts', 'value', report_root=str(tmp_path), rolling_window=3, plot=True
+    )
+    series = load_report(report_path)['eda']['series']
+
+    folders = {key: Path(entry['visuals']['acf']).parent for key, entry in series.items()}
+    assert all(folder.parent == report_path.parent for folder in folders.values())
+    assert folders['../escape'].name == 'sensor__escape'
+    assert {folders['a b'].name, folders['a/b'].name} == {'sensor_a_b', 'sensor_a_b_2'}
+
+def test_colliding_series_ids_raise(long_df, tmp_path):
+    long_df['sensor'] = long_df['sensor'].map({'s1': 1, 's2': '1', 's3': 2})
+    with pytest.raises(ValueError, match="same string form"):
+        batch_univariate_timeseries_analysis(long_df, 'sensor', 'ts', 'value', report_root=str(tmp_path))
+
+def test_non_datetime_time_col_raises(long_df, tmp_path):
+    long_df['ts'] = long_df['ts'].astype(str)
+    with pytest.raises(TypeError):
+        batch_univariate_timeseries_analysis(long_df, 'sensor', 'ts', 'value', report_root=str(tmp_path))
@@ -0,0 +1,25 @@
+import numpy as np
+
+from analytics_eda.univariate.timeseries.detect_change_points import detect_change_points
+
+def test_finds_mean_shifts():
+    rng = np.random.default_rng(0)
+    x = np.concatenate([rng.normal(0, 1, 300), rng.normal(3, 1, 200), rng.normal(-1, 1, 500)])
+    result = detect_change_points(x)
+
+    assert result['n_change_points'] == 2
+    assert abs(result['change_points'][0] - 300) <= 3
+    assert abs(result['change_points'][1] - 500) <= 3
+    assert len(result['segment_means']) == 3
+
+def test_no_change_in_noise_and_limits():
+    rng = np.random.default_rng(1)
+    assert detect_change_points(rng.normal(size=1000))['change_points'] == []
+
+    steps = np.repeat(np.arange(20.0), 50)
+    result = detect_change_points(steps, max_change_points=3)
+    assert result['n_change_points'] == 3
+
+def test_min_segment_size():
+    x = np.concatenate([np.zeros(100), [10.0] * 3, np.zeros(100)])
+    assert detect_change_points(x, min_segment_size=10)['change_points'] == []
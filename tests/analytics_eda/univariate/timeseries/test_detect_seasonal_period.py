@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from analytics_eda.univariate.timeseries.detect_seasonal_period import detect_seasonal_period
+
+@pytest.fixture
+def seasonal():
+    rng = np.random.default_rng(0)
+    t = np.arange(2400)
+    return 0.01 * t + np.sin(2 * np.pi * t / 24) + 0.3 * rng.normal(size=len(t))
+
+@pytest.mark.parametrize("method", ["periodogram", "acf"])
+def test_detects_period(seasonal, method):
+    result = detect_seasonal_period(seasonal, method=method)
+    assert result['method'] == method
+    assert result['period'] == 24
+
+@pytest.mark.parametrize("method", ["periodogram", "acf"])
+def test_white_noise_has_no_period(method):
+    noise = np.random.default_rng(1).normal(size=1000)
+    result = detect_seasonal_period(noise, method=method)
+    assert result['period'] is None
+    if method == 'periodogram':
+        assert result['p_value'] > 0.05
+
+@pytest.mark.parametrize("method", ["periodogram", "acf"])
+def test_random_walk_and_ar1_have_no_period(method):
+    rng = np.random.default_rng(7)
+    walk = np.cumsum(rng.normal(size=5000))
+    ar1 = np.zeros(5000)
+    shocks = rng.normal(size=5000)
+    for t in range(1, 5000):
+        ar1[t] = 0.9 * ar1[t - 1] + shocks[t]
+
+    assert detect_seasonal_period(walk, method=method)['period'] is None
+    assert detect_seasonal_period(ar1, method=method)['period'] is None
+
+def test_acf_finds_fundamental_of_noisy_period():
+    rng = np.random.default_rng(4)
+    t = np.arange(2000)
+    values = np.sin(2 * np.pi * t / 24) + rng.normal(size=len(t))
+    assert detect_seasonal_period(values, method='acf')['period'] == 24
+
+def test_max_period_and_short_series(seasonal):
+    assert detect_seasonal_period(seasonal, max_period=10)['period'] != 24
+    assert detect_seasonal_period(np.arange(3.0))['period'] is None
+
+def test_invalid_method(seasonal):
+    with pytest.raises(ValueError):
+        detect_seasonal_period(seasonal, method='wavelet')
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.timeseries.downsample_for_plot import downsample_for_plot
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2024-01-01", periods=100_000, freq="s")
+    values = rng.normal(size=len(index))
+    values[12_345] = 50.0
+    values[67_890] = -50.0
+    return index, values
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_keeps_extremes_and_bounds_points(data, method):
+    index, values = data
+    rows = downsample_for_plot(index, values, max_points=1_000, method=method)
+
+    assert len(rows) <= 1_002
+    assert np.all(np.diff(rows) > 0)
+    assert {0, len(values) - 1, 12_345, 67_890} <= set(rows.tolist())
+
+def test_minmax_keeps_each_bucket_extreme(data):
+    index, values = data
+    rows = downsample_for_plot(index, values, max_points=200)
+    # 100 equal-width buckets of 1000 seconds each
+    buckets = values.reshape(100, 1000)
+    assert set(values[rows]) >= set(buckets.max(axis=1)) | set(buckets.min(axis=1))
+
+def test_short_series_and_multiple_columns(data):
+    index, values = data
+    assert np.array_equal(downsample_for_plot(index[:10], values[:10]), np.arange(10))
+
+    columns = np.column_stack([values, -values])
+    rows = downsample_for_plot(index, columns, max_points=500)
+    assert len(rows) <= 2 * 502
+
+def test_invalid_method(data):
+    with pytest.raises(ValueError):
+        downsample_for_plot(*data, method='random')
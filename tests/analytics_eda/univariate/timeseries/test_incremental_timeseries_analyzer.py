@@ -0,0 +1,80 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.timeseries.incremental_timeseries_analyzer import IncrementalTimeSeriesAnalyzer, incremental_univariate_timeseries_analysis
+from analytics_eda.univariate.timeseries.autocorrelation_analysis import autocorrelation_analysis
+from analytics_eda.univariate.timeseries.rolling_statistics import rolling_statistics
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    values = 100 + np.sin(2 * np.pi * np.arange(n) / 60) + 0.3 * rng.normal(size=n)
+    return pd.DataFrame({'ts': pd.date_range("2024-01-01", periods=n, freq="min"), 'value': values})
+
+def test_incremental_state_matches_full_history(df):
+    analyzer = IncrementalTimeSeriesAnalyzer('value', 'ts', rolling_window='15min', max_points=300, plot_max_points=400)
+    for start in range(0, len(df), 170):
+        analyzer.update(df.iloc[start:start + 170])
+
+    values = df['value'].to_numpy()
+    expected = autocorrelation_analysis(values, nlags=40)
+    result = analyzer.autocorrelation()
+    np.testing.assert_allclose(result['acf'], expected['acf'], atol=1e-10)
+    np.testing.assert_allclose(result['pacf'], expected['pacf'], atol=1e-10)
+
+    summary = analyzer.summary()
+    assert summary['n_obs'] == len(df)
+    assert summary['mean'] == pytest.approx(values.mean())
+    assert summary['std'] == pytest.approx(values.std(ddof=1))
+    assert summary['max'] == values.max()
+
+    rolling = rolling_statistics(df.set_index('ts')['value'], '15min')
+    plotted = analyzer.plot_rolling
+    np.testing.assert_allclose(plotted['median'], rolling['median'].loc[plotted.index])
+
+    assert analyzer.block_counts.sum() == len(df)
+    assert len(analyzer.block_sums) <= 300
+    assert np.all(analyzer.block_counts[:-1] == analyzer.block_size)
+
+def test_batches_with_mixed_time_units(df):
+    reference = IncrementalTimeSeriesAnalyzer('value', 'ts', rolling_window='15min')
+    analyzer = IncrementalTimeSeriesAnalyzer('value', 'ts', rolling_window='15min')
+    for start, unit in zip(range(0, len(df), 500), ['s', 'us', 'ms', 'ns']):
+        batch = df.iloc[start:start + 500]
+        reference.update(batch)
+        analyzer.update(batch.assign(ts=batch['ts'].dt.as_unit(unit)))
+
+    assert analyzer.last_time == reference.last_time
+    assert analyzer.n_late == 0
+    np.testing.assert_array_equal(analyzer.block_starts, reference.block_starts)
+    pd.testing.assert_frame_equal(analyzer.plot_rolling, reference.plot_rolling)
+    assert analyzer.block_series().index[0] == df['ts'].iloc[0]
+
+def test_persisted_updates_and_late_rows(df, tmp_path):
+    first = incremental_univariate_timeseries_analysis(df.iloc[:1_500], 'value', 'ts', report_root=str(tmp_path), rolling_window=10)
+    late = df.iloc[1_400:1_410]
+    report_path = incremental_univariate_timeseries_analysis(pd.concat([late, df.iloc[1_500:]]), 'value', 'ts', report_root=str(tmp_path))
+
+    assert report_path == first
+    with open(report_path) as f:
+        eda = json.load(f)['eda']
+
+    assert eda['summary']['n_obs'] == len(df)
+    assert eda['incremental']['n_updates'] == 2
+    assert eda['incremental']['n_late_rows_dropped'] == 10
+    assert eda['time_index']['n_out_of_order'] == 1
+    assert abs(eda['seasonality']['period'] - 60) <= 1
+    assert set(eda['visuals']) == {'raw_line_plot', 'rolling_statistics', 'acf', 'pacf', 'stl_decomposition'}
+
+    state = IncrementalTimeSeriesAnalyzer.load(tmp_path / "ts_value" / "incremental_state.pkl")
+    assert state.rolling_window == 10
+
+def test_invalid_input(df):
+    analyzer = IncrementalTimeSeriesAnalyzer('value', 'ts')
+    with pytest.raises(ValueError):
+        analyzer.write_report()
+    with pytest.raises(TypeError):
+        analyzer.update(df.assign(ts=df['ts'].astype(str)))
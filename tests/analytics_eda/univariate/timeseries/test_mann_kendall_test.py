@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from analytics_eda.univariate.timeseries.mann_kendall_test import mann_kendall_test
+
+def naive_s(x):
+    n = len(x)
+    return sum(np.sign(x[j] - x[i]) for i in range(n) for j in range(i + 1, n))
+
+def test_s_matches_pairwise_definition_with_ties():
+    rng = np.random.default_rng(1)
+    x = rng.integers(0, 20, 200).astype(float) + np.arange(200) * 0.02
+    x[::7] = 5.0
+    result = mann_kendall_test(x)
+    assert result['s'] == naive_s(x)
+
+def test_detects_trends():
+    rng = np.random.default_rng(0)
+    t = np.arange(300)
+    assert mann_kendall_test(0.01 * t + rng.normal(size=300))['trend'] == 'increasing'
+    assert mann_kendall_test(-0.01 * t + rng.normal(size=300))['trend'] == 'decreasing'
+    assert mann_kendall_test(rng.normal(size=300))['reject'] is False
+
+def test_constant_and_short_series():
+    assert mann_kendall_test(np.ones(10))['trend'] == 'no trend'
+    with pytest.raises(ValueError):
+        mann_kendall_test(np.array([1.0, 2.0]))
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.timeseries.prepare_time_series import prepare_time_series
+
+@pytest.fixture
+def df():
+    dates = pd.date_range("2021-01-01", periods=6, freq="D")
+    return pd.DataFrame({
+        'date': dates[[3, 0, 5, 1, 4, 2]],
+        'value': [3.0, 0.0, np.nan, 1.0, 4.0, 2.0],
+        'other': list('abcdef'),
+    })
+
+def test_projects_drops_and_sorts(df):
+    original = df.copy()
+    series = prepare_time_series(df, 'value', 'date')
+
+    assert series.name == 'value'
+    assert series.index.name == 'date'
+    assert series.index.is_monotonic_increasing
+    assert series.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    pd.testing.assert_frame_equal(df, original)
+
+def test_already_indexed_and_sorted_input_is_used_as_is():
+    dates = pd.date_range("2021-01-01", periods=5, freq="D", name='date')
+    frame = pd.DataFrame({'value': np.arange(5.0)}, index=dates)
+    series = prepare_time_series(frame, 'value', 'date')
+
+    assert series.index.equals(dates)
+    assert np.shares_memory(series.to_numpy(), frame['value'].to_numpy())
+
+def test_missing_times_are_dropped():
+    df = pd.DataFrame({'date': pd.to_datetime(['2021-01-02', None, '2021-01-01']), 'value': [2, 9, 1]})
+    assert prepare_time_series(df, 'value', 'date').tolist() == [1, 2]
+
+def test_non_datetime_time_col_raises(df):
+    df['date'] = df['date'].astype(str)
+    with pytest.raises(TypeError, match="'date' must be datetime64 dtype"):
+        prepare_time_series(df, 'value', 'date')
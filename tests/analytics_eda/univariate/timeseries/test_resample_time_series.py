@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.timeseries.resample_time_series import resample_time_series
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    offsets = np.sort(rng.integers(0, 6 * 3600 * 10**9, size=5_000))
+    # Leave an empty hour in the middle
+    offsets = offsets[(offsets < 2 * 3600 * 10**9) | (offsets >= 3 * 3600 * 10**9)]
+    index = pd.DatetimeIndex(pd.Timestamp("2024-03-10 00:13", tz="US/Eastern").value + offsets, tz="UTC").tz_convert("US/Eastern")
+    return pd.Series(rng.normal(size=len(index)), index=index, name='value')
+
+@pytest.mark.parametrize("freq", ["7min", "1h"])
+def test_matches_pandas_resample(series, freq):
+    result, n_empty = resample_time_series(series, freq)
+    expected = series.resample(freq).agg(['mean', 'min', 'max', 'count', 'last'])
+
+    # Empty buckets are kept, so the result is evenly spaced
+    assert n_empty == int((expected['count'] == 0).sum())
+    pd.testing.assert_index_equal(result.index, expected.index, check_names=False)
+    np.testing.assert_allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+    assert (result.loc[result['count'] == 0, 'mean'].isna()).all()
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us"])
+def test_non_nanosecond_index(unit):
+    index = pd.date_range("2024-01-01 08:00", periods=600, freq="s").as_unit(unit)
+    series = pd.Series(np.arange(600.0), index=index)
+    result, n_empty = resample_time_series(series, '1min')
+    expected = series.resample('1min').agg(['mean', 'min', 'max', 'count', 'last'])
+
+    assert n_empty == 0
+    assert len(result) == 10
+    pd.testing.assert_index_equal(result.index, expected.index, check_names=False)
+    np.testing.assert_allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+def test_calendar_frequency_and_subset(series):
+    result, n_empty = resample_time_series(series, 'D', aggregates=('count',))
+    assert list(result.columns) == ['count']
+    assert result['count'].sum() == len(series)
+
+    monthly, _ = resample_time_series(series, 'ME', aggregates=('max',))
+    assert monthly['max'].iloc[0] == series.max()
+
+def test_anchored_weeks_follow_the_anchor_day():
+    index = pd.date_range("2024-01-01", periods=60, freq="D")
+    series = pd.Series(np.arange(60.0), index=index)
+    result, _ = resample_time_series(series, 'W')
+    expected = series.resample('W').agg(['mean', 'min', 'max', 'count', 'last'])
+
+    assert (result.index.dayofweek == 6).all()
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+def test_invalid_arguments(series):
+    with pytest.raises(ValueError):
+        resample_time_series(series, '1h', aggregates=('median',))
+    with pytest.raises(TypeError):
+        resample_time_series(series.reset_index(drop=True), '1h')
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.timeseries.rolling_statistics import rolling_statistics
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    # Irregular timestamps so time-based windows hold a varying number of rows
+    times = pd.to_datetime("2021-01-01") + pd.to_timedelta(np.cumsum(rng.integers(1, 48, size=500)), unit='h')
+    return pd.Series(rng.normal(size=500).round(1), index=times, name='value')
+
+def expected(series, window, min_periods=1):
+    rolling = series.rolling(window, min_periods=min_periods)
+    return pd.DataFrame({
+        'mean': rolling.mean(),
+        'median': rolling.median(),
+        'std': rolling.std(),
+        'q25': rolling.quantile(0.25),
+        'q75': rolling.quantile(0.75),
+    })
+
+@pytest.mark.parametrize("window", [1, 5, 40, '7D'])
+def test_matches_pandas_rolling(series, window):
+    result = rolling_statistics(series, window)
+    pd.testing.assert_frame_equal(result, expected(series, window), check_exact=False, atol=1e-9)
+
+@pytest.mark.parametrize("unit", ["s", "us"])
+def test_time_window_on_non_nanosecond_index(series, unit):
+    series = series.set_axis(series.index.as_unit(unit))
+    result = rolling_statistics(series, '7D')
+    pd.testing.assert_frame_equal(result, expected(series, '7D'), check_exact=False, atol=1e-9)
+
+def test_min_periods(series):
+    result = rolling_statistics(series, 10, min_periods=10)
+    assert result.iloc[:9].isna().all().all()
+    pd.testing.assert_frame_equal(result, expected(series, 10, min_periods=10), check_exact=False, atol=1e-9)
+
+def test_approximate_quantiles_are_close(series):
+    exact = rolling_statistics(series, 200)
+    approx = rolling_statistics(series, 200, approximate=True, n_samples=50)
+
+    pd.testing.assert_series_equal(approx['mean'], exact['mean'])
+    assert (approx['median'] - exact['median']).iloc[200:].abs().max() < 0.5
+
+def test_invalid_windows(series):
+    with pytest.raises(ValueError):
+        rolling_statistics(series, 0)
+    with pytest.raises(TypeError):
+        rolling_statistics(series.reset_index(drop=True), '7D')
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from analytics_eda.univariate.timeseries.seasonal_decomposition import seasonal_decomposition
+
+def make_series(n, freq, period):
+    rng = np.random.default_rng(0)
+    t = np.arange(n)
+    index = pd.date_range("2024-01-01", periods=n, freq=freq)
+    return pd.Series(np.sin(2 * np.pi * t / period) + 0.2 * rng.normal(size=n), index=index, name='value')
+
+def test_high_frequency_series_is_resampled_before_stl():
+    series = make_series(20_000, 's', 600)
+    report, result = seasonal_decomposition(series, resolution='1min')
+
+    assert report['n_obs_raw'] == 20_000
+    assert report['n_obs_used'] == 334
+    assert report['period'] == 10
+    assert report['period_source'] == 'detected'
+    assert report['period_span'] == str(pd.Timedelta('10min'))
+    assert len(result.trend) == 334
+
+def test_period_span_on_non_nanosecond_index():
+    series = make_series(2_000, 'min', 60)
+    report, _ = seasonal_decomposition(series.set_axis(series.index.as_unit('s')))
+    assert report['period_span'] == str(pd.Timedelta(minutes=report['period']))
+
+def test_long_series_is_block_averaged():
+    series = make_series(50_000, 's', 1000)
+    report, result = seasonal_decomposition(series, max_points=5_000)
+
+    assert report['block_size'] == 10
+    assert report['n_obs_used'] == 5_000
+    assert report['period'] == 100
+    assert result.seasonal.index[1] - result.seasonal.index[0] == pd.Timedelta('10s')
+
+def test_calendar_fallback_and_no_period():
+    trend = pd.Series(np.arange(24.0), index=pd.date_range("2020-01-31", periods=24, freq="ME"))
+    report, result = seasonal_decomposition(trend)
+    assert report['period_source'] == 'calendar'
+    assert result is not None
+
+    noise = pd.Series(np.random.default_rng(2).normal(size=300), index=pd.date_range("2020", periods=300, freq="min"))
+    report, result = seasonal_decomposition(noise)
+    assert report['period'] is None
+    assert result is None
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_eda.univariate.timeseries.time_index_profiler import TimeIndexProfiler, profile_time_index
+
+@pytest.fixture
+def times():
+    # Minute sampling with a duplicate, a 3-minute gap, a missing value and one row
+    # out of order (which also duplicates 00:05)
+    stamps = pd.date_range("2024-01-01", periods=30, freq="min")
+    values = list(stamps[:10]) + [stamps[9]] + list(stamps[12:20]) + [stamps[5]] + list(stamps[20:])
+    series = pd.Series(values)
+    series[2] = pd.NaT
+    return series
+
+def test_profile(times):
+    profile = profile_time_index(times, top_k=3)
+
+    assert profile['n_obs'] == 30
+    assert profile['n_missing'] == 1
+    assert profile['n_duplicate_timestamps'] == 2
+    assert profile['n_out_of_order'] == 1
+    assert profile['is_monotonic_increasing'] is False
+    assert profile['is_unique'] is False
+    assert profile['delta_seconds']['median'] == 60.0
+    assert profile['start'] == "2024-01-01 00:00:00"
+    assert profile['end'] == "2024-01-01 00:29:00"
+    assert profile['gap_threshold_seconds'] == 120.0
+    # Gaps come from the sorted timestamps: only 00:09 -> 00:12; 00:01 -> 00:03
+    # (missing row) is not above the threshold
+    assert [gap['duration_seconds'] for gap in profile['largest_gaps']] == [180.0]
+    assert profile['largest_gaps'][0]['start'] == "2024-01-01 00:09:00"
+    assert sum(profile['delta_histogram']['counts']) == 26
+
+def test_shuffled_input_with_duplicates():
+    stamps = pd.date_range("2024-01-01", periods=1_000, freq="min")
+    values = pd.Series(stamps.append(stamps[::20])).sample(frac=1, random_state=0)
+    profile = profile_time_index(values)
+
+    assert profile['n_duplicate_timestamps'] == 50
+    assert profile['n_out_of_order'] > 0
+    assert profile['is_monotonic_increasing'] is False
+    assert profile['is_unique'] is False
+    assert profile['delta_seconds']['median'] == 60.0
+    assert profile['delta_seconds']['max'] == 60.0
+    assert profile['largest_gaps'] == []
+
+    sorted_unique = profile_time_index(pd.Series(stamps))
+    assert sorted_unique['is_unique'] is True and sorted_unique['is_monotonic_increasing'] is True
+
+def test_chunks_and_merge_match_single_pass():
+    # Chunks cover consecutive time ranges but are shuffled within themselves
+    stamps = pd.date_range("2024-01-01", periods=35, freq="min")
+    stamps = stamps.delete([12, 13, 25]).append(stamps[[4, 30]]).sort_values()
+    rng = np.random.default_rng(0)
+    times = pd.Series(np.concatenate([rng.permutation(stamps[i:i + 7]) for i in range(0, len(stamps), 7)]))
+    times[2] = pd.NaT
+    expected = profile_time_index(times, gap_threshold='90s')
+
+    chunked = profile_time_index((times[i:i + 7] for i in range(0, len(times), 7)), gap_threshold='90s')
+
+    left = TimeIndexProfiler(gap_threshold='90s').update(times[:14])
+    right = TimeIndexProfiler(gap_threshold='90s').update(times[14:])
+    merged = left.merge(right).profile()
+
+    assert chunked == expected
+    assert merged == expected
+    assert expected['n_gaps'] == 3
+
+def test_parquet_dataset(tmp_path):
+    pytest.importorskip("pyarrow")
+    stamps = pd.date_range("2024-01-01", periods=100, freq="s", tz="UTC")
+    for i in range(0, 100, 50):
+        pd.DataFrame({'ts': stamps[i:i + 50]}).to_parquet(tmp_path / f"part-{i:03d}.parquet")
+
+    profile = profile_time_index(tmp_path, column='ts', batch_size=20)
+    assert profile['n_obs'] == 100
+    assert profile['is_unique'] is True
+    assert profile['end'] == str(stamps[-1])
+
+def test_invalid_input():
+    with pytest.raises(TypeError):
+        profile_time_index(pd.Series([1, 2, 3]))
+    with pytest.raises(ValueError):
+        profile_time_index("data.parquet")
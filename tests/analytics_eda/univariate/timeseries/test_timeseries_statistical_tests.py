@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from analytics_eda.univariate.timeseries.timeseries_statistical_tests import timeseries_statistical_tests
+
+def make_series(values):
+    return pd.Series(values, index=pd.date_range("2020-01-01", periods=len(values), freq="h"), name='value')
+
+def test_stationary_noise():
+    result = timeseries_statistical_tests(make_series(np.random.default_rng(0).normal(size=500)))
+
+    assert result['stationarity']['adf']['reject'] is True
+    assert result['stationarity']['is_stationary'] is True
+    assert result['trend']['mann_kendall']['trend'] == 'no trend'
+    assert result['change_points']['change_points'] == []
+
+def test_random_walk_with_shift():
+    rng = np.random.default_rng(1)
+    values = np.concatenate([np.zeros(400), np.full(400, 8.0)]) + rng.normal(size=800)
+    result = timeseries_statistical_tests(make_series(values), max_stationarity_points=200)
+
+    assert result['stationarity']['is_stationary'] is False
+    assert result['stationarity']['block_size'] == 4
+    assert result['trend']['mann_kendall']['trend'] == 'increasing'
+    assert result['change_points']['change_times'] == [str(pd.Timestamp("2020-01-01") + pd.Timedelta(hours=400))]
+
+def test_failing_test_is_captured():
+    result = timeseries_statistical_tests(make_series([1.0, 2.0]))
+    assert 'error' in result['trend']['mann_kendall']
+    assert 'error' in result['stationarity']['adf']
+    assert result['stationarity']['is_stationary'] is None
@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 import pandas as pd
 import json
 
@@ -51,3 +53,67 @@ def test_univariate_timeseries_analysis_creates_and_populates_report(tmp_path):
     visuals = report["eda"]["visuals"]
     assert isinstance(visuals, dict), f"'visuals' should be a dict, got {type(visuals)}"
     assert visuals, "Visuals dictionary is empty"
+
+    # 9. Assert autocorrelation values are reported
+    autocorrelation = report["eda"]["autocorrelation"]
+    assert autocorrelation["nlags"] == 6
+    assert len(autocorrelation["acf"]) == len(autocorrelation["pacf"]) == 7
+    assert autocorrelation["acf"][0] == 1.0
+
+    # 10. Assert statistical tests are reported
+    tests = report["eda"]["statistical_tests"]
+    assert set(tests) == {"stationarity", "trend", "change_points"}
+    assert tests["trend"]["mann_kendall"]["trend"] == "increasing"
+
+    # 11. Assert the time column profile is reported
+    assert report["eda"]["time_index"]["n_obs"] == 12
+    assert report["eda"]["time_index"]["is_monotonic_increasing"] is True
+
+def test_unsorted_input_with_extra_columns_is_not_modified(tmp_path):
+    dates = pd.date_range("2021-01-01", periods=12, freq="ME")
+    df = pd.DataFrame({"date": dates[::-1], "value": list(range(12)), "label": list("abcdefghijkl")})
+    original = df.copy()
+
+    report_path = univariate_timeseries_analysis(df, numeric_col="value", time_col="date", report_root=str(tmp_path), rolling_window=3)
+
+    assert report_path.exists()
+    pd.testing.assert_frame_equal(df, original)
+
+def test_resampled_analysis_records_raw_and_aggregated_counts(tmp_path):
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2021-01-01", periods=2_000, freq="15s")
+    df = pd.DataFrame({"date": dates, "value": rng.normal(size=len(dates))})
+
+    report_path = univariate_timeseries_analysis(df, numeric_col="value", time_col="date", report_root=str(tmp_path),
+                                                 rolling_window=5, resample_freq="1min", resample_agg="max")
+    with open(report_path) as f:
+        eda = json.load(f)["eda"]
+
+    assert eda["resampling"]["n_obs_raw"] == 2_000
+    assert eda["resampling"]["n_obs_aggregated"] == 500
+    assert eda["resampling"]["count_per_bucket"] == {"min": 4, "mean": 4.0, "max": 4}
+    assert eda["autocorrelation"]["n_obs"] == 500
+
+@pytest.mark.parametrize("fill, n_used", [("interpolate", 500), ("ffill", 500), ("drop", 450)])
+def test_empty_buckets_are_filled_before_downstream_stages(tmp_path, fill, n_used):
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2021-01-01", periods=2_000, freq="15s")
+    df = pd.DataFrame({"date": dates, "value": rng.normal(size=len(dates))})
+    df = df[(df.index < 800) | (df.index >= 1_000)]  # 50 empty minutes
+
+    report_path = univariate_timeseries_analysis(df, numeric_col="value", time_col="date", report_root=str(tmp_path),
+                                                 rolling_window=5, resample_freq="1min", resample_fill=fill)
+    with open(report_path) as f:
+        resampling = json.load(f)["eda"]["resampling"]
+
+    assert resampling["n_empty_buckets"] == 50
+    assert resampling["fill"] == fill
+    assert resampling["n_obs_aggregated"] == n_used
+    assert resampling["count_per_bucket"]["min"] == 0
+
+def test_invalid_resample_aggregate(tmp_path):
+    df = pd.DataFrame({"date": pd.date_range("2021-01-01", periods=5, freq="D"), "value": range(5)})
+    with pytest.raises(ValueError):
+        univariate_timeseries_analysis(df, numeric_col="value", time_col="date", report_root=str(tmp_path), resample_agg="median")
+    with pytest.raises(ValueError):
+        univariate_timeseries_analysis(df, numeric_col="value", time_col="date", report_root=str(tmp_path), resample_fill="zero")
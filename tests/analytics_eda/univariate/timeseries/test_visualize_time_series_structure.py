@@ -81,3 +81,17 @@ def test_non_datetime_time_col_raises_type_error(tmp_path):
     # Assert the exception message mentions the column name and dtype requirement
     msg = str(excinfo.value)
     assert "'date' must be datetime64 dtype" in msg
+
+def test_time_based_rolling_window(tmp_path):
+    dates = pd.date_range(start='2020-01-01', periods=60, freq='D')
+    series = pd.Series(range(60), index=dates, name='value', dtype=float)
+
+    visuals = visualize_time_series_structure(
+        series,
+        numeric_col='value',
+        time_col='date',
+        report_dir=tmp_path,
+        rolling_window='7D'
+    )
+
+    assert Path(visuals['rolling_statistics']).exists()